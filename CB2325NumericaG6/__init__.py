@@ -4,12 +4,15 @@ from .core import (
     Interval,
     RealFunction,
     linspace,
-    safe_intersect
+    safe_intersect,
+    fast_callable
 )
 
 # Polinômios
 from .polinomios import (
     Polinomio,
+    PolinomioBatch,
+    PolinomioCongelado,
     lambdify
 )
 
@@ -17,10 +20,22 @@ from .polinomios import (
 from .interpolacao import (
     HermiteInterpolation,
     PolinomialInterpolation,
+    NewtonInterpolation,
     PiecewiseLinearFunction,
+    StreamingLinearFunction,
+    MemmapLinearFunction,
+    CubicSpline,
+    PiecewiseCubicHermite,
+    GridInterpolation2D,
     hermite_interp,
     poly_interp,
-    linear_interp
+    newton_interp,
+    linear_interp,
+    stream_interp,
+    memmap_interp,
+    spline_interp,
+    pchip_interp,
+    grid_interp
 )
 
 # Aproximação e Ajuste
@@ -38,7 +53,12 @@ from .raizes import (
     plot_bisseccao,
     newton_raphson,
     plot_newton_raphson,
-    sturm
+    sturm,
+    sturm_particao,
+    isolar_raizes,
+    raizes_reais,
+    sturm_cache_info,
+    sturm_cache_clear
 )
 
 # Erros
@@ -64,18 +84,33 @@ __all__ = [
     'RealFunction',
     'linspace',
     'safe_intersect',
+    'fast_callable',
     
     # Polinômios
     'Polinomio',
+    'PolinomioBatch',
+    'PolinomioCongelado',
     'lambdify',
     
     # Interpolação
     'HermiteInterpolation',
     'PolinomialInterpolation',
+    'NewtonInterpolation',
     'PiecewiseLinearFunction',
+    'StreamingLinearFunction',
+    'MemmapLinearFunction',
+    'CubicSpline',
+    'PiecewiseCubicHermite',
+    'GridInterpolation2D',
     'hermite_interp',
     'poly_interp',
+    'newton_interp',
     'linear_interp',
+    'stream_interp',
+    'memmap_interp',
+    'spline_interp',
+    'pchip_interp',
+    'grid_interp',
     
     # Aproximação
     'ajuste_linear',
@@ -90,6 +125,11 @@ __all__ = [
     'newton_raphson',
     'plot_newton_raphson',
     'sturm',
+    'sturm_particao',
+    'isolar_raizes',
+    'raizes_reais',
+    'sturm_cache_info',
+    'sturm_cache_clear',
     
     # Erros
     'erro_absoluto',
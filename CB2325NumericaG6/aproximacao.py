@@ -2,12 +2,13 @@ import math
 import statistics
 from .core import Interval
 from .polinomios import Polinomio
-from typing import Optional, Sequence
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
+from typing import TYPE_CHECKING, Optional, Sequence
 import numpy as np
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.axes import Axes
+
 def ajuste_linear(x: Sequence, y: Sequence) -> Polinomio:
     """
     Ajusta y = a*x + b aos pontos (x, y) por mínimos quadrados (erro vertical).
@@ -70,7 +71,7 @@ def ajuste_polinomial(x: Sequence, y: Sequence, n = 2, precisao = 5) -> Polinomi
     Poly = Polinomio([round(Coeficientes[i],precisao) for i in range(len(Coeficientes))])
     return Poly
 
-def plot_ajuste(x: Sequence, y: Sequence, ajustes: dict[str, Polinomio], domain: Optional[Interval] = None,num_points: int = 100) -> tuple[Figure, Axes]:
+def plot_ajuste(x: Sequence, y: Sequence, ajustes: dict[str, Polinomio], domain: Optional[Interval] = None,num_points: int = 100) -> tuple['Figure', 'Axes']:
     """
     Plota os dados originais (x, y) e um ou mais polinômios de ajuste.
 
@@ -87,6 +88,8 @@ def plot_ajuste(x: Sequence, y: Sequence, ajustes: dict[str, Polinomio], domain:
     Returns:
         tuple[plt.Figure, plt.Axes]: Figura e eixos do gráfico plotado.
     """
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots()
 
     # 1. Plota os pontos de dados originais
@@ -112,8 +115,8 @@ def plot_ajuste(x: Sequence, y: Sequence, ajustes: dict[str, Polinomio], domain:
     
     # 4. Plota cada polinômio de ajuste
     for label, polinomio in ajustes.items():
-        # Assegura que o Polinomio é 'callable' (via RealFunction)
-        Y_plot = [polinomio(val) for val in X_plot]
+        # O Polinomio é 'callable' (via RealFunction) e avalia o array inteiro de uma vez
+        Y_plot = polinomio(X_plot)
         ax.plot(X_plot, Y_plot, label=label)
 
     # 5. Configurações do gráfico
@@ -126,6 +129,8 @@ def plot_ajuste(x: Sequence, y: Sequence, ajustes: dict[str, Polinomio], domain:
     return fig, ax
 
 if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
     x = [0, 1, 2, 3, 4]
     y = [1.1, 1.9, 3.0, 3.9, 5.2]
 
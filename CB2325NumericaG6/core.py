@@ -1,8 +1,12 @@
-from typing import Callable, Optional, Sequence
+from typing import TYPE_CHECKING, Callable, Optional, Sequence
 
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
+import numpy as np
+
+# O matplotlib só é importado quando algum gráfico é de fato gerado, para que
+# 'import CB2325NumericaG6' continue barato em processos que nunca plotam nada.
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.axes import Axes
 
 # Gostei muito da implementação dessas classes da lista 7 do professor então decidi implementar com pequenas modificações
 class Domain:
@@ -49,10 +53,12 @@ class Interval(Domain):
         return (self.max + self.min)/2.0
     
     def __contains__(self, other):
-        if isinstance(other, Interval):
-            return other.min >= self.min and other.max <= self.max
-        elif isinstance(other, (float, int)):
+        if isinstance(other, (float, int)):
             return self.min <= other <= self.max
+        elif isinstance(other, (np.ndarray, np.number)):
+            return bool(self.mask(other).all())
+        elif isinstance(other, Interval):
+            return other.min >= self.min and other.max <= self.max
         elif isinstance(other, Sequence):
             for i in other:
                 if not (self.min <= i <= self.max):
@@ -61,6 +67,17 @@ class Interval(Domain):
         else:
             return False
 
+    def mask(self, x) -> np.ndarray:
+        """
+        Retorna uma máscara booleana indicando quais valores de x pertencem ao intervalo,
+        calculada em uma única operação vetorizada.
+
+        Examples:
+            >>> Interval(0, 1).mask(np.array([-0.5, 0.5, 1.0]))
+            array([False,  True,  True])
+        """
+        x = np.asarray(x)
+        return (x >= self.min) & (x <= self.max)
 
     def __str__(self):
         return f'[{self.min:2.4f}, {self.max:2.4f}]' 
@@ -71,6 +88,14 @@ class Interval(Domain):
     def copy(self):
         return Interval(self.min, self.max)
 
+    def shift(self, a: float) -> 'Interval':
+        """Retorna o intervalo transladado [min + a, max + a]."""
+        return Interval(self.min + a, self.max + a)
+
+    def scale(self, s: float) -> 'Interval':
+        """Retorna o intervalo escalado {s * x : x no intervalo} (os extremos trocam se s < 0)."""
+        return Interval(self.min * s, self.max * s)
+
     def intersect(self, other: 'Interval') -> Optional['Interval']:
         if not isinstance(other, Interval):
             return None
@@ -82,8 +107,14 @@ class Interval(Domain):
 class RealFunction:
     """
     Classe abstrata que deve ser utilizada para implementação de funções reais, e.g. Polinomios
+
+    As subclasses devem aceitar tanto escalares quanto np.ndarray em f (e prime): para arrays,
+    a checagem de domínio é feita com uma única máscara vetorizada.
     """
 
+    # Vazio para que subclasses que definem __slots__ (e.g. Polinomio) não carreguem um __dict__
+    __slots__ = ()
+
     f: Callable[[float], float]
     prime: Optional[Callable[[float], float]]
     domain: Optional[Interval]
@@ -104,8 +135,23 @@ class RealFunction:
         
     def __call__(self, x) -> float:
         return self.eval_safe(x)
+
+    @property
+    def fast(self) -> Callable[[float], float]:
+        """
+        Avaliação "confiável": retorna um Callable que avalia a função sem checar o domínio e
+        sem passar por __call__/eval_safe. Deve ser usado apenas quando quem chama já garante
+        que os pontos são válidos (e.g. dentro de métodos de raízes e integração).
+
+        Examples:
+            >>> P = Polinomio([1.0, 0.0, -2.0], Interval(0, 2))
+            >>> f = P.fast
+            >>> f(3.0)  # fora do domínio, mas não levanta exceção
+            7.0
+        """
+        return self.f
     
-    def plot(self, intervalo: Optional[Interval] = None, pontos: int = 100) -> tuple[Figure, Axes]:
+    def plot(self, intervalo: Optional[Interval] = None, pontos: int = 100) -> tuple['Figure', 'Axes']:
         """
         Plota o gráfico da função real no intervalo especificado. Caso nenhum intervalo seja fornecido,
         será utilizado o domínio da função. Se o domínio da função também for None,uma exceção será 
@@ -122,14 +168,16 @@ class RealFunction:
             >>> plt.show()
         """
 
+        import matplotlib.pyplot as plt
+
         dominio = self.domain
         if intervalo is not None:
             dominio = intervalo
         if dominio is None:
             raise Exception("Domínio da função não está definido.")
         fig, ax = plt.subplots()
-        X = linspace(dominio.min, dominio.max, pontos)
-        Y = [self(val) for val in X]
+        X = np.linspace(dominio.min, dominio.max, pontos)
+        Y = self(X)
         ax.plot(X,Y)
         return fig, ax
     
@@ -155,6 +203,15 @@ def linspace(min: float, max: float, points: int) -> list[float]:
     step = (max - min) / (points - 1)
     return [(step * i + min) for i in range(points)]
 
+def fast_callable(f: Callable) -> Callable:
+    """
+    Retorna a versão sem checagem de domínio (RealFunction.fast) de f quando f é uma
+    RealFunction; qualquer outro Callable é devolvido sem alterações.
+    """
+    if isinstance(f, RealFunction):
+        return f.fast
+    return f
+
 def safe_intersect(d1: Optional['Interval'], d2: Optional['Interval']) -> Optional['Interval']:
     """
     Calcula a intersecção de dois intervalos, lidando com valores None.
@@ -1,9 +1,11 @@
-import matplotlib.pyplot as plt
 import numpy as np
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 from numpy import linspace
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
+from .core import fast_callable
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.axes import Axes
 # Falta implementar o linspace de core.py
 
 def integral_trapezio(f:Callable, start: float, end: float, divisions: int) -> float:
@@ -23,6 +25,7 @@ def integral_trapezio(f:Callable, start: float, end: float, divisions: int) -> f
         2.0
     """
     
+    f = fast_callable(f)
     sumVal: float = 0
     Xincrement: float = abs(start-end)/divisions
     
@@ -36,10 +39,12 @@ def integral_trapezio(f:Callable, start: float, end: float, divisions: int) -> f
     
     return sumVal
 
-def plot_integral_trapezio(f: Callable, start: float, end: float, divisions: int) -> tuple[Figure, Axes]:
+def plot_integral_trapezio(f: Callable, start: float, end: float, divisions: int) -> tuple['Figure', 'Axes']:
     """
     Plota a função f e os trapézios de integração (versão melhorada).
     """
+    import matplotlib.pyplot as plt
+
     valor_integral = integral_trapezio(f, start, end, divisions)
     
     fig, ax = plt.subplots()
@@ -84,16 +89,19 @@ def integral_riemann(f:Callable, start:float, end:float, divisions:int) -> float
         >>> print(round(i,2))
         9.0
     """
+    f = fast_callable(f)
     base = abs(end - start)/divisions
     retangulos = [base * f(x) for x in linspace(start+base/2,end-base/2, divisions)]
     i = sum(retangulos)
 
     return i
 
-def plot_integral_riemann(f: Callable, start: float, end: float, divisions: int) -> tuple[Figure, Axes]:
+def plot_integral_riemann(f: Callable, start: float, end: float, divisions: int) -> tuple['Figure', 'Axes']:
     """
     Plota a função f e os retângulos da soma de Riemann (ponto médio).
     """
+    import matplotlib.pyplot as plt
+
     valor_integral = integral_riemann(f, start, end, divisions)
     fig, ax = plt.subplots()
 
@@ -122,6 +130,7 @@ def plot_integral_riemann(f: Callable, start: float, end: float, divisions: int)
 
 if __name__ == "__main__":
     import math
+    import matplotlib.pyplot as plt
 
     # --- Teste 1: Função Quadrática (poucas divisões) ---
     # f(x) = x^2. Integral de 0 a 3 é 9.
@@ -1,72 +1,152 @@
-from typing import Callable, Sequence, Optional, List, Tuple
+from typing import TYPE_CHECKING, Callable, Sequence, Optional, List, Tuple
 from .core import RealFunction, Interval
-from .polinomios import Polinomio
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
+from .polinomios import Polinomio, _convolver
 import numpy as np
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.axes import Axes
+
+def _avaliar_newton(coef: Sequence[float], nos: Sequence[float], x):
+    """
+    Avalia a forma de Newton c0 + (x - z0)(c1 + (x - z1)(c2 + ...)) por multiplicação aninhada,
+    em O(n) por ponto; x pode ser escalar ou np.ndarray.
+    """
+    if isinstance(x, np.ndarray):
+        resultado = np.full(x.shape, coef[-1], dtype=float)
+    else:
+        resultado = coef[-1]
+    for c, no in zip(reversed(coef[:-1]), reversed(nos[:len(coef) - 1])):
+        resultado = resultado * (x - no) + c
+    return resultado
+
+def _newton_para_polinomio(coef: Sequence[float], nos: Sequence[float], domain: Optional[Interval] = None) -> Polinomio:
+    """Converte a forma de Newton em um Polinomio (base de monômios) por Horner, em O(n^2)."""
+    resultado = np.array([coef[-1]], dtype=float)
+    for c, no in zip(reversed(coef[:-1]), reversed(nos[:len(coef) - 1])):
+        resultado = _convolver(resultado, [1.0, -no])
+        resultado[-1] += c
+    return Polinomio(resultado, domain)
+
+
+def _ordem_leja(X: np.ndarray) -> np.ndarray:
+    """
+    Ordem de Leja dos nós: começa pelo de maior módulo e cada nó seguinte maximiza o produto
+    das distâncias aos anteriores (em O(n^2)). Nessa ordem a tabela de diferenças divididas e a
+    forma de Newton são estáveis mesmo com centenas de nós.
+    """
+    ordem = [int(np.argmax(np.abs(X)))]
+    with np.errstate(divide='ignore'):
+        logDistancias = np.log(np.abs(X - X[ordem[0]]))
+        for _ in range(len(X) - 1):
+            logDistancias[ordem[-1]] = -np.inf
+            ordem.append(int(np.argmax(logDistancias)))
+            logDistancias += np.log(np.abs(X - X[ordem[-1]]))
+    return np.array(ordem)
+
+
 class HermiteInterpolation(RealFunction):
-    def __init__(self, x: Sequence[float], y: Sequence[float], dy: Sequence[float], domain: Optional[Interval] = None):
+    def __init__(self, x: Sequence[float], y: Sequence[float], dy: Sequence, domain: Optional[Interval] = None):
         if len(x) != len(y) or len(x) != len(dy) or len(x) < 2:
             raise ValueError(f"x and y must have the same length ({len(x)} != {len(y)}) and have atleast 2 points.")
+        if len(np.unique(np.asarray(x, dtype=float))) != len(x):
+            raise ValueError("The interpolation nodes x must be distinct.")
         self.X = x
         self.Y = y
         self.DY = dy
         self.domain = domain 
-        self.f = self._coeficientes() # O Callable principal para RealFunction
-
-    def _coeficientes(self):
-        n = len(self.X)
-        coef = [0.0 for _ in range(2*n)]
+        self._nos, self._coef = self._diferencas_divididas()
+        self._polinomio = None
 
-        for i in range(n):
-            Li = [1.0]
-            denom = 1.0
-            for j in range(n):
-                if j != i:
-                    novo = [0.0 for _ in range(len(Li)+1)]
-                    for k in range(len(Li)):
-                        novo[k] -= Li[k] * self.X[j]
-                        novo[k+1] += Li[k]
-                    Li = novo
-                    denom *= (self.X[i] - self.X[j])
-            Li = [a / denom for a in Li]
-
-            Li_prime = sum(1 / (self.X[i] - self.X[m]) for m in range(n) if m != i)
+    @property
+    def f(self) -> Polinomio: #type: ignore
+        """
+        O polinômio interpolador, o mesmo de polinomio(), para quem usa f como Polinomio
+        (f.degree, f.prime, aritmética). A avaliação (__call__, evaluate, fast) usa a forma de
+        Newton, que é mais estável para graus altos.
+        """
+        return self.polinomio()
 
-            Li2 = [0.0]*(2*len(Li)-1)
-            for p in range(len(Li)):
-                for q in range(len(Li)):
-                    Li2[p+q] += Li[p]*Li[q]
+    def eval_safe(self, x):
+        if self.domain is None or x in self.domain:
+            return self.evaluate(x)
+        else:
+            raise Exception("The number is out of the domain")
 
-            Ki = [0.0]*(len(Li2)+1)
-            for k in range(len(Li2)):
-                Ki[k] -= Li2[k] * self.X[i]
-                Ki[k+1] += Li2[k]
+    def _derivadas(self) -> List[List[float]]:
+        """Derivadas em cada nó: dy[i] é y'(xi) ou a sequência [y'(xi), y''(xi), ...]."""
+        return [[float(d) for d in di] if np.ndim(di) else [float(di)] for di in self.DY]
 
-            Hi = [0.0]*(len(Li2)+1)
-            for k in range(len(Li2)):
-                Hi[k] += Li2[k]
-            for k in range(len(Li2)):
-                Hi[k] += 2*Li_prime*Li2[k]*self.X[i]  
-                Hi[k+1] -= 2*Li_prime*Li2[k]           
-            termo = [0.0]*max(len(Hi), len(Ki))
-            for k in range(len(Hi)):
-                termo[k] += self.Y[i]*Hi[k]
-            for k in range(len(Ki)):
-                termo[k] += self.DY[i]*Ki[k]
+    def _diferencas_divididas(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Tabela de diferenças divididas confluentes: cada nó xi aparece 1 + k_i vezes seguidas
+        (k_i derivadas dadas em xi) e, dentro de um mesmo bloco, a diferença de ordem j é
+        y^(j)(xi) / j!. A tabela é montada coluna a coluna em O(N^2), com N = n + sum(k_i),
+        e os coeficientes de Newton são o topo de cada coluna.
+
+        Para manter a tabela estável (o polinômio não muda): os nós entram na ordem de Leja e
+        a tabela é montada na variável t = (x - centro) / escala, que leva os nós a [-2, 2]
+        (intervalo de capacidade 1, onde os produtos de distâncias não estouram nem somem).
+        """
+        X = np.asarray(self.X, dtype=float)
+        self._centro = (X.max() + X.min()) / 2
+        self._escala = (X.max() - X.min()) / 4
+        X = (X - self._centro) / self._escala
+        ordem = _ordem_leja(X)
+        derivadas = self._derivadas()
+        derivadas = [derivadas[i] for i in ordem]
+        repeticoes = np.array([1 + len(d) for d in derivadas])
+        indice = np.repeat(np.arange(len(X)), repeticoes)
+        nos = X[ordem][indice]
+
+        # valores[i, j] = y^(j)(ti) / j! na variável t (d^j/dt^j = escala^j d^j/dx^j), completado com zeros
+        valores = np.zeros((len(X), repeticoes.max()))
+        fator = 1.0
+        valores[:, 0] = np.asarray(self.Y, dtype=float)[ordem]
+        for j in range(1, valores.shape[1]):
+            fator *= self._escala / j
+            for i, d in enumerate(derivadas):
+                if j <= len(d):
+                    valores[i, j] = d[j - 1] * fator
+
+        coluna = valores[indice, 0]
+        coef = [coluna[0]]
+        for j in range(1, len(nos)):
+            mesmoNo = indice[j:] == indice[:-j]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                coluna = np.where(mesmoNo,
+                                  valores[indice[j:], np.minimum(j, valores.shape[1] - 1)],
+                                  (coluna[1:] - coluna[:-1]) / (nos[j:] - nos[:-j]))
+            coef.append(coluna[0])
+        return nos, np.array(coef)
+
+    def evaluate(self, x):
+        """Avalia o interpolador de Hermite em x (escalar ou np.ndarray), em O(N) por ponto."""
+        resultado = _avaliar_newton(self._coef, self._nos, (x - self._centro) / self._escala)
+        # Escalares voltam como float (ou complex) do Python, como nos outros interpoladores
+        return resultado.item() if np.ndim(resultado) == 0 else resultado
 
-            for k in range(len(termo)):
-                coef[k] += termo[k]
+    @property
+    def fast(self) -> Callable[[float], float]:
+        return self.evaluate
 
-        while len(coef) > 1 and abs(coef[-1]) < 1e-14:
-            coef.pop()
+    def polinomio(self) -> Polinomio:
+        """
+        Converte o interpolador em um Polinomio (coeficientes na base de monômios), em O(N^2).
 
-        return Polinomio(coef[::-1])
+        Returns:
+            Polinomio: O polinômio interpolador, com o domínio do interpolador.
+        """
+        if self._polinomio is None:
+            # P(t) com t = x / escala - centro / escala
+            P = _newton_para_polinomio(self._coef, self._nos)
+            P = P.compose(Polinomio([1.0 / self._escala, -self._centro / self._escala]))
+            P.domain = self.domain
+            self._polinomio = P
+        return self._polinomio
 
 
-    def plot(self, num_points: int = 100, margin: float = 0.2, domain: Optional[Interval] = None) -> tuple[Figure, Axes]: #type: ignore
+    def plot(self, num_points: int = 100, margin: float = 0.2, domain: Optional[Interval] = None) -> tuple['Figure', 'Axes']: #type: ignore
             """
             Plota o gráfico do polinômio interpolador de Hermite.
 
@@ -88,6 +168,8 @@ class HermiteInterpolation(RealFunction):
                 >>> fig_h1, ax_h1 = P_h1.plot()
                 >>> plt.show()
             """
+            import matplotlib.pyplot as plt
+
             fig, ax = plt.subplots()
 
             # --- Gera pontos para a curva ---
@@ -109,7 +191,7 @@ class HermiteInterpolation(RealFunction):
                     plot_max = x_max + span * margin
 
             X_plot = np.linspace(plot_min, plot_max, num_points)
-            Y_plot = [self(x) for x in X_plot]
+            Y_plot = self(X_plot)
 
             # --- Plota ---
             # 1. A curva do polinômio
@@ -123,7 +205,10 @@ class HermiteInterpolation(RealFunction):
             segment_half_length = line_length / 2.0
             first_line = True
             
-            for xi, yi, dyi in zip(self.X, self.Y, self.DY):
+            for xi, yi, dyi in zip(self.X, self.Y, self._derivadas()):
+                if not dyi:
+                    continue
+                dyi = dyi[0]
                 label = "Derivadas" if first_line else None
                 
                 # Calcula o início e o fim do segmento de reta
@@ -146,22 +231,33 @@ class HermiteInterpolation(RealFunction):
             
             return fig, ax
 
-def hermite_interp(x: Sequence[float], y: Sequence[float], dy: Sequence[float], domain: Optional[Interval]=None) -> HermiteInterpolation:
+def hermite_interp(x: Sequence[float], y: Sequence[float], dy: Sequence, domain: Optional[Interval]=None) -> HermiteInterpolation:
     """
     Cria uma função de interpolação polinomial de Hermite a partir de um conjunto de coordenadas X, Y
     e de suas derivadas.
 
+    O interpolador é construído pela tabela de diferenças divididas confluentes (nós repetidos),
+    em O(N^2) com N = número total de dados, e avaliado na forma de Newton.
+
     Args:
-        x (Sequence[float]): Coordenadas no eixo X.
+        x (Sequence[float]): Coordenadas no eixo X (distintas).
         y (Sequence[float]): Valores de Y nas respectivas coordenadas.
-        dy (Sequence[float]): Valores das derivadas nas respectivas coordenadas.
+        dy (Sequence): Derivadas nas respectivas coordenadas: um número (a primeira derivada)
+            ou uma sequência [y'(xi), y''(xi), ...] por nó, com quantidades que podem variar
+            de um nó para outro.
         domain (Optional[Interval]): domínio da função (opcional)
         
     Returns:
         HermiteInterpolation: Uma classe chamável que avalia o polinômio interpolador de Hermite.
         
     Raises:
-        ValueError: Se x, y e dy tiverem comprimentos diferentes ou contiverem menos de dois pontos.
+        ValueError: Se x, y e dy tiverem comprimentos diferentes, contiverem menos de dois pontos
+            ou se houver nós repetidos.
+
+    Examples:
+        >>> p = hermite_interp([0.0, 1.0], [0.0, 1.0], [[0.0, 0.0], [3.0, 6.0]])  # x^3
+        >>> print(p(0.5))
+        0.125
     """
     if len(x) != len(y) or len(x) != len(dy) or len(x) < 2:
         raise ValueError(
@@ -172,39 +268,127 @@ def hermite_interp(x: Sequence[float], y: Sequence[float], dy: Sequence[float],
  
 
 
+# Número máximo de elementos das matrizes (pontos x nós) montadas de uma vez pelo modo baricêntrico
+_BARICENTRICO_BLOCO = 1 << 20
+
+def _pesos_baricentricos(X: np.ndarray) -> np.ndarray:
+    """
+    Pesos baricêntricos w_j = 1 / prod_(k != j) (x_j - x_k), em O(n^2).
+
+    Os produtos são somados em escala logarítmica e os pesos normalizados pelo maior deles:
+    o fator comum se cancela na fórmula baricêntrica, e assim os pesos não estouram nem somem
+    para n grande (e.g. em nós de Chebyshev os pesos exatos vão a 2^(n-2)).
+    """
+    n = len(X)
+    logPesos = np.empty(n)
+    sinais = np.empty(n)
+    bloco = max(1, _BARICENTRICO_BLOCO // n)
+    for inicio in range(0, n, bloco):
+        fim = min(inicio + bloco, n)
+        D = X[inicio:fim, None] - X[None, :]
+        D[np.arange(fim - inicio), np.arange(inicio, fim)] = 1.0
+        if np.any(D == 0.0):
+            raise ValueError("The interpolation nodes x must be distinct.")
+        logPesos[inicio:fim] = -np.log(np.abs(D)).sum(axis=1)
+        sinais[inicio:fim] = np.where(np.count_nonzero(D < 0.0, axis=1) % 2, -1.0, 1.0)
+    return sinais * np.exp(logPesos - logPesos.max())
+
+
 class PolinomialInterpolation(RealFunction):
-    def __init__(self, x: Sequence[float], y: Sequence[float], domain: Optional[Interval] = None):
+    def __init__(self, x: Sequence[float], y: Sequence[float], domain: Optional[Interval] = None, metodo: str = 'lagrange'):
         if len(x) != len(y) or len(x) < 2:
             raise ValueError(f"x and y must have the same length ({len(x)} != {len(y)}) and have atleast 2 points.")
+        if metodo not in ('lagrange', 'baricentrico'):
+            raise ValueError(f"Método desconhecido: {metodo!r}. Use 'lagrange' ou 'baricentrico'.")
         self.X = x
         self.Y = y
         self.domain = domain
-        self.f = self._coeficientes() # O Callable principal para RealFunction
+        self.metodo = metodo
+        if metodo == 'baricentrico':
+            # Os pesos só dependem dos nós; Y entra apenas no produto pesos * Y (ver atualizar_valores)
+            self._nos = np.asarray(x, dtype=float)
+            self.pesos = _pesos_baricentricos(self._nos)
+            self._pesosY = self.pesos * np.asarray(y, dtype=float)
+            self.f = self._avaliar_baricentrico
+        else:
+            self.f = self._coeficientes() # O Callable principal para RealFunction
 
     def _coeficientes(self) -> Polinomio:
         n = len(self.X)
-        coef = [0.0 for _ in range(n)]
+        coef = np.zeros(n)
 
         for i in range(n): 
-            Li = [1.0]
+            Li = np.array([1.0])
             denom = 1.0
 
             for j in range(n): 
                 if i != j:
-                    novo = [0.0 for _ in range(len(Li) + 1)]
-                    for k in range(len(Li)):
-                        novo[k]     += Li[k]          
-                        novo[k + 1] -= Li[k] * self.X[j]
-                    Li = novo
+                    # Multiplica por (x - x_j), coeficientes em ordem decrescente
+                    Li = _convolver(Li, [1.0, -self.X[j]])
                     denom *= (self.X[i] - self.X[j])
 
-            Li = [a * (self.Y[i] / denom) for a in Li]
-            for k in range(len(Li)):
-                coef[k] += Li[k]
+            coef += Li * (self.Y[i] / denom)
 
         return Polinomio(coef) 
 
-    def plot(self, num_points: int = 100, margin: float = 0.2, domain: Optional[Interval] = None) -> tuple[Figure, Axes]: #type: ignore
+    def _avaliar_baricentrico(self, x):
+        """
+        Avalia pela segunda fórmula baricêntrica,
+            p(x) = sum(w_j y_j / (x - x_j)) / sum(w_j / (x - x_j)),
+        em O(n) por ponto. Para arrays, os pontos são processados em blocos de uma matriz
+        (pontos x nós); pontos que coincidem com um nó recebem o valor exato do nó.
+        """
+        v = np.asarray(x, dtype=float)
+        pontos = v.ravel()
+        resultado = np.empty(len(pontos))
+        bloco = max(1, _BARICENTRICO_BLOCO // len(self._nos))
+        for inicio in range(0, len(pontos), bloco):
+            D = pontos[inicio:inicio + bloco, None] - self._nos[None, :]
+            exatos = D == 0.0
+            D[exatos] = 1.0
+            inversos = 1.0 / D
+            parcial = (inversos @ self._pesosY) / (inversos @ self.pesos)
+            linhas, nos = np.nonzero(exatos)
+            parcial[linhas] = self._pesosY[nos] / self.pesos[nos]
+            resultado[inicio:inicio + bloco] = parcial
+
+        if v.ndim == 0:
+            return float(resultado[0])
+        return resultado.reshape(v.shape)
+
+    def atualizar_valores(self, y: Sequence[float]) -> None:
+        """
+        Troca os valores Y mantendo os mesmos nós X.
+
+        No modo 'baricentrico' os pesos não dependem de Y, então a atualização custa O(n):
+        interpolar muitos sinais na mesma malha reaproveita os pesos calculados uma vez.
+        No modo 'lagrange' os coeficientes são recalculados.
+
+        Args:
+            y (Sequence[float]): Novos valores nos nós X.
+
+        Raises:
+            ValueError: Se y não tiver o mesmo comprimento de X.
+        """
+        if len(y) != len(self.X):
+            raise ValueError(f"x and y must have the same length ({len(self.X)} != {len(y)}).")
+        self.Y = y
+        if self.metodo == 'baricentrico':
+            self._pesosY = self.pesos * np.asarray(y, dtype=float)
+        else:
+            self.f = self._coeficientes()
+
+    def evaluate(self, x):
+        """Avalia o interpolador polinomial em x (escalar ou np.ndarray)."""
+        return self.fast(x)
+
+    @property
+    def fast(self) -> Callable[[float], float]:
+        if self.metodo == 'baricentrico':
+            return self.f
+        return self.f.evaluate
+
+    def plot(self, num_points: int = 100, margin: float = 0.2, domain: Optional[Interval] = None) -> tuple['Figure', 'Axes']: #type: ignore
         """
         Plota o gráfico do polinômio interpolador de Lagrange.
 
@@ -222,6 +406,8 @@ class PolinomialInterpolation(RealFunction):
                 >>> fig_poly, ax_poly = P_poly.plot() 
                 >>> plt.show()
         """
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots()
 
         # --- Gera pontos para a curva ---
@@ -243,7 +429,7 @@ class PolinomialInterpolation(RealFunction):
                 plot_max = x_max + span * margin
 
         X_plot = np.linspace(plot_min, plot_max, num_points)
-        Y_plot = [self(x) for x in X_plot]
+        Y_plot = self(X_plot)
 
         # --- Plota ---
         # 1. A curva do polinômio
@@ -264,38 +450,188 @@ class PolinomialInterpolation(RealFunction):
     
 
  
-def poly_interp(x: Sequence[float], y: Sequence[float], domain: Optional[Interval] = None) -> PolinomialInterpolation:
+def poly_interp(x: Sequence[float], y: Sequence[float], domain: Optional[Interval] = None, metodo: str = 'lagrange') -> PolinomialInterpolation:
     """
     Cria uma função de interpolação polinomial a partir de um conjunto de coordenadas X e Y,
     utilizando a forma de Lagrange.
 
+    Com metodo='lagrange' o polinômio é expandido em coeficientes (O(n^3), instável para n
+    grande). Com metodo='baricentrico' são calculados apenas os pesos baricêntricos (O(n^2)),
+    a avaliação custa O(n) por ponto e é estável mesmo com centenas de nós (e.g. de Chebyshev).
+
     Args:
         x (Sequence[float]): Sequência das coordenadas no eixo X.
         y (Sequence[float]): Sequência dos valores correspondentes no eixo Y.
         domain (Optional[Interval]): domínio da função (opcional)
+        metodo (str): 'lagrange' (padrão) ou 'baricentrico'.
 
     Returns:
         PolinomialInterpolation: Uma classe chamável que avalia o polinômio interpolador
         para qualquer valor de entrada do tipo float.
 
     Raises:
-        ValueError: Se x e y tiverem comprimentos diferentes ou contiverem menos de dois pontos.
+        ValueError: Se x e y tiverem comprimentos diferentes ou contiverem menos de dois pontos,
+            ou se o método for desconhecido.
     """
     if len(x) != len(y) or len(x) < 2:
         raise ValueError(f"x and y must have the same length ({len(x)} != {len(y)}) and have atleast 2 points.")
     
-    return PolinomialInterpolation(x, y, domain)
+    return PolinomialInterpolation(x, y, domain, metodo)
+
+
 
 
+class NewtonInterpolation(RealFunction):
+    def __init__(self, x: Sequence[float], y: Sequence[float], domain: Optional[Interval] = None):
+        if len(x) != len(y) or len(x) < 2:
+            raise ValueError(f"x and y must have the same length ({len(x)} != {len(y)}) and have atleast 2 points.")
+        if len(np.unique(np.asarray(x, dtype=float))) != len(x):
+            raise ValueError("The interpolation nodes x must be distinct.")
+        self.X = [float(v) for v in x]
+        self.Y = [float(v) for v in y]
+        self.domain = domain
+        self._coef, self._diagonal = self._diferencas_divididas()
+        self._polinomio = None
+        self.f = self.evaluate # O Callable principal para RealFunction
+
+    def _diferencas_divididas(self) -> Tuple[List[float], List[float]]:
+        """
+        Monta a tabela de diferenças divididas coluna a coluna (O(n^2), vetorizado por coluna).
+
+        Guarda apenas as duas diagonais usadas depois: os coeficientes de Newton
+        f[x0], f[x0,x1], ..., f[x0..xn] e a última diagonal f[xn], f[x(n-1),xn], ..., f[x0..xn],
+        que é o que append precisa para acrescentar um ponto sem refazer a tabela.
+        """
+        X = np.asarray(self.X)
+        coluna = np.asarray(self.Y).copy()
+        coef = [coluna[0]]
+        diagonal = [coluna[-1]]
+        for j in range(1, len(X)):
+            coluna = (coluna[1:] - coluna[:-1]) / (X[j:] - X[:-j])
+            coef.append(coluna[0])
+            diagonal.append(coluna[-1])
+        return [float(c) for c in coef], [float(d) for d in diagonal]
+
+    @property
+    def coeficientes(self) -> np.ndarray:
+        """Coeficientes de Newton f[x0], f[x0,x1], ..., f[x0..xn]."""
+        return np.array(self._coef)
+
+    def append(self, x: float, y: float) -> None:
+        """
+        Acrescenta o ponto (x, y) ao interpolador em O(n), sem refazer a tabela.
+
+        A nova diagonal da tabela de diferenças divididas sai da anterior:
+            t0 = y,  tj = (t(j-1) - d(j-1)) / (x - x(n+1-j)),
+        e o novo coeficiente de Newton é o último termo, f[x0..x(n+1)]. Os coeficientes
+        anteriores não mudam.
+
+        Args:
+            x (float): Novo nó (diferente de todos os nós atuais).
+            y (float): Valor no novo nó.
+
+        Raises:
+            ValueError: Se x já for um nó do interpolador.
+        """
+        x, y = float(x), float(y)
+        diagonal = [y]
+        for anterior, no in zip(self._diagonal, reversed(self.X)):
+            if x == no:
+                raise ValueError(f"The node x={x} is already in the interpolation nodes.")
+            diagonal.append((diagonal[-1] - anterior) / (x - no))
+
+        self.X.append(x)
+        self.Y.append(y)
+        self._coef.append(diagonal[-1])
+        self._diagonal = diagonal
+        self._polinomio = None
+
+    def evaluate(self, x):
+        """
+        Avalia o interpolador em x (escalar ou np.ndarray) pela multiplicação aninhada
+            p(x) = c0 + (x - x0)(c1 + (x - x1)(c2 + ...)),
+        em O(n) por ponto.
+        """
+        return _avaliar_newton(self._coef, self.X, x)
+
+    @property
+    def fast(self) -> Callable[[float], float]:
+        return self.evaluate
+
+    def polinomio(self) -> Polinomio:
+        """
+        Converte a forma de Newton em um Polinomio (coeficientes na base de monômios), em O(n^2).
+        O resultado fica guardado até o próximo append.
+
+        Returns:
+            Polinomio: O polinômio interpolador, com o domínio do interpolador.
+        """
+        if self._polinomio is None:
+            self._polinomio = _newton_para_polinomio(self._coef, self.X, self.domain)
+        return self._polinomio
+
+
+def newton_interp(x: Sequence[float], y: Sequence[float], domain: Optional[Interval] = None) -> NewtonInterpolation:
+    """
+    Cria uma função de interpolação polinomial na forma de Newton (diferenças divididas).
+
+    O interpolador aceita novos pontos com append(x, y) em O(n), sem refazer a tabela, o que
+    serve para amostras que chegam uma a uma. Avalia em O(n) por ponto e só é convertido
+    para Polinomio quando necessário (método polinomio()). Com muitos nós, a precisão da
+    forma de Newton depende da ordem em que eles entram (ordens de Leja são as mais estáveis).
+
+    Args:
+        x (Sequence[float]): Sequência das coordenadas no eixo X (distintas).
+        y (Sequence[float]): Sequência dos valores correspondentes no eixo Y.
+        domain (Optional[Interval]): domínio da função (opcional)
+
+    Returns:
+        NewtonInterpolation: Uma classe chamável que avalia o polinômio interpolador.
+
+    Raises:
+        ValueError: Se x e y tiverem comprimentos diferentes, contiverem menos de dois pontos
+            ou se houver nós repetidos.
+
+    Examples:
+        >>> p = newton_interp([0, 1, 2], [1, 3, 7])
+        >>> p.append(3, 13)
+        >>> print(p(1.5))
+        4.75
+    """
+    if len(x) != len(y) or len(x) < 2:
+        raise ValueError(f"x and y must have the same length ({len(x)} != {len(y)}) and have atleast 2 points.")
+
+    return NewtonInterpolation(x, y, domain)
 
 
 class PiecewiseLinearFunction(RealFunction):
+    # Desvio máximo dos nós em relação à malha uniforme, relativo ao passo, para que X seja
+    # tratado como uniforme (ver benchmarks/bench_linear.py)
+    UNIFORME_TOLERANCIA = 1e-9
+
     def __init__(self, x: Sequence[float], y: Sequence[float], domain: Optional[Interval] = None):
         self.X = x
         self.Y = y
         self.domain = domain if domain else Interval(min(x), max(x))
+        # Nós, valores e inclinações de cada segmento calculados uma única vez: a avaliação
+        # de um ponto é uma busca binária mais y_i + m_i (v - x_i)
+        self._X = np.asarray(x, dtype=float)
+        self._Y = np.asarray(y, dtype=float)
+        self._inclinacoes = np.diff(self._Y) / np.diff(self._X)
+        self._detectar_uniforme()
         self.f = self.evaluate # O Callable principal para RealFunction
 
+    def _detectar_uniforme(self) -> None:
+        """
+        Verifica se os nós formam uma malha uniforme x_k = x_0 + k * passo (a menos de
+        UNIFORME_TOLERANCIA * passo). Nesse caso o segmento de um ponto sai de uma conta,
+        floor((v - x_0) / passo), em O(1), em vez da busca binária.
+        """
+        n = len(self._X)
+        self._passo = (self._X[-1] - self._X[0]) / (n - 1)
+        malha = self._X[0] + np.arange(n) * self._passo
+        self.uniforme = bool(self._passo > 0 and np.max(np.abs(self._X - malha)) <= self.UNIFORME_TOLERANCIA * self._passo)
+
     def criar_segmento_polinomial(self, x1, x2, y1, y2) -> Polinomio:
         if x1 == x2:
             raise ValueError("Pontos x1 e x2 são o mesmo. Não é possível criar um segmento.")
@@ -308,91 +644,155 @@ class PiecewiseLinearFunction(RealFunction):
 
         return pol
 
+    def _segmentos(self, v):
+        """
+        Índice do segmento de cada ponto, com uma única busca binária (np.searchsorted) também
+        para arrays. Pontos à esquerda de X[0] usam o primeiro segmento e à direita de X[-1]
+        o último (extrapolação linear).
+
+        Em malhas uniformes o índice é calculado diretamente, floor((v - x_0) / passo), e
+        corrigido em um passo contra os nós vizinhos, de modo que o resultado é o mesmo da
+        busca binária mesmo quando os nós se afastam um pouco da malha ou v cai num nó.
+        """
+        ultimo = len(self._X) - 2
+        if not self.uniforme:
+            return np.clip(np.searchsorted(self._X, v, side='right') - 1, 0, ultimo)
+
+        if np.ndim(v) == 0:
+            return self._segmento(float(v))
+        # fmax/fmin ignoram NaN, que vai para o segmento 0 (e dá NaN na avaliação)
+        t = np.subtract(v, self._X[0], dtype=float)
+        t /= self._passo
+        np.fmax(t, 0, out=t)
+        np.fmin(t, ultimo, out=t)
+        i = t.astype(np.intp)
+        i += v >= self._X[i + 1]
+        i -= v < self._X[i]
+        np.clip(i, 0, ultimo, out=i)
+        return i
+
+    def _segmento(self, v: float) -> int:
+        """_segmentos para um único ponto, sem a sobrecarga das funções do NumPy."""
+        ultimo = len(self._X) - 2
+        if not self.uniforme:
+            return min(max(int(np.searchsorted(self._X, v, side='right')) - 1, 0), ultimo)
+
+        t = (v - self._X[0]) / self._passo
+        i = 0 if not t > 0 else ultimo if t >= ultimo else int(t)
+        if i < ultimo and v >= self._X[i + 1]:
+            i += 1
+        elif i > 0 and v < self._X[i]:
+            i -= 1
+        return i
+
+    def _inclinacao(self, i):
+        """Inclinação do(s) segmento(s) de índice i."""
+        return self._inclinacoes[i]
+
     @property
     def prime(self) -> Callable[[float], float]: #type: ignore
         """
         Retorna a função que calcula a derivada (inclinação constante) 
         da interpolação linear por partes. A derivada é indefinida nos pontos de referência.
+        Aceita escalares e arrays, em O(log n) por ponto.
         """
         
         # O self.prime da RealFunction é um Callable. Retornamos uma função que implementa a lógica da derivada.
-        def piecewisePrimeFunction(v: float) -> float:
-            if not (self.X[0] <= v <= self.X[-1]):
-                raise ValueError(f"O ponto {v} está fora do domínio de interpolação.")
-            
-            n = len(self.X)
-            
-            for x_i in self.X:
-                if abs(v - x_i) < 1e-12: 
-                    raise ValueError(f"A derivada é descontínua e indefinida no nó x={v}.")
-
-            start, end = 0, n - 1
-
-            while end - start != 1:
-                mid = (end + start) // 2
-                if self.X[mid] > v:
-                    end = mid
-                else:
-                    start = mid
-            
-            x1, x2 = self.X[start], self.X[end]
-            y1, y2 = self.Y[start], self.Y[end]
-            
-            slope = (y2 - y1) / (x2 - x1)
-            
-            return slope
+        def piecewisePrimeFunction(v):
+            valores = np.asarray(v, dtype=float)
+            fora = (valores < self._X[0]) | (valores > self._X[-1])
+            if np.any(fora):
+                raise ValueError(f"O ponto {valores[fora].flat[0]} está fora do domínio de interpolação.")
+
+            # Só os dois nós do segmento de cada ponto podem estar a menos de 1e-12 dele
+            i = self._segmentos(valores)
+            distancia = np.minimum(np.abs(valores - self._X[i]), np.abs(valores - self._X[i + 1]))
+            noNo = distancia < 1e-12
+            if np.any(noNo):
+                raise ValueError(f"A derivada é descontínua e indefinida no nó x={valores[noNo].flat[0]}.")
+
+            slope = self._inclinacao(i)
+            return float(slope) if valores.ndim == 0 else slope
 
         return piecewisePrimeFunction
 
-    def evaluate(self, v: float) -> float:
-        n = len(self.X)
-        if v > self.X[-1]:
-            start, end = n - 2, n - 1
-        elif v < self.X[0]:
-            start, end = 0, 1
-        elif v == self.X[0]:
-            return self.Y[0]
-        elif v == self.X[-1]:
-            return self.Y[-1]
-        else:
-            start, end = 0, n - 1 
-            while end - start != 1:
-                mid = (end + start) // 2
-                if self.X[mid] > v:
-                    end = mid
-                elif self.X[mid] < v:
-                    start = mid
-                else:
-                    return self.Y[mid] 
+    def evaluate(self, v):
+        """Avalia a interpolação em v (escalar ou np.ndarray), extrapolando pelos segmentos das pontas."""
+        if isinstance(v, np.ndarray) and v.ndim > 0:
+            return self._evaluate_array(v)
 
-        x1, x2 = self.X[start], self.X[end]
-        y1, y2 = self.Y[start], self.Y[end]
+        i = self._segmento(v)
+        if v == self._X[i + 1]:
+            # Valor exato no último nó, que fecha o último segmento
+            return float(self._Y[i + 1])
+        return float(self._Y[i] + (v - self._X[i]) * self._inclinacao(i))
 
-        return y1 + (v - x1) * ((y2 - y1) / (x2 - x1))
+    def _evaluate_array(self, v: np.ndarray) -> np.ndarray:
+        """
+        Versão vetorizada de evaluate: localiza o segmento de todos os pontos com uma única
+        busca binária (np.searchsorted), ou pela conta direta em malhas uniformes, mantendo as
+        mesmas regras de extrapolação.
+        """
+        i = self._segmentos(v)
+        # Em float mesmo com pontos e nós inteiros (e.g. timestamps int64 em MemmapLinearFunction)
+        resultado = np.subtract(v, self._X[i], dtype=float)
+        resultado *= self._inclinacao(i)
+        resultado += self._Y[i]
+        # Garante o valor exato no último nó, assim como na versão escalar
+        resultado[v == self._X[-1]] = self._Y[-1]
+        return resultado
     
+    def _cruzamentos(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Varredura vetorizada dos sinais de Y. Retorna os índices i dos segmentos com troca
+        estrita de sinal (y_i e y_(i+1) não nulos, de sinais opostos) e os índices dos nós
+        com y_i == 0, cada um uma única vez.
+
+        Compara os sinais em vez de testar y_i * y_(i+1) < 0, que dá 0 por underflow quando
+        os dois valores são muito pequenos.
+        """
+        sinais = np.sign(self._Y)
+        cruzamentos = np.flatnonzero(sinais[:-1] * sinais[1:] < 0)
+        return cruzamentos, np.flatnonzero(sinais == 0)
+
     def encontrar_segmentos_raiz(self) -> List[Tuple[float, float]]:
         """
-        Retorna uma lista de intervalos [a, b] onde f(a) * f(b) < 0.
+        Retorna uma lista de intervalos [a, b] onde f(a) * f(b) < 0 e, para cada nó x_i com
+        f(x_i) = 0, o intervalo degenerado (x_i, x_i), em ordem crescente de x.
         """
+        cruzamentos, zeros = self._cruzamentos()
+        # Um segmento com troca estrita de sinal nunca tem raiz nos seus nós, então ordenar
+        # pelo índice (estável, cruzamentos antes) dá a ordem crescente de x
+        indices = np.concatenate([cruzamentos, zeros])
+        ordem = np.argsort(indices, kind='stable')
+        esquerda = self._X[indices[ordem]]
+        direita = self._X[np.concatenate([cruzamentos + 1, zeros])[ordem]]
+        return list(zip(esquerda.tolist(), direita.tolist()))
+
+    def raizes(self) -> np.ndarray:
+        """
+        Raízes exatas da interpolação em [x0, xn], em ordem crescente, em uma única passada
+        vetorizada: os nós com f(x_i) = 0 e, em cada segmento com troca de sinal, o zero da reta
+            x_i - y_i (x_(i+1) - x_i) / (y_(i+1) - y_i).
+        Cada raiz aparece uma vez. Segmentos identicamente nulos contribuem só com os nós.
 
-        segments = []
-        for i in range(len(self.X) - 1):
-            y_i = self.Y[i]
-            y_i_plus_1 = self.Y[i+1]
-            
-            # Se os sinais são opostos (garantia da raiz)
-            if y_i * y_i_plus_1 < 0:
-                segments.append((self.X[i], self.X[i+1]))
-                
-            if y_i == 0:
-                segments.append((self.X[i], self.X[i]))
+        Returns:
+            np.ndarray: As raízes, ordenadas.
 
-        if self.Y[-1] == 0:
-            segments.append((self.X[-1], self.X[-1]))
-            
-        return segments
+        Examples:
+            >>> p = linear_interp([0, 1, 2, 3], [1, -1, 0, 2])
+            >>> p.raizes()
+            array([0.5, 2. ])
+        """
+        cruzamentos, zeros = self._cruzamentos()
+        X, Y = self._X, self._Y
+        x0, y0 = X[cruzamentos], Y[cruzamentos]
+        x1, y1 = X[cruzamentos + 1], Y[cruzamentos + 1]
+        raizes = np.concatenate([x0 - y0 * (x1 - x0) / (y1 - y0), X[zeros]]).astype(float)
+        raizes.sort()
+        return raizes
     
-    def plot(self, *args, **kwargs) -> tuple[Figure, Axes]:
+    def plot(self, *args, **kwargs) -> tuple['Figure', 'Axes']:
         """
         Plota o gráfico da função linear por partes.
         Returns:
@@ -404,6 +804,8 @@ class PiecewiseLinearFunction(RealFunction):
             >>> fig, ax = p.plot()
             >>> plt.show()
         """
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots()
         # Plota as linhas que interligam os pontos
         ax.plot(self.X, self.Y, linestyle='-', color='blue', label='Função Linear por Partes')
@@ -448,7 +850,675 @@ def linear_interp(x: Sequence, y: Sequence) -> PiecewiseLinearFunction:
     return PiecewiseLinearFunction(x, y)
 
 
+class StreamingLinearFunction(PiecewiseLinearFunction):
+    """
+    Interpolação linear por partes sobre uma janela deslizante com os últimos `capacidade`
+    pontos de uma série que cresce com append(x, y).
+
+    Os pontos ficam em um buffer circular espelhado: cada amostra é escrita na posição k e
+    em k + capacidade de um array com o dobro do tamanho, então a janela atual é sempre a
+    fatia contígua [inicio, inicio + n) e X, Y e as inclinações são views, sem cópia nem
+    realocação, nem no append nem na avaliação. As views acompanham os appends seguintes.
+    """
+    def __init__(self, capacidade: int, x: Sequence[float] = (), y: Sequence[float] = (), domain: Optional[Interval] = None):
+        if capacidade < 2:
+            raise ValueError("The window capacity must be atleast 2 points.")
+        self.capacidade = int(capacidade)
+        self._bufX = np.empty(2 * self.capacidade)
+        self._bufY = np.empty(2 * self.capacidade)
+        self._bufInclinacoes = np.empty(2 * self.capacidade)
+        self._inicio = 0
+        self._n = 0
+        self._domain = domain
+        # A janela muda a cada append: a detecção de malha uniforme (O(n)) não é refeita
+        self.uniforme = False
+        self.f = self.evaluate # O Callable principal para RealFunction
+
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if len(x) != len(y):
+            raise ValueError(f"x and y must have the same length ({len(x)} != {len(y)}).")
+        if np.any(np.diff(x) <= 0):
+            raise ValueError("The x values must be strictly increasing.")
+        # Só os últimos `capacidade` pontos cabem na janela
+        x, y = x[-self.capacidade:], y[-self.capacidade:]
+        n = len(x)
+        for buf, valores in ((self._bufX, x), (self._bufY, y), (self._bufInclinacoes, np.diff(y) / np.diff(x))):
+            buf[:len(valores)] = valores
+            buf[self.capacidade:self.capacidade + len(valores)] = valores
+        self._n = n
+        self._atualizar_janela()
+
+    def _atualizar_janela(self) -> None:
+        fim = self._inicio + self._n
+        self._X = self.X = self._bufX[self._inicio:fim]
+        self._Y = self.Y = self._bufY[self._inicio:fim]
+        self._inclinacoes = self._bufInclinacoes[self._inicio:fim - 1]
+
+    @property
+    def domain(self) -> Optional[Interval]: #type: ignore
+        """Domínio dado na construção ou, sem ele, [x0, xn] da janela atual."""
+        if self._domain is not None or self._n == 0:
+            return self._domain
+        return Interval(self._X[0], self._X[-1])
+
+    @domain.setter
+    def domain(self, valor: Optional[Interval]) -> None:
+        self._domain = valor
+
+    def __len__(self) -> int:
+        return self._n
+
+    def append(self, x: float, y: float) -> None:
+        """
+        Acrescenta o ponto (x, y) ao fim da janela em O(1), descartando o ponto mais antigo
+        quando a janela já tem `capacidade` pontos.
+
+        Args:
+            x (float): Novo nó, maior que o último nó da janela.
+            y (float): Valor no novo nó.
+
+        Raises:
+            ValueError: Se x não for maior que o último nó.
+        """
+        x, y = float(x), float(y)
+        cap = self.capacidade
+        if self._n:
+            anterior = (self._inicio + self._n - 1) % cap
+            if not x > self._bufX[anterior]:
+                raise ValueError(f"The x values must be strictly increasing ({x} <= {self._bufX[anterior]}).")
+            inclinacao = (y - self._bufY[anterior]) / (x - self._bufX[anterior])
+            self._bufInclinacoes[anterior] = self._bufInclinacoes[anterior + cap] = inclinacao
+
+        if self._n < cap:
+            posicao = (self._inicio + self._n) % cap
+            self._n += 1
+        else:
+            # Janela cheia: o novo ponto ocupa o lugar do mais antigo
+            posicao = self._inicio
+            self._inicio = (self._inicio + 1) % cap
+        self._bufX[posicao] = self._bufX[posicao + cap] = x
+        self._bufY[posicao] = self._bufY[posicao + cap] = y
+        self._atualizar_janela()
+
+    def _verificar_pontos(self) -> None:
+        if self._n < 2:
+            raise ValueError("There must be atleast 2 points in the window to interpolate.")
+
+    @property
+    def prime(self) -> Callable[[float], float]: #type: ignore
+        self._verificar_pontos()
+        return super().prime
+
+    def evaluate(self, v):
+        """Avalia a interpolação na janela atual em v (escalar ou np.ndarray)."""
+        self._verificar_pontos()
+        return super().evaluate(v)
+
+
+def stream_interp(capacidade: int, x: Sequence[float] = (), y: Sequence[float] = (), domain: Optional[Interval] = None) -> StreamingLinearFunction:
+    """
+    Cria uma interpolação linear por partes para séries que chegam ponto a ponto, guardando
+    só os últimos `capacidade` pontos (janela deslizante).
+
+    Cada append(x, y) custa O(1): os pontos vivem em um buffer circular de tamanho fixo e a
+    janela é avaliada como em linear_interp, por busca binária, sem copiar os dados.
+    Os valores de x devem ser estritamente crescentes.
+
+    Args:
+        capacidade (int): Número máximo de pontos na janela (pelo menos 2).
+        x (Sequence[float]): Pontos iniciais no eixo X (opcional; só os últimos `capacidade` são mantidos).
+        y (Sequence[float]): Valores iniciais no eixo Y.
+        domain (Optional[Interval]): Domínio fixo da função (padrão: [x0, xn] da janela atual).
+
+    Returns:
+        StreamingLinearFunction: A interpolação sobre a janela, que cresce com append(x, y).
+
+    Raises:
+        ValueError: Se a capacidade for menor que 2, se x e y tiverem comprimentos diferentes
+            ou se x não for estritamente crescente.
+
+    Examples:
+        >>> p = stream_interp(3, [0, 1], [0, 2])
+        >>> p.append(2, 3)
+        >>> p.append(3, 1)
+        >>> print(p(2.5))
+        2.0
+    """
+    return StreamingLinearFunction(capacidade, x, y, domain)
+
+
+def _abrir_tabela(fonte, dtype) -> np.ndarray:
+    """
+    Abre uma coluna da tabela sem copiá-la: arrays (np.memmap incluído) são usados como estão,
+    arquivos .npy são abertos com np.load(mmap_mode='r') e os demais caminhos são lidos como
+    binário cru do tipo dtype, com np.memmap.
+    """
+    if isinstance(fonte, np.ndarray):
+        return fonte
+    if str(fonte).endswith('.npy'):
+        return np.load(fonte, mmap_mode='r')
+    return np.memmap(fonte, dtype=dtype, mode='r')
+
+
+class MemmapLinearFunction(PiecewiseLinearFunction):
+    """
+    Interpolação linear por partes sobre tabelas guardadas em disco (np.memmap), sem carregá-las.
+
+    Nenhuma operação percorre a tabela inteira: não há cópia para float, as inclinações são
+    calculadas na hora só para os segmentos consultados, o domínio padrão sai de X[0] e X[-1]
+    e a malha só é tratada como uniforme se isso for declarado. Cada consulta toca apenas as
+    páginas da busca binária em X e as dos seus dois nós, então a memória residente não cresce
+    com o tamanho da tabela. Como nada é verificado, X deve ser estritamente crescente.
+
+    As consultas são convertidas para o tipo de X antes da busca (np.searchsorted copiaria a
+    tabela inteira para comparar tipos diferentes), arredondadas para baixo quando X é inteiro
+    (e.g. timestamps int64); os valores são calculados em float64.
+    """
+    def __init__(self, x: np.ndarray, y: np.ndarray, domain: Optional[Interval] = None, uniforme: bool = False):
+        if len(x) != len(y):
+            raise ValueError(f"x and y must have the same length ({len(x)} != {len(y)}).")
+        if len(x) < 2:
+            raise ValueError("There must be atleast 2 points")
+        self.X = x
+        self.Y = y
+        # Views np.ndarray da mesma memória mapeada (sem cópia), que não passam pelo
+        # __getitem__/__array_wrap__ de np.memmap, escritos em Python
+        self._X = np.asarray(x)
+        self._Y = np.asarray(y)
+        self.domain = domain if domain else Interval(float(x[0]), float(x[-1]))
+        # A detecção da malha uniforme leria a tabela inteira: aqui ela é declarada por quem chama
+        self.uniforme = bool(uniforme)
+        self._passo = (float(x[-1]) - float(x[0])) / (len(x) - 1)
+        self.f = self.evaluate # O Callable principal para RealFunction
+
+    def _inclinacao(self, i):
+        X, Y = self._X, self._Y
+        if isinstance(i, (int, np.integer)):
+            return (float(Y[i + 1]) - float(Y[i])) / (float(X[i + 1]) - float(X[i]))
+        return (Y[i + 1].astype(float) - Y[i]) / (X[i + 1].astype(float) - X[i])
+
+    def _segmentos(self, v):
+        if self.uniforme:
+            # A conta direta não compara tipos na busca, e em float64 não perde índices
+            return super()._segmentos(v)
+        if np.issubdtype(self._X.dtype, np.integer):
+            # Com nós inteiros, x_k <= v equivale a x_k <= floor(v): arredondar para baixo
+            # (e não truncar em direção ao zero) mantém o segmento certo para v negativo
+            limites = np.iinfo(self._X.dtype)
+            v = np.clip(np.nan_to_num(np.floor(v), nan=0.0), limites.min, limites.max)
+        return super()._segmentos(np.asarray(v, dtype=self._X.dtype))
+
+    def _segmento(self, v: float) -> int:
+        if self.uniforme:
+            return super()._segmento(v)
+        if np.issubdtype(self._X.dtype, np.integer):
+            return int(self._segmentos(np.float64(v)))
+        return super()._segmento(self._X.dtype.type(v))
+
+
+def memmap_interp(x, y, dtype=np.float64, domain: Optional[Interval] = None, uniforme: bool = False) -> MemmapLinearFunction:
+    """
+    Cria uma interpolação linear por partes sobre uma tabela em disco, sem carregá-la na memória.
+
+    x e y podem ser np.memmap (ou qualquer np.ndarray), caminhos de arquivos .npy ou caminhos
+    de arquivos binários crus com valores do tipo dtype. Os dados não são copiados: cada
+    consulta lê só as páginas da tabela que a busca binária visita, então tabelas maiores que
+    a memória podem ser avaliadas com memória residente constante.
+
+    Args:
+        x: Nós no eixo X (estritamente crescentes; não é verificado, para não ler a tabela inteira).
+        y: Valores no eixo Y.
+        dtype: Tipo dos valores nos arquivos binários crus (ignorado para arrays e .npy).
+        domain (Optional[Interval]): Domínio da função (padrão: [x[0], x[-1]]).
+        uniforme (bool): Declara que x é uma malha uniforme, o que troca a busca binária pelo
+            cálculo direto do segmento (não é detectado automaticamente).
+
+    Returns:
+        MemmapLinearFunction: A interpolação linear por partes sobre a tabela mapeada.
+
+    Raises:
+        ValueError: Se x e y tiverem comprimentos diferentes ou menos de dois pontos.
+
+    Examples:
+        >>> np.save('x.npy', np.linspace(0, 1, 10**6))
+        >>> np.save('y.npy', np.linspace(0, 2, 10**6))
+        >>> p = memmap_interp('x.npy', 'y.npy', uniforme=True)
+        >>> print(p(0.25))
+        0.5
+    """
+    return MemmapLinearFunction(_abrir_tabela(x, dtype), _abrir_tabela(y, dtype), domain, uniforme)
+
+
+
+def _resolver_tridiagonal(inferior: np.ndarray, diagonal: np.ndarray, superior: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """
+    Resolve um sistema tridiagonal por redução cíclica, em O(n) operações e O(log n) passos
+    vetorizados (sem laço em Python sobre as equações, como no algoritmo de Thomas).
+
+    Cada passo combina as equações de índice par com as vizinhas, eliminando as incógnitas de
+    índice ímpar, resolve o sistema com a metade das equações e recupera as ímpares. Estável
+    sem pivoteamento para sistemas estritamente diagonal dominantes (como os de splines).
+
+    Args:
+        inferior (np.ndarray): Subdiagonal (inferior[0] é ignorado).
+        diagonal (np.ndarray): Diagonal principal.
+        superior (np.ndarray): Superdiagonal (superior[-1] é ignorado).
+        d (np.ndarray): Lado direito.
+
+    Returns:
+        np.ndarray: A solução do sistema.
+    """
+    n = len(diagonal)
+    if n == 1:
+        return d / diagonal
+
+    # Uma equação trivial em cada ponta evita tratar os extremos separadamente
+    a = np.concatenate(([0.0, 0.0], inferior[1:], [0.0]))
+    b = np.concatenate(([1.0], diagonal, [1.0]))
+    c = np.concatenate(([0.0], superior[:-1], [0.0, 0.0]))
+    d = np.concatenate(([0.0], d, [0.0]))
+
+    pares = np.arange(1, n + 1, 2)
+    alfa = -a[pares] / b[pares - 1]
+    gama = -c[pares] / b[pares + 1]
+    reduzido = _resolver_tridiagonal(alfa * a[pares - 1],
+                                     b[pares] + alfa * c[pares - 1] + gama * a[pares + 1],
+                                     gama * c[pares + 1],
+                                     d[pares] + alfa * d[pares - 1] + gama * d[pares + 1])
+
+    x = np.zeros(n + 2)
+    x[pares] = reduzido
+    impares = np.arange(2, n + 1, 2)
+    x[impares] = (d[impares] - a[impares] * x[impares - 1] - c[impares] * x[impares + 1]) / b[impares]
+    return x[1:-1]
+
+
+class _PiecewiseCubic(RealFunction):
+    """
+    Base das funções cúbicas por partes: em cada intervalo [x_i, x_(i+1)], com s = x - x_i,
+        p(x) = a_i + s (b_i + s (c_i + s d_i)),
+    montada a partir dos valores y_i e das inclinações m_i nos nós (forma de Hermite). Guarda
+    O(n) coeficientes e avalia em O(log n) por ponto, com uma única busca binária
+    (np.searchsorted) para arrays. Fora de [x_0, x_n] usa o polinômio do intervalo da ponta.
+    """
+
+    def __init__(self, x: Sequence[float], y: Sequence[float], inclinacoes: Sequence[float], domain: Optional[Interval] = None):
+        self.X = np.asarray(x, dtype=float)
+        self.Y = np.asarray(y, dtype=float)
+        self.domain = domain if domain else Interval(self.X[0], self.X[-1])
+
+        m = np.asarray(inclinacoes, dtype=float)
+        h = np.diff(self.X)
+        delta = np.diff(self.Y) / h
+        self._a = self.Y[:-1]
+        self._b = m[:-1]
+        self._c = (3 * delta - 2 * m[:-1] - m[1:]) / h
+        self._d = (m[:-1] + m[1:] - 2 * delta) / h**2
+        self._acumulada = None
+        self.f = self.evaluate # O Callable principal para RealFunction
+
+    @staticmethod
+    def _validar(x: Sequence[float], y: Sequence[float]) -> None:
+        if len(x) != len(y) or len(x) < 2:
+            raise ValueError(f"x and y must have the same length ({len(x)} != {len(y)}) and have atleast 2 points.")
+        if np.any(np.diff(np.asarray(x, dtype=float)) <= 0):
+            raise ValueError("The values of x must be strictly increasing.")
+
+    def _localizar(self, v):
+        """Índice do intervalo de cada ponto e a distância s ao nó esquerdo."""
+        i = np.clip(np.searchsorted(self.X, v, side='right') - 1, 0, len(self.X) - 2)
+        return i, v - self.X[i]
+
+    @staticmethod
+    def _saida(v, resultado):
+        return float(resultado) if np.ndim(v) == 0 else resultado
+
+    def evaluate(self, x):
+        """Avalia a função em x (escalar ou np.ndarray)."""
+        v = np.asarray(x, dtype=float)
+        i, s = self._localizar(v)
+        return self._saida(v, self._a[i] + s * (self._b[i] + s * (self._c[i] + s * self._d[i])))
+
+    @property
+    def fast(self) -> Callable[[float], float]:
+        return self.evaluate
+
+    def _derivada(self, x):
+        v = np.asarray(x, dtype=float)
+        i, s = self._localizar(v)
+        return self._saida(v, self._b[i] + s * (2 * self._c[i] + 3 * s * self._d[i]))
+
+    @property
+    def prime(self) -> Callable[[float], float]: #type: ignore
+        """Retorna a função (vetorizada) que avalia a derivada, contínua nos nós."""
+        return self._derivada
+
+    def _primitiva(self, v: np.ndarray) -> np.ndarray:
+        """Primitiva F com F(x_0) = 0: integrais dos intervalos acumuladas mais o trecho final."""
+        if self._acumulada is None:
+            h = np.diff(self.X)
+            porIntervalo = h * (self._a + h * (self._b / 2 + h * (self._c / 3 + h * self._d / 4)))
+            self._acumulada = np.concatenate(([0.0], np.cumsum(porIntervalo)))
+        i, s = self._localizar(v)
+        return self._acumulada[i] + s * (self._a[i] + s * (self._b[i] / 2 + s * (self._c[i] / 3 + s * self._d[i] / 4)))
+
+    def integrar(self, a: Optional[float] = None, b: Optional[float] = None):
+        """
+        Calcula a integral exata da função entre a e b (os polinômios de cada intervalo são
+        integrados analiticamente). As integrais dos intervalos são acumuladas uma única vez,
+        e cada integral custa O(log n); a e b também podem ser arrays.
+
+        Args:
+            a (Optional[float]): Limite inferior (padrão: o primeiro nó).
+            b (Optional[float]): Limite superior (padrão: o último nó).
+
+        Returns:
+            float | np.ndarray: A integral de a até b.
+        """
+        a = self.X[0] if a is None else a
+        b = self.X[-1] if b is None else b
+        va, vb = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+        resultado = self._primitiva(vb) - self._primitiva(va)
+        return float(resultado) if resultado.ndim == 0 else resultado
+
+
+class CubicSpline(_PiecewiseCubic):
+    def __init__(self, x: Sequence[float], y: Sequence[float], domain: Optional[Interval] = None,
+                 contorno: str = 'natural', dy: Optional[Tuple[float, float]] = None):
+        self._validar(x, y)
+        if contorno not in ('natural', 'clamped', 'not-a-knot'):
+            raise ValueError(f"Condição de contorno desconhecida: {contorno!r}. Use 'natural', 'clamped' ou 'not-a-knot'.")
+        if (contorno == 'clamped') != (dy is not None):
+            raise ValueError("dy (as derivadas nas duas pontas) deve ser dado se, e somente se, contorno='clamped'.")
+        self.contorno = contorno
+        super().__init__(x, y, self._inclinacoes(np.asarray(x, dtype=float), np.asarray(y, dtype=float), contorno, dy), domain)
+
+    @staticmethod
+    def _inclinacoes(X: np.ndarray, Y: np.ndarray, contorno: str, dy: Optional[Tuple[float, float]]) -> np.ndarray:
+        """
+        Inclinações m_i da spline (primeira derivada nos nós), pelo sistema tridiagonal
+            h_i m_(i-1) + 2 (h_(i-1) + h_i) m_i + h_(i-1) m_(i+1) = 3 (h_i delta_(i-1) + h_(i-1) delta_i),
+        que impõe a continuidade da segunda derivada nos nós internos, mais as duas condições
+        de contorno. O sistema é resolvido em O(n) por _resolver_tridiagonal.
+        """
+        n = len(X)
+        h = np.diff(X)
+        delta = np.diff(Y) / h
+
+        if contorno == 'clamped':
+            if n == 2:
+                return np.array(dy, dtype=float)
+        elif n == 2:
+            return np.array([delta[0], delta[0]])
+        elif contorno == 'not-a-knot' and n == 3:
+            # Com três nós, not-a-knot é a parábola que passa pelos três pontos
+            c2 = (delta[1] - delta[0]) / (X[2] - X[0])
+            return delta[0] + c2 * (2 * X - X[0] - X[1])
+
+        inferior = np.zeros(n)
+        diagonal = np.empty(n)
+        superior = np.zeros(n)
+        d = np.empty(n)
+        inferior[1:-1] = h[1:]
+        diagonal[1:-1] = 2 * (h[:-1] + h[1:])
+        superior[1:-1] = h[:-1]
+        d[1:-1] = 3 * (h[1:] * delta[:-1] + h[:-1] * delta[1:])
+
+        if contorno == 'natural':
+            # segunda derivada nula nas pontas
+            diagonal[0], superior[0], d[0] = 2.0, 1.0, 3 * delta[0]
+            inferior[-1], diagonal[-1], d[-1] = 1.0, 2.0, 3 * delta[-1]
+            return _resolver_tridiagonal(inferior, diagonal, superior, d)
+
+        if contorno == 'clamped':
+            diagonal[0], d[0] = 1.0, dy[0]
+            diagonal[-1], d[-1] = 1.0, dy[1]
+            return _resolver_tridiagonal(inferior, diagonal, superior, d)
+
+        # not-a-knot: terceira derivada contínua no segundo e no penúltimo nós. As equações
+        #     h1 m0 + (h0 + h1) m1 = r0   e   (h(n-3) + h(n-2)) m(n-2) + h(n-3) m(n-1) = r(n-1)
+        # não são diagonal dominantes; elas são subtraídas das equações vizinhas para eliminar
+        # m0 e m(n-1), o sistema em m1..m(n-2) é resolvido e as pontas são recuperadas depois.
+        s0 = h[0] + h[1]
+        r0 = ((h[0] + 2 * s0) * h[1] * delta[0] + h[0]**2 * delta[1]) / s0
+        sn = h[-2] + h[-1]
+        rn = (h[-1]**2 * delta[-2] + (2 * sn + h[-1]) * h[-2] * delta[-1]) / sn
+
+        inferior[1], diagonal[1], d[1] = 0.0, s0, d[1] - r0
+        superior[-2], diagonal[-2], d[-2] = 0.0, sn, d[-2] - rn
+        m = np.empty(n)
+        m[1:-1] = _resolver_tridiagonal(inferior[1:-1], diagonal[1:-1], superior[1:-1], d[1:-1])
+        m[0] = (r0 - s0 * m[1]) / h[1]
+        m[-1] = (rn - sn * m[-2]) / h[-2]
+        return m
+
+
+def spline_interp(x: Sequence[float], y: Sequence[float], domain: Optional[Interval] = None,
+                  contorno: str = 'natural', dy: Optional[Tuple[float, float]] = None) -> CubicSpline:
+    """
+    Cria uma spline cúbica interpoladora (C2) a partir de um conjunto de coordenadas X, Y.
+
+    As inclinações nos nós saem de um sistema tridiagonal resolvido em O(n), então a
+    construção escala para milhões de nós; a avaliação custa O(log n) por ponto.
+
+    Args:
+        x (Sequence[float]): Coordenadas no eixo X (estritamente crescentes).
+        y (Sequence[float]): Valores de Y nas respectivas coordenadas.
+        domain (Optional[Interval]): domínio da função (padrão: [x_0, x_n])
+        contorno (str): Condição de contorno: 'natural' (segunda derivada nula nas pontas),
+            'clamped' (primeira derivada dada nas pontas, em dy) ou 'not-a-knot' (terceira
+            derivada contínua no segundo e no penúltimo nós).
+        dy (Optional[Tuple[float, float]]): Derivadas em x_0 e x_n, apenas para 'clamped'.
+
+    Returns:
+        CubicSpline: Uma classe chamável que avalia a spline, com prime e integrar.
+
+    Raises:
+        ValueError: Se x e y tiverem comprimentos diferentes, contiverem menos de dois pontos,
+            se x não for estritamente crescente ou se a condição de contorno for inválida.
+
+    Examples:
+        >>> s = spline_interp([0, 1, 2, 3], [0, 1, 8, 27], contorno='not-a-knot')  # x^3
+        >>> print(s(1.5))
+        3.375
+    """
+    return CubicSpline(x, y, domain, contorno, dy)
+
+
+class PiecewiseCubicHermite(_PiecewiseCubic):
+    def __init__(self, x: Sequence[float], y: Sequence[float], dy: Optional[Sequence[float]] = None, domain: Optional[Interval] = None):
+        self._validar(x, y)
+        if dy is not None and len(dy) != len(x):
+            raise ValueError(f"x and dy must have the same length ({len(x)} != {len(dy)}).")
+        X, Y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        self.DY = np.asarray(dy, dtype=float) if dy is not None else self._inclinacoes_monotonas(X, Y)
+        super().__init__(X, Y, self.DY, domain)
+
+    @staticmethod
+    def _inclinacoes_monotonas(X: np.ndarray, Y: np.ndarray) -> np.ndarray:
+        """
+        Inclinações que preservam a forma dos dados (Fritsch–Carlson, na variante de
+        Fritsch–Butland): zero nos extremos locais (onde delta muda de sinal) e, nos demais
+        nós internos, a média harmônica ponderada das inclinações vizinhas,
+            m_i = (w1 + w2) / (w1 / delta_(i-1) + w2 / delta_i),
+        com w1 = 2 h_i + h_(i-1) e w2 = h_i + 2 h_(i-1). Nas pontas, a fórmula de três pontos
+        limitada para não criar extremos. Em dados monótonos a função é monótona.
+        """
+        h = np.diff(X)
+        delta = np.diff(Y) / h
+        m = np.empty(len(X))
+        if len(X) == 2:
+            m[:] = delta[0]
+            return m
+
+        w1 = 2 * h[1:] + h[:-1]
+        w2 = h[1:] + 2 * h[:-1]
+        mesmoSinal = delta[:-1] * delta[1:] > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            media = (w1 + w2) / (w1 / delta[:-1] + w2 / delta[1:])
+        m[1:-1] = np.where(mesmoSinal, media, 0.0)
+
+        def ponta(h0, h1, d0, d1):
+            mi = ((2 * h0 + h1) * d0 - h0 * d1) / (h0 + h1)
+            if np.sign(mi) != np.sign(d0):
+                return 0.0
+            if np.sign(d0) != np.sign(d1) and abs(mi) > 3 * abs(d0):
+                return 3 * d0
+            return mi
+
+        m[0] = ponta(h[0], h[1], delta[0], delta[1])
+        m[-1] = ponta(h[-1], h[-2], delta[-1], delta[-2])
+        return m
+
+
+def pchip_interp(x: Sequence[float], y: Sequence[float], dy: Optional[Sequence[float]] = None, domain: Optional[Interval] = None) -> PiecewiseCubicHermite:
+    """
+    Cria uma interpolação cúbica de Hermite por partes (C1) a partir de um conjunto de
+    coordenadas X, Y e, opcionalmente, das derivadas nos nós.
+
+    Ao contrário de hermite_interp, que constrói um único polinômio global, cada intervalo tem
+    a sua cúbica, determinada pelos valores e derivadas nas suas duas pontas: memória O(n) e
+    avaliação O(log n) por ponto, sem oscilações entre os nós. Sem dy, as derivadas são
+    estimadas para preservar a forma dos dados (PCHIP: monotonia e extremos locais).
+
+    Args:
+        x (Sequence[float]): Coordenadas no eixo X (estritamente crescentes).
+        y (Sequence[float]): Valores de Y nas respectivas coordenadas.
+        dy (Optional[Sequence[float]]): Derivadas nas respectivas coordenadas (opcional).
+        domain (Optional[Interval]): domínio da função (padrão: [x_0, x_n])
+
+    Returns:
+        PiecewiseCubicHermite: Uma classe chamável que avalia a interpolação, com prime e integrar.
+
+    Raises:
+        ValueError: Se x, y (e dy) tiverem comprimentos diferentes, contiverem menos de dois
+            pontos ou se x não for estritamente crescente.
+
+    Examples:
+        >>> p = pchip_interp([0, 1, 2, 3], [0, 0, 1, 1])
+        >>> print(p(0.5), p(2.5))
+        0.0 1.0
+    """
+    return PiecewiseCubicHermite(x, y, dy, domain)
+
+
+class GridInterpolation2D:
+    """
+    Interpolação de uma tabela z_ij = f(x_i, y_j) em uma grade retangular (nós crescentes e
+    possivelmente irregulares em cada eixo), bilinear ou bicúbica.
+
+    Cada eixo é localizado com a mesma busca da interpolação linear por partes (a função
+    identidade em PiecewiseLinearFunction): uma busca binária vetorizada por eixo, ou a conta
+    direta em O(1) quando o eixo é uniforme. Na célula [x_i, x_(i+1)] x [y_j, y_(j+1)]:
+        - 'bilinear': média ponderada dos quatro cantos;
+        - 'bicubico': produto tensorial das cúbicas de Hermite, com as derivadas f_x, f_y e f_xy
+          nos nós estimadas por diferenças finitas de segunda ordem (np.gradient). Reproduz
+          exatamente polinômios de grau até 2 e é C1 entre as células.
+    Fora da grade extrapola com a célula da borda, como PiecewiseLinearFunction.
+    """
+
+    def __init__(self, x: Sequence[float], y: Sequence[float], z, metodo: str = 'bilinear',
+                 domain: Optional[Tuple[Interval, Interval]] = None):
+        if metodo not in ('bilinear', 'bicubico'):
+            raise ValueError(f"Método desconhecido: {metodo!r}. Use 'bilinear' ou 'bicubico'.")
+        self.X = np.asarray(x, dtype=float)
+        self.Y = np.asarray(y, dtype=float)
+        self.Z = np.asarray(z, dtype=float)
+        if len(self.X) < 2 or len(self.Y) < 2:
+            raise ValueError("There must be atleast 2 points in each axis.")
+        if self.Z.shape != (len(self.X), len(self.Y)):
+            raise ValueError(f"z must have shape (len(x), len(y)) = {(len(self.X), len(self.Y))}, not {self.Z.shape}.")
+        if np.any(np.diff(self.X) <= 0) or np.any(np.diff(self.Y) <= 0):
+            raise ValueError("The values of x and y must be strictly increasing.")
+
+        self.metodo = metodo
+        self.domain = domain if domain else (Interval(self.X[0], self.X[-1]), Interval(self.Y[0], self.Y[-1]))
+        self._eixos = (PiecewiseLinearFunction(self.X, self.X), PiecewiseLinearFunction(self.Y, self.Y))
+        self.uniforme = (self._eixos[0].uniforme, self._eixos[1].uniforme)
+
+        if metodo == 'bicubico':
+            ordemX = 2 if len(self.X) > 2 else 1
+            ordemY = 2 if len(self.Y) > 2 else 1
+            dzdx = np.gradient(self.Z, self.X, axis=0, edge_order=ordemX)
+            dzdy = np.gradient(self.Z, self.Y, axis=1, edge_order=ordemY)
+            dzdxdy = np.gradient(dzdx, self.Y, axis=1, edge_order=ordemY)
+            # Os quatro dados de cada nó juntos: um único acesso por canto da célula
+            self._nos = np.stack([self.Z, dzdx, dzdy, dzdxdy], axis=-1)
+
+    def _localizar(self, x, y):
+        """Índices (i, j) da célula de cada ponto e as coordenadas locais (tx, ty), 0 <= t <= 1 dentro da grade."""
+        eixoX, eixoY = self._eixos
+        i = eixoX._segmentos(x)
+        j = eixoY._segmentos(y)
+        hx = self.X[i + 1] - self.X[i]
+        hy = self.Y[j + 1] - self.Y[j]
+        return i, j, (x - self.X[i]) / hx, (y - self.Y[j]) / hy, hx, hy
+
+    def evaluate(self, x, y):
+        """
+        Avalia a interpolação nos pontos (x, y), sem checar o domínio. x e y podem ser escalares
+        ou np.ndarray (com broadcast entre eles).
+        """
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        i, j, tx, ty, hx, hy = self._localizar(x, y)
+
+        if self.metodo == 'bilinear':
+            Z = self.Z
+            resultado = (1 - ty) * ((1 - tx) * Z[i, j] + tx * Z[i + 1, j]) + ty * ((1 - tx) * Z[i, j + 1] + tx * Z[i + 1, j + 1])
+        else:
+            # Bases de Hermite: valor (phi) e derivada (psi, já multiplicada pelo passo) em cada ponta
+            phiX = (1 + 2 * tx) * (1 - tx)**2, tx**2 * (3 - 2 * tx)
+            psiX = hx * tx * (1 - tx)**2, hx * tx**2 * (tx - 1)
+            phiY = (1 + 2 * ty) * (1 - ty)**2, ty**2 * (3 - 2 * ty)
+            psiY = hy * ty * (1 - ty)**2, hy * ty**2 * (ty - 1)
+            resultado = np.zeros(x.shape)
+            for a in (0, 1):
+                for b in (0, 1):
+                    no = self._nos[i + a, j + b]
+                    resultado += (phiX[a] * (phiY[b] * no[..., 0] + psiY[b] * no[..., 2])
+                                  + psiX[a] * (phiY[b] * no[..., 1] + psiY[b] * no[..., 3]))
+
+        return float(resultado) if resultado.ndim == 0 else resultado
+
+    def __call__(self, x, y):
+        dominioX, dominioY = self.domain
+        if x in dominioX and y in dominioY:
+            return self.evaluate(x, y)
+        raise Exception("The number is out of the domain")
+
+
+def grid_interp(x: Sequence[float], y: Sequence[float], z, metodo: str = 'bilinear',
+                domain: Optional[Tuple[Interval, Interval]] = None) -> GridInterpolation2D:
+    """
+    Cria uma interpolação 2-D de uma tabela z_ij = f(x_i, y_j) em uma grade retangular.
+
+    Os pontos são localizados com uma busca binária vetorizada por eixo (O(1) por ponto em
+    eixos uniformes), então arrays de consultas são avaliados de uma vez, sem laço em Python.
+
+    Args:
+        x (Sequence[float]): Nós no eixo X (estritamente crescentes).
+        y (Sequence[float]): Nós no eixo Y (estritamente crescentes).
+        z: Valores na grade, com formato (len(x), len(y)).
+        metodo (str): 'bilinear' (padrão) ou 'bicubico' (Hermite bicúbico, C1).
+        domain (Optional[Tuple[Interval, Interval]]): Domínio em cada eixo (padrão: os limites da grade).
+
+    Returns:
+        GridInterpolation2D: Uma classe chamável f(x, y).
+
+    Raises:
+        ValueError: Se um eixo tiver menos de dois nós ou não for estritamente crescente, se z
+            não tiver o formato (len(x), len(y)) ou se o método for desconhecido.
+
+    Examples:
+        >>> f = grid_interp([0, 1, 2], [0, 1], [[0, 1], [1, 2], [2, 3]])
+        >>> print(f(0.5, 0.5))
+        1.0
+    """
+    return GridInterpolation2D(x, y, z, metodo, domain)
+
 if __name__ == "__main__":
+    import matplotlib.pyplot as plt
 
 # --- Teste da linear_interp ---
     x = [0, 1, 2, 3, 4]
@@ -1,47 +1,145 @@
-from typing import List, Tuple, Callable, Optional, cast
+from typing import List, Tuple, Callable, Optional, Sequence, Union, cast
+from collections import namedtuple
 # Tentar executar localmente a partir da pasta geral do repositório vai dar erro, mas é assim mesmo que deve estar para o deploy.
 # Se quiser testar localmente use o comando 'python -m CB2325NumericaG6.polinomios' sem as aspas.
 from .core import RealFunction, Interval, Domain, safe_intersect
 from sys import float_info
+import numpy as np
+
+# Número máximo de pontos por matriz de Vandermonde em Polinomio.avaliar_multiponto
+_MULTIPONTO_LOTE = 4096
+
+# Número de iterações seguidas sem progresso, no nível do erro de arredondamento, após as quais
+# a iteração de Aberth termina (ver _raizes_aberth)
+_ABERTH_ESTAGNACAO = 3
+
+# Tamanho dos blocos que _compor resolve por Horner dentro da divisão e conquista
+_COMPOSICAO_BASE = 64
+
+# Estatísticas do cache de um PolinomioCongelado (mesmos campos de functools.lru_cache)
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'currsize'])
 
 class Polinomio(RealFunction):
     """
-    Representa um polinômio como uma lista de coeficientes, ordenados 
+    Representa um polinômio como um array de coeficientes (float64 contíguo), ordenados 
     do termo de **maior grau** para o termo constante.
 
     P[0] é o coeficiente do maior grau, e o grau é dado por len(P) - 1.
     Exemplo: O polinômio P(x) = 3x^2 + 2x - 1 é representado por [3.0, 2.0, -1.0].
+
+    A classe usa __slots__ para que cada instância guarde apenas o array de coeficientes,
+    o domínio e o cache da derivada, sem __dict__.
     """
 
+    __slots__ = ('_values', 'domain', '_primeFunc')
+
     # Importa o epsilon de maquina do sistema
     BASE_TOLERANCE = float_info.epsilon 
 
-    def __init__(self, values: List[float], domain: Optional[Interval] = None):
-        maxAbsCoeff = max((abs(v) for v in values), default=1.0)
-        
-        # Calcula a tolerância relativa para o polinomio
-        self.TOLERANCE = self.BASE_TOLERANCE * maxAbsCoeff
+    # Tamanho até o qual _limpar usa floats do Python em vez de reduções do NumPy
+    _LIMPAR_PEQUENO = 16
 
-        if self.TOLERANCE == 0.0:
-            self.TOLERANCE = self.BASE_TOLERANCE
+    # Número de coeficientes do quociente a partir do qual dividir_por usa a divisão pelo
+    # inverso do divisor em vez da divisão longa (ver benchmarks/bench_divisao.py)
+    DIVISAO_RECIPROCO_CROSSOVER = 16
 
-        self._values = [
-            float(v) if abs(v) >= self.TOLERANCE else 0.0
-            for v in values
-        ]
+    # Número de coeficientes (do menor fator) a partir do qual o produto de polinômios
+    # usa convolução por FFT em vez da convolução direta (ver benchmarks/bench_multiplicacao.py)
+    FFT_CROSSOVER = 384
 
-        if self._values and abs(self._values[0]) < self.TOLERANCE:
-            self._clearZeros()
+    # Grau (e número mínimo de pontos) a partir do qual evaluate com arrays usa a avaliação
+    # multiponto em blocos (ver avaliar_multiponto e benchmarks/bench_multiponto.py)
+    MULTIPONTO_CROSSOVER = 128
+    MULTIPONTO_MIN_PONTOS = 64
 
-        self.f = lambda x: self.evaluate(x)
+    # Número de coeficientes a partir do qual shift e compose usam a composição por divisão e
+    # conquista em vez do esquema de Horner (ver benchmarks/bench_composicao.py)
+    COMPOSICAO_CROSSOVER = 1024
+
+    # Grau a partir do qual raizes() usa a iteração de Aberth–Ehrlich em vez dos autovalores
+    # da matriz companheira (ver benchmarks/bench_raizes.py)
+    RAIZES_ABERTH_CROSSOVER = 250
+
+    # Tamanho relativo (maior coeficiente do resto / maior coeficiente do dividendo) abaixo do
+    # qual sequencia_sturm considera o resto nulo. Com raízes múltiplas o resto exato é zero,
+    # mas em ponto flutuante sobra ruído de arredondamento (~1e-13), que seria normalizado
+    # para coeficientes O(1) e estragaria as contagens
+    STURM_RESTO_RELATIVO = 1e-10
+
+    def __init__(self, values: List[float], domain: Optional[Interval] = None):
+        coef = np.array(values, dtype=float)
+        if coef.ndim != 1:
+            coef = coef.ravel()
+        self._values = self._limpar(coef)
         self.domain = domain
         self._primeFunc = None
 
+    @classmethod
+    def _limpar(cls, coef: np.ndarray) -> np.ndarray:
+        """
+        Função interna que zera os coeficientes abaixo da tolerância relativa e remove os 0s dos líderes.
+        Modifica coef no lugar quando possível.
+        """
+        if coef.size == 0:
+            return np.zeros(1)
+
+        if coef.size <= cls._LIMPAR_PEQUENO:
+            # Para poucos coeficientes, as reduções do NumPy custam mais que um laço em floats
+            absCoef = [abs(c) for c in coef.tolist()]
+            tolerance = cls.BASE_TOLERANCE * max(absCoef)
+            if tolerance == 0.0:
+                return np.zeros(1)
+            if min(absCoef) < tolerance:
+                coef[np.abs(coef) < tolerance] = 0.0
+        else:
+            absCoef = np.abs(coef)
+            tolerance = cls.BASE_TOLERANCE * absCoef.max()
+            if tolerance == 0.0:
+                return np.zeros(1)
+            coef[absCoef < tolerance] = 0.0
+
+        if coef[0] != 0.0:
+            return coef
+
+        naoNulos = np.flatnonzero(coef)
+        if naoNulos.size == 0:
+            return np.zeros(1)
+        # Copia para não manter o array original (maior) vivo através de uma view
+        return coef[naoNulos[0]:].copy()
+
+    @classmethod
+    def _from_array(cls, coef: np.ndarray, domain: Optional[Interval] = None) -> 'Polinomio':
+        """
+        Construtor interno para arrays que já estão limpos (líder não nulo e coeficientes
+        acima da tolerância), e.g. resultados de negação ou multiplicação por escalar não nulo.
+        """
+        P = cls.__new__(cls)
+        P._values = coef
+        P.domain = domain
+        P._primeFunc = None
+        return P
+
+    @property
+    def TOLERANCE(self) -> float:
+        """Tolerância relativa do polinômio: epsilon de máquina vezes o maior coeficiente em módulo."""
+        tolerance = self.BASE_TOLERANCE * float(np.abs(self._values).max())
+        return tolerance if tolerance != 0.0 else self.BASE_TOLERANCE
+
+    @property
+    def f(self) -> Callable[[float], float]: # type: ignore
+        return self.evaluate
+
     def __call__(self, x) -> float:
-        return super().__call__(x)
+        if self.domain is None:
+            return self.evaluate(x)
+        return self.eval_safe(x)
+
+    @property
+    def fast(self) -> Callable[[float], float]:
+        return self.evaluate
     
     def __repr__(self):
-        return str(self._values)
+        return str(self._values.tolist())
     
     def __len__(self):
         return len(self._values)
@@ -51,9 +149,9 @@ class Polinomio(RealFunction):
         if abs(index) >= size:
             raise IndexError("index out of range")
         elif index < 0:
-            return self._values[size + index]
+            return float(self._values[size + index])
         else:
-            return self._values[index]
+            return float(self._values[index])
 
     def __setitem__(self, index: int, value: float):
         size = len(self._values)
@@ -63,31 +161,16 @@ class Polinomio(RealFunction):
             self._values[size + index] = value
         else:
             self._values[index] = value
+        # A derivada guardada em cache deixa de valer
+        self._primeFunc = None
 
-    def __key(self):
-        return (self._values)
+    def _chave(self) -> bytes:
+        # Somar 0.0 troca -0.0 por 0.0, que são iguais para __eq__
+        return (self._values + 0.0).tobytes()
 
     def __hash__(self):
-        return hash(self.__key())
-
-    def _clearZeros(self):
-        """
-        Função interna para remover os 0s dos líderes
-        """
-        count = 0
-        for coef in self._values:
-            if coef == 0.0:
-                count += 1
-            else:
-                break
-        
-        if count == len(self._values):
-            self._values = []
-        elif count> 0:
-            self._values = self._values[count:]
-        
-        if not self._values:
-            self._values.append(0.0)
+        # Um hash que muda com __setitem__ corromperia dicionários e caches que já guardam o objeto
+        raise TypeError(f"'{type(self).__name__}' é mutável e não é hashable; use congelar().")
 
     @property
     def degree(self) -> int:
@@ -95,13 +178,12 @@ class Polinomio(RealFunction):
     
     @property
     def isZero(self) -> bool:
-        return self._values == [0.0]
+        return self._values.size == 1 and self._values[0] == 0.0
     
     @property
     def prime(self): # type: ignore
         if self._primeFunc is None:
-            polinomio_derivado = self.derivar()
-            self._primeFunc = lambda x: polinomio_derivado.evaluate(x) 
+            self._primeFunc = self.derivar().evaluate
         return self._primeFunc
     
     def evaluate(self, x: float) -> float:
@@ -110,11 +192,15 @@ class Polinomio(RealFunction):
             
             P é uma lista de coeficientes em ordem decrescente: [c_n, ..., c_0].
             
+            Também aceita um np.ndarray de pontos, avaliados todos de uma vez
+            (cada passo de Horner é uma única operação sobre o array). Para graus a partir
+            de MULTIPONTO_CROSSOVER usa automaticamente avaliar_multiponto (só para pontos reais).
+
             Args:
-                x (float): O ponto onde o polinômio será avaliado.
+                x (float | np.ndarray): O ponto (ou pontos) onde o polinômio será avaliado.
                 
             Returns:
-                float: O valor P(x).
+                float | np.ndarray: O valor P(x).
             
             Examples:
                 >>> P = Polinomio([2,3,4])
@@ -123,79 +209,133 @@ class Polinomio(RealFunction):
                 9
 
         """
-        if not self._values:
-            return 0.0
-
-        resultado = self._values[0] 
+        if isinstance(x, np.ndarray):
+            # A avaliação multiponto é só para pontos reais; complexos seguem por Horner
+            if self.degree >= self.MULTIPONTO_CROSSOVER and x.size >= self.MULTIPONTO_MIN_PONTOS and np.isrealobj(x):
+                return self.avaliar_multiponto(x)
+            coeficientes = iter(self._values)
+            resultado = np.full(x.shape, next(coeficientes))
+        else:
+            # Para escalares, floats do Python são bem mais rápidos que np.float64
+            coeficientes = iter(self._values.tolist())
+            resultado = next(coeficientes)
         
-        for i in range(1, len(self._values)):
-            resultado = resultado * x + self._values[i]
+        for c in coeficientes:
+            resultado = resultado * x + c
             
         return resultado
     
-    def __mul__(self, other: float | int) -> 'Polinomio':
-        newValues = [c * float(other) for c in self._values]
-        return Polinomio(newValues, self.domain)
+    def avaliar_multiponto(self, x: np.ndarray, bloco: Optional[int] = None) -> np.ndarray:
+        """
+            Avalia o polinômio em muitos pontos de uma vez, para graus altos.
+
+            Os coeficientes são divididos em K blocos de B termos, P(x) = sum_k Q_k(x) (x^B)^k.
+            Todos os Q_k são avaliados em todos os pontos com um único produto de matrizes
+            (matriz de Vandermonde (m x B) vezes a matriz (B x K) de coeficientes, via BLAS), e
+            o resultado é combinado por Horner em x^B com apenas K passos sobre o array.
+            O número de operações continua O(n*m), mas são K ≈ sqrt(n) passadas sobre os pontos
+            em vez de n.
+
+            Args:
+                x (np.ndarray): Pontos de avaliação.
+                bloco (Optional[int]): Número B de termos por bloco. Default ≈ sqrt(grau + 1).
+
+            Returns:
+                np.ndarray: Os valores P(x), com o mesmo formato de x.
+        """
+        x = np.asarray(x, dtype=float)
+        pontos = x.reshape(-1)
+        crescentes = self._values[::-1]
+        n = len(crescentes)
+        if bloco is None:
+            bloco = int(min(256, max(16, np.sqrt(n))))
+        K = -(-n // bloco)
+
+        A = np.zeros(K * bloco)
+        A[:n] = crescentes
+        A = A.reshape(K, bloco).T
+
+        resultado = np.empty(pontos.shape)
+        # Limita a matriz de Vandermonde a _MULTIPONTO_LOTE linhas por vez
+        for inicio in range(0, len(pontos), _MULTIPONTO_LOTE):
+            xs = pontos[inicio:inicio + _MULTIPONTO_LOTE]
+            V = np.vander(xs, bloco, increasing=True)
+            Q = V @ A
+            potencia = xs * V[:, -1]
+            parcial = Q[:, -1].copy()
+            for k in range(K - 2, -1, -1):
+                parcial *= potencia
+                parcial += Q[:, k]
+            resultado[inicio:inicio + _MULTIPONTO_LOTE] = parcial
+
+        return resultado.reshape(x.shape)
+
+    def __mul__(self, other: 'float | int | Polinomio') -> 'Polinomio':
+        """
+        Multiplicação por escalar (c * P) ou produto de polinômios (P1 * P2).
+
+        O produto de polinômios é a convolução dos coeficientes: direta para graus pequenos
+        e por FFT quando ambos os fatores têm mais que FFT_CROSSOVER coeficientes.
+
+        Examples:
+            >>> Polinomio([1.0, 1.0]) * Polinomio([1.0, -1.0])
+            [1.0, 0.0, -1.0]
+        """
+        if isinstance(other, Polinomio):
+            newDomain = safe_intersect(self.domain, other.domain)
+            return Polinomio(_convolver(self._values, other._values), newDomain)
+
+        other = float(other)
+        if other == 0.0:
+            return Polinomio([0.0], self.domain)
+        return Polinomio._from_array(self._values * other, self.domain)
 
     def __rmul__(self, other: float | int) -> 'Polinomio':
         return self.__mul__(other)
     
     def __neg__(self) -> 'Polinomio':
-        new_values = [-c for c in self._values]
-        return Polinomio(new_values, self.domain)
+        return Polinomio._from_array(-self._values, self.domain)
     
     def __add__(self, other: 'Polinomio') -> 'Polinomio':
         """Adição de polinômios: P1 + P2 (Começando pelo termo de maior grau)"""
-        
-        newDomain = safe_intersect(self.domain, other.domain)
+        if not isinstance(other, Polinomio):
+            # Deixa o outro operando tratar a soma (e.g. PolinomioBatch.__radd__)
+            return NotImplemented
 
-        p1Coeffs = self._values
-        p2Coeffs = other._values
+        newDomain = safe_intersect(self.domain, other.domain)
 
-        len1 = len(p1Coeffs)
-        len2 = len(p2Coeffs)
-        maxLen = max(len1, len2)
-        
-        newCoeffs = [0.0] * maxLen
-        
-        for i in range(maxLen):
-            idx1 = len1 - 1 - i
-            idx2 = len2 - 1 - i
-            idx_res = maxLen - 1 - i
-            
-            c1 = p1Coeffs[idx1] if idx1 >= 0 else 0.0
-            c2 = p2Coeffs[idx2] if idx2 >= 0 else 0.0
-            
-            newCoeffs[idx_res] = c1 + c2
-            
-        return Polinomio(newCoeffs, newDomain)
+        return Polinomio._from_array(self._limpar(_somar(self._values, other._values)), newDomain)
     
     def __sub__(self, other: 'Polinomio') -> 'Polinomio':
-        negOther = -other 
-        return self + negOther
+        if not isinstance(other, Polinomio):
+            return NotImplemented
+        newDomain = safe_intersect(self.domain, other.domain)
+        return Polinomio._from_array(self._limpar(_somar(self._values, -other._values)), newDomain)
     
     def __eq__(self, other) -> bool:
         #Assume que ambos não tem coeficiente líderes 0.
         if not isinstance(other, Polinomio):
             return NotImplemented
-        return other._values == self._values
+        return np.array_equal(other._values, self._values)
 
     def dividir_por(self, divisor: 'Polinomio') -> Tuple['Polinomio', 'Polinomio']:
         """
             Realiza a divisão polinomial A / B (self / divisor) e retorna (Quociente, remainder).
 
+            A divisão longa é feita no lugar sobre um único buffer de coeficientes (ver _dividir);
+            quando o quociente tem mais que DIVISAO_RECIPROCO_CROSSOVER coeficientes, usa-se a
+            divisão rápida pelo inverso em série de potências do divisor.
+
             Args:
                 divisor (Polinomio): Polinomio divisor
-                tolerance (float, optional): Tolerância para checagem de zero, usado para
-                    tratar erros de ponto flutuante. O valor padrão é 1e-12.
 
             Returns:
-                Polinomio: Polinomio derivado
+                Tuple[Polinomio, Polinomio]: Quociente e resto da divisão
 
             Examples:
                 >>> p1 = Polinomio([4,6,8])
                 >>> p2 = Polinomio([2,3,4])
-                >>> print(p1.divideBy(p2))
+                >>> print(p1.dividir_por(p2))
                 ([2.0], [0.0])
         """
 
@@ -208,55 +348,25 @@ class Polinomio(RealFunction):
             return Polinomio([0.0], newDomain), Polinomio(self._values, newDomain)
         
         if divisor.degree == 0:
-            constante_divisor = divisor._values[0]
-            qCoeffs = [c / constante_divisor for c in self._values]
+            qCoeffs = self._values / divisor._values[0]
             return Polinomio(qCoeffs, newDomain), Polinomio([0.0], newDomain)
 
-        mainDivisor = divisor._values[0]
-        divisorDegree = divisor.degree
-        
-        quotientCoeffs = [0.0] * (self.degree - divisorDegree + 1)
-
-        remainder = Polinomio(self._values) 
-        
-        while remainder.degree >= divisorDegree:
-            mainRemainder = remainder._values[0]
-            
-            degreeDifference = remainder.degree - divisorDegree
-            
-            qCoeff = mainRemainder / mainDivisor
+        quotientCoeffs, remainderCoeffs = _dividir(self._values, divisor._values)
 
-            qIdx = self.degree - remainder.degree
-            quotientCoeffs[qIdx] = qCoeff
-    
-            multipliedTherm = divisor * qCoeff 
+        # Zera o que sobrou do cancelamento: abaixo da tolerância do próprio dividendo
+        remainderCoeffs[np.abs(remainderCoeffs) < self.TOLERANCE] = 0.0
 
-            shiftCoeffs = multipliedTherm._values + [0.0] * degreeDifference
-            thermToSub = Polinomio(shiftCoeffs)
-
-            remainder = remainder - thermToSub 
-
-        if remainder.degree < 0:
-            remainder = Polinomio([0.0], newDomain)
-
-        return Polinomio(quotientCoeffs, newDomain), remainder
+        return Polinomio(quotientCoeffs, newDomain), Polinomio(remainderCoeffs, newDomain)
     
     def _getPNeg(self) -> 'Polinomio':
         """
         Cria e retorna o polinômio auxiliar P(-x).
         Isso inverte o sinal dos coeficientes dos termos de grau ímpar.
         """
-        PNegCoeffs = []
-        
-        for i, coeff in enumerate(self._values):
-            degree = self.degree - i
-
-            if degree % 2 != 0:
-                PNegCoeffs.append(-coeff)
-            else:
-                PNegCoeffs.append(coeff)
-                
-        return Polinomio(PNegCoeffs, self.domain)
+        PNegCoeffs = self._values.copy()
+        # Termos de grau ímpar: o último coeficiente tem grau 0, o penúltimo grau 1, ...
+        PNegCoeffs[-2::-2] *= -1.0
+        return Polinomio._from_array(PNegCoeffs, self.domain)
     
     def get_limite_raizes(self) -> tuple[float, float]:
         """
@@ -268,7 +378,7 @@ class Polinomio(RealFunction):
             return 0.0, 0.0
         
         cn = self._values[0]
-        cMax = max(abs(c) for c in self._values[1:]) if self.degree > 0 else 0.0
+        cMax = float(np.abs(self._values[1:]).max()) if self.degree > 0 else 0.0
             
         if cMax == 0.0:
             L = 0.0
@@ -278,7 +388,7 @@ class Polinomio(RealFunction):
         pNeg = self._getPNeg() 
         
         cnNeg = pNeg._values[0]
-        cMaxNeg = max(abs(c) for c in pNeg._values[1:]) if pNeg.degree > 0 else 0.0
+        cMaxNeg = float(np.abs(pNeg._values[1:]).max()) if pNeg.degree > 0 else 0.0
         
         if cMaxNeg == 0.0:
             Lneg = 0.0
@@ -289,6 +399,201 @@ class Polinomio(RealFunction):
         
         return l, L
 
+    def raizes(self, metodo: Optional[str] = None, max_iter: int = 200) -> Tuple[np.ndarray, np.ndarray]:
+        """
+            Calcula todas as raízes (complexas) do polinômio, cada uma com uma estimativa de erro.
+
+            Raízes nulas (coeficientes constantes zerados) são separadas de forma exata. As demais
+            são calculadas por um dos métodos:
+                - 'companheira': autovalores da matriz companheira, O(n^3). Usado por padrão
+                  para graus menores que RAIZES_ABERTH_CROSSOVER.
+                - 'aberth': iteração simultânea de Aberth–Ehrlich, O(n^2) por iteração, com
+                  aproximações iniciais num círculo de raio (|c_0 / c_n|)^(1/n) e iterados
+                  mantidos dentro do limite de Cauchy dado por get_limite_raizes().
+
+            O erro de cada raiz z_i é o raio n * (|P(z_i)| + erro de arredondamento de Horner) /
+            |c_n * prod_{j != i} (z_i - z_j)|: a união dos discos com esses raios em torno das
+            aproximações contém todas as raízes de P, e um disco isolado contém exatamente uma.
+
+            Args:
+                metodo (Optional[str]): 'companheira', 'aberth' ou None (escolha pelo grau).
+                max_iter (int): Número máximo de iterações de Aberth.
+
+            Returns:
+                Tuple[np.ndarray, np.ndarray]: As raízes (complex128, ordenadas pela parte real e
+                depois pela imaginária) e as estimativas de erro (float64).
+
+            Raises:
+                ValueError: Se o polinômio for nulo ou o método for desconhecido.
+
+            Examples:
+                >>> raizes, erros = Polinomio([1.0, 0.0, -1.0]).raizes()
+                >>> raizes
+                array([-1.+0.j,  1.+0.j])
+        """
+        if self.isZero:
+            raise ValueError("O polinômio nulo não tem um conjunto finito de raízes.")
+        if metodo is None:
+            metodo = 'aberth' if self.degree >= self.RAIZES_ABERTH_CROSSOVER else 'companheira'
+        if metodo not in ('companheira', 'aberth'):
+            raise ValueError(f"Método desconhecido: {metodo!r}. Use 'companheira' ou 'aberth'.")
+
+        naoNulos = np.flatnonzero(self._values)
+        coef = self._values[:naoNulos[-1] + 1]
+        nulas = self.degree - (len(coef) - 1)
+
+        if len(coef) == 1:
+            z = np.zeros(0, dtype=complex)
+        elif metodo == 'companheira':
+            z = _raizes_companheira(coef)
+        else:
+            l, L = self.get_limite_raizes()
+            z = _raizes_aberth(coef, max(-float(l), float(L)), max_iter)
+
+        erros = _erro_raizes(coef, z)
+        z = np.concatenate([z, np.zeros(nulas, dtype=complex)])
+        erros = np.concatenate([erros, np.zeros(nulas)])
+        ordem = np.lexsort((z.imag, z.real))
+        return z[ordem], erros[ordem]
+
+    def sequencia_sturm(self) -> List['Polinomio']:
+        """
+            Calcula a sequência de Sturm do polinômio: P0 = P, P1 = P' e P(k+1) = -resto(P(k-1) / P(k)),
+            até o resto ser nulo (relativamente ao dividendo, ver STURM_RESTO_RELATIVO). O último termo
+            é então o mdc de P e P', não constante quando P tem raízes múltiplas.
+
+            Cada termo é normalizado pelo seu maior coeficiente em módulo: escalar por uma constante
+            positiva não altera as variações de sinal, e evita que os coeficientes estourem ou sumam
+            ao longo da sequência em graus altos.
+
+            Returns:
+                List[Polinomio]: A sequência [P0, P1, ..., Pm].
+        """
+        if self.degree == 0:
+            return [self]
+
+        sequence = [self, self.derivar()]
+        # As divisões usam P e P' também normalizados, para que a tolerância de dividir_por
+        # (relativa ao dividendo) não rejeite divisores normalizados com líder pequeno
+        anterior = self * (1.0 / float(np.abs(self._values).max()))
+        atual = sequence[1] * (1.0 / float(np.abs(sequence[1]._values).max()))
+        while True:
+            _, remainder = anterior.dividir_por(atual)
+            maior = float(np.abs(remainder._values).max())
+            if remainder.isZero or maior <= self.STURM_RESTO_RELATIVO:
+                break
+            anterior, atual = atual, remainder * (-1.0 / maior)
+            sequence.append(atual)
+
+        return sequence
+
+    def sequencia_sturm_lote(self) -> 'PolinomioBatch':
+        """
+            Retorna a sequência de Sturm como um PolinomioBatch, i.e. uma matriz de coeficientes
+            completada com zeros, que avalia todos os termos em um array de pontos de uma só vez.
+
+            Returns:
+                PolinomioBatch: O lote [P0, P1, ..., Pm] de sequencia_sturm().
+        """
+        return PolinomioBatch(self.sequencia_sturm())
+
+    def shift(self, a: float) -> 'Polinomio':
+        """
+            Retorna o polinômio deslocado R(x) = P(x + a) (deslocamento de Taylor).
+
+            O domínio acompanha a mudança de variável: R está definido em x quando x + a está
+            no domínio de P, i.e. em domain.shift(-a).
+
+            Args:
+                a (float): Deslocamento.
+
+            Returns:
+                Polinomio: P(x + a).
+
+            Examples:
+                >>> Polinomio([1.0, 0.0, 0.0]).shift(1.0)
+                [1.0, 2.0, 1.0]
+        """
+        a = float(a)
+        domain = None if self.domain is None else self.domain.shift(-a)
+        return Polinomio(_compor(self._values, np.array([1.0, a])), domain)
+
+    def scale(self, s: float) -> 'Polinomio':
+        """
+            Retorna o polinômio R(x) = P(s * x): o coeficiente de x^k é multiplicado por s^k.
+
+            O domínio passa a ser domain.scale(1 / s). Para s = 0, R é a constante P(0), que só
+            existe se 0 estiver no domínio de P.
+
+            Args:
+                s (float): Fator de escala.
+
+            Returns:
+                Polinomio: P(s * x).
+
+            Raises:
+                ValueError: Se s = 0 e 0 não estiver no domínio de P.
+
+            Examples:
+                >>> Polinomio([1.0, 1.0, 1.0]).scale(2.0)
+                [4.0, 2.0, 1.0]
+        """
+        s = float(s)
+        if s == 0.0:
+            if self.domain is not None and 0.0 not in self.domain:
+                raise ValueError("P(0 * x) não está definido: 0 está fora do domínio de P.")
+            return Polinomio([self._values[-1]])
+
+        domain = None if self.domain is None else self.domain.scale(1.0 / s)
+        return Polinomio(self._values * s ** np.arange(self.degree, -1, -1, dtype=float), domain)
+
+    def compose(self, other: 'Polinomio') -> 'Polinomio':
+        """
+            Retorna a composição R(x) = P(Q(x)), de grau deg(P) * deg(Q).
+
+            Até COMPOSICAO_CROSSOVER coeficientes usa o esquema de Horner sobre polinômios,
+            R = (...(c_n Q + c_(n-1)) Q + ...) + c_0; acima disso, divisão e conquista (ver _compor).
+
+            Domínio: R está definido onde Q está definido e Q(x) está no domínio de P. Para Q de
+            grau <= 1 essa pré-imagem é um intervalo e é calculada exatamente; para Q de grau
+            maior ela não é, em geral, um Interval, e o domínio de R é o de Q (a condição
+            Q(x) no domínio de P não é verificada).
+
+            Args:
+                other (Polinomio): O polinômio interno Q.
+
+            Returns:
+                Polinomio: P(Q(x)).
+
+            Raises:
+                ValueError: Se a pré-imagem do domínio de P por Q (de grau <= 1) for vazia.
+
+            Examples:
+                >>> Polinomio([1.0, 0.0, 0.0]).compose(Polinomio([1.0, 1.0]))
+                [1.0, 2.0, 1.0]
+        """
+        coef = _compor(self._values, other._values)
+
+        domain = other.domain
+        if self.domain is not None and other.degree <= 1:
+            if other.degree == 0:
+                if other._values[0] not in self.domain:
+                    raise ValueError("Q é constante e o seu valor está fora do domínio de P.")
+            else:
+                preImagem = self.domain.shift(-other._values[1]).scale(1.0 / other._values[0])
+                domain = preImagem if other.domain is None else other.domain.intersect(preImagem)
+                if domain is None:
+                    raise ValueError("A imagem de Q não encontra o domínio de P.")
+
+        return Polinomio(coef, domain)
+
+    def congelar(self) -> 'PolinomioCongelado':
+        """
+            Retorna uma cópia imutável (e hashable) do polinômio, com cache dos objetos derivados.
+            Ver PolinomioCongelado.
+        """
+        return PolinomioCongelado(self._values, self.domain)
+
     def derivar(self) -> 'Polinomio':
         """
             Retorna a derivada de um polinomio.
@@ -306,33 +611,541 @@ class Polinomio(RealFunction):
         if len(self) <= 1:
             return Polinomio([0])
         
-        derivative = []
-
-        for i in range(self.degree):
-            derivative.append(self[i]*(self.degree-i))
+        derivative = self._values[:-1] * np.arange(self.degree, 0, -1)
 
         return Polinomio(derivative, self.domain)
 
+class PolinomioCongelado(Polinomio):
+    """
+    Polinômio imutável: os coeficientes são somente leitura, __setitem__ e a troca de
+    atributos (incluindo domain) geram erro, e o hash é calculado uma única vez.
+
+    Como nada muda depois da construção, os objetos derivados são calculados na primeira
+    chamada e guardados na própria instância: derivar() (que também é congelado, então
+    as derivadas de ordem mais alta ficam em cache em cadeia), sequencia_sturm(),
+    get_limite_raizes() e raizes(). cache_info() expõe os acertos e as falhas do cache.
+
+    Por ser hashable, também pode ser usado como chave de dicionários ou de funções
+    decoradas com functools.lru_cache.
+
+    Examples:
+        >>> P = Polinomio([1.0, 0.0, -2.0]).congelar()
+        >>> P.derivar() is P.derivar()
+        True
+        >>> P.cache_info()
+        CacheInfo(hits=1, misses=1, currsize=1)
+    """
+
+    __slots__ = ('_cache', '_contagem', '_hash')
+
+    def __init__(self, values: List[float], domain: Optional[Interval] = None):
+        super().__init__(values, domain)
+        self._values.flags.writeable = False
+        self._cache = {}
+        # [acertos, falhas]
+        self._contagem = [0, 0]
+        self._hash = hash(self._chave())
+
+    def __setattr__(self, name, value):
+        # _hash é o último atributo definido em __init__
+        if hasattr(self, '_hash'):
+            raise AttributeError(f"'{type(self).__name__}' é imutável.")
+        object.__setattr__(self, name, value)
+
+    def __setitem__(self, index: int, value: float):
+        raise TypeError(f"'{type(self).__name__}' não permite alterar coeficientes.")
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        # A restauração padrão dos __slots__ passaria por __setattr__ depois de _hash já
+        # existir; reconstruir pelos coeficientes e pelo domínio refaz o objeto (com o cache vazio)
+        return (type(self), (self._values, self.domain))
+
+    def __copy__(self) -> 'PolinomioCongelado':
+        # Imutável: a cópia pode ser o próprio objeto (com o cache já calculado)
+        return self
+
+    def __deepcopy__(self, memo) -> 'PolinomioCongelado':
+        return self
+
+    def _memo(self, chave: str, calcular: Callable):
+        """Função interna que retorna o valor em cache para chave, calculando-o na primeira vez."""
+        try:
+            valor = self._cache[chave]
+        except KeyError:
+            self._contagem[1] += 1
+            valor = self._cache[chave] = calcular()
+        else:
+            self._contagem[0] += 1
+        return valor
+
+    def cache_info(self) -> CacheInfo:
+        """Retorna CacheInfo(hits, misses, currsize) do cache de objetos derivados."""
+        return CacheInfo(self._contagem[0], self._contagem[1], len(self._cache))
+
+    def cache_clear(self) -> None:
+        """Esvazia o cache e zera os contadores."""
+        self._cache.clear()
+        self._contagem[:] = [0, 0]
+
+    @property
+    def prime(self): # type: ignore
+        # Acessar prime não é uma consulta ao cache: só conta uma falha na primeira vez, quando
+        # a derivada ainda precisa ser calculada
+        derivada = self._cache.get('derivar')
+        if derivada is None:
+            derivada = self.derivar()
+        return derivada.evaluate
+
+    def congelar(self) -> 'PolinomioCongelado':
+        return self
+
+    def derivar(self) -> 'PolinomioCongelado':
+        return self._memo('derivar', lambda: Polinomio.derivar(self).congelar())
+
+    def sequencia_sturm(self) -> List['Polinomio']:
+        def calcular():
+            sequence = Polinomio.sequencia_sturm(self)
+            return tuple(p.congelar() for p in sequence)
+        return list(self._memo('sturm', calcular))
+
+    def sequencia_sturm_lote(self) -> 'PolinomioBatch':
+        return self._memo('sturm_lote', lambda: Polinomio.sequencia_sturm_lote(self))
+
+    def get_limite_raizes(self) -> tuple[float, float]:
+        return self._memo('limite_raizes', lambda: Polinomio.get_limite_raizes(self))
+
+    def raizes(self, metodo: Optional[str] = None, max_iter: int = 200) -> Tuple[np.ndarray, np.ndarray]:
+        def calcular():
+            z, erros = Polinomio.raizes(self, metodo, max_iter)
+            z.flags.writeable = False
+            erros.flags.writeable = False
+            return z, erros
+        return self._memo(('raizes', metodo, max_iter), calcular)
+
+def _convolver(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Convolução de dois arrays de coeficientes, i.e. os coeficientes do produto dos polinômios.
+
+    Usa a convolução direta O(n*m) quando algum dos fatores tem até Polinomio.FFT_CROSSOVER
+    coeficientes e a convolução por FFT, O((n+m) log(n+m)), caso contrário.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if min(len(a), len(b)) <= Polinomio.FFT_CROSSOVER:
+        return np.convolve(a, b)
+
+    n = len(a) + len(b) - 1
+    tamanho = 1 << (n - 1).bit_length()
+    return np.fft.irfft(np.fft.rfft(a, tamanho) * np.fft.rfft(b, tamanho), tamanho)[:n]
+
+def _dividir(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Divisão de arrays de coeficientes (ordem decrescente de grau), len(a) >= len(b) >= 2.
+    Retorna (quociente, resto) como arrays; o resto tem len(b) - 1 coeficientes.
+
+    Divisão longa (sintética) no lugar: o array de trabalho é uma única cópia de a; a cada
+    passo o coeficiente líder vira o coeficiente do quociente e a cauda do divisor escalada
+    é subtraída da janela seguinte. Para quocientes longos, usa _dividir_reciproco.
+    """
+    n, m = len(a), len(b)
+    k = n - m + 1
+    if k > Polinomio.DIVISAO_RECIPROCO_CROSSOVER:
+        return _dividir_reciproco(a, b)
+
+    buffer = np.array(a, dtype=float)
+    lider = b[0]
+    cauda = b[1:]
+    for i in range(k):
+        q = buffer[i] / lider
+        buffer[i] = q
+        if q != 0.0:
+            buffer[i + 1:i + m] -= q * cauda
+
+    return buffer[:k], buffer[k:]
+
+def _inverso_serie(b: np.ndarray, k: int) -> np.ndarray:
+    """
+    Primeiros k coeficientes (ordem crescente) da série de potências de 1/b(x), com b em
+    ordem crescente e b[0] != 0, pela iteração de Newton g <- g (2 - b g), que dobra a
+    precisão a cada passo.
+    """
+    g = np.array([1.0 / b[0]])
+    precisao = 1
+    while precisao < k:
+        precisao = min(2 * precisao, k)
+        erro = -_convolver(b[:precisao], g)[:precisao]
+        erro[0] += 2.0
+        g = _convolver(g, erro)[:precisao]
+    return g
+
+def _dividir_reciproco(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Divisão rápida de arrays de coeficientes (mesmo contrato de _dividir).
+
+    Lidos em ordem crescente, os arrays decrescentes de a e b são os polinômios revertidos
+    rev(A) e rev(B), e rev(Q) = rev(A) / rev(B) mod x^k, com k = len(a) - len(b) + 1. Com as
+    multiplicações de _convolver o custo é O(M(n)) em vez de O(n*m).
+    """
+    n, m = len(a), len(b)
+    k = n - m + 1
+    quociente = _convolver(a[:k], _inverso_serie(b, k))[:k]
+    resto = a[k:] - _convolver(b, quociente)[k:]
+    return quociente, resto
+
+def _compor(coef: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """
+    Coeficientes (ordem decrescente) de P(Q(x)).
+
+    Com até Polinomio.COMPOSICAO_CROSSOVER coeficientes usa Horner sobre polinômios. Acima
+    disso, divisão e conquista: com m = 2^k < n, P = H x^m + L e P(Q) = H(Q) Q^m + L(Q), onde
+    as potências Q^(2^k) são calculadas uma vez por quadrados sucessivos e os blocos de até
+    _COMPOSICAO_BASE coeficientes são resolvidos por Horner. Com os produtos por FFT de
+    _convolver, o custo do deslocamento de Taylor (Q = x + a) cai de O(n^2) para O(n log^2 n).
+    """
+    coef = np.asarray(coef, dtype=float)
+    q = np.asarray(q, dtype=float)
+    if len(coef) <= Polinomio.COMPOSICAO_CROSSOVER:
+        return _comporHorner(coef, q)
+
+    potencias = [q]
+    while 2 ** len(potencias) < len(coef):
+        potencias.append(_convolver(potencias[-1], potencias[-1]))
+    return _comporRecursivo(coef, potencias)
+
+def _comporHorner(coef: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """P(Q(x)) por Horner: R = (...(c_n Q + c_(n-1)) Q + ...) + c_0."""
+    resultado = coef[:1].copy()
+    for c in coef[1:]:
+        resultado = _convolver(resultado, q)
+        resultado[-1] += c
+    return resultado
+
+def _comporRecursivo(coef: np.ndarray, potencias: List[np.ndarray]) -> np.ndarray:
+    """Passo de _compor; potencias[k] são os coeficientes de Q^(2^k)."""
+    n = len(coef)
+    if n <= _COMPOSICAO_BASE:
+        return _comporHorner(coef, potencias[0])
+
+    k = (n - 1).bit_length() - 1
+    m = 1 << k
+    # coef[-m:] são os m termos de menor grau (L); coef[:-m], os de H
+    alto = _convolver(_comporRecursivo(coef[:-m], potencias), potencias[k])
+    return _somar(alto, _comporRecursivo(coef[-m:], potencias))
+
+def _somar(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Soma dois arrays de coeficientes (ordem decrescente de grau) alinhando os termos constantes.
+    Retorna sempre um array novo.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    resultado = a.copy()
+    resultado[len(a) - len(b):] += b
+    return resultado
+
+def _horner_complexo(coef: np.ndarray, z: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Avalia P, P' e o polinômio dos módulos dos coeficientes (em |z|, usado para o erro de
+    arredondamento de Horner) em todos os pontos complexos z de uma vez.
+    """
+    modulo = np.abs(z)
+    p = np.full(z.shape, coef[0], dtype=complex)
+    dp = np.zeros(z.shape, dtype=complex)
+    pAbs = np.full(z.shape, abs(coef[0]))
+    for c in coef[1:]:
+        dp = dp * z + p
+        p = p * z + c
+        pAbs = pAbs * modulo + abs(c)
+    return p, dp, pAbs
+
+def _newton_complexo(coef: np.ndarray, z: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Correção de Newton P(z) / P'(z) em cada ponto z e um indicador de que |P(z)| já está no
+    nível do erro de arredondamento. Para |z| > 1 avalia o polinômio revertido em 1/z, o que
+    evita overflow em graus altos: P(z) / P'(z) = z q(w) / (n q(w) - w q'(w)), w = 1/z.
+    """
+    n = len(coef) - 1
+    gama = 2 * n * Polinomio.BASE_TOLERANCE
+    correcao = np.empty(z.shape, dtype=complex)
+    ruido = np.empty(z.shape, dtype=bool)
+
+    dentro = np.abs(z) <= 1.0
+    fora = ~dentro
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p, dp, pAbs = _horner_complexo(coef, z[dentro])
+        correcao[dentro] = p / dp
+        ruido[dentro] = np.abs(p) <= gama * pAbs
+
+        w = 1.0 / z[fora]
+        q, dq, qAbs = _horner_complexo(coef[::-1], w)
+        correcao[fora] = z[fora] * q / (n * q - w * dq)
+        ruido[fora] = np.abs(q) <= gama * qAbs
+
+    correcao[~np.isfinite(correcao)] = 0.0
+    return correcao, ruido
+
+def _raizes_companheira(coef: np.ndarray) -> np.ndarray:
+    """Raízes como autovalores da matriz companheira do polinômio mônico coef / coef[0]."""
+    n = len(coef) - 1
+    companheira = np.zeros((n, n))
+    companheira[0, :] = -coef[1:] / coef[0]
+    companheira[np.arange(1, n), np.arange(n - 1)] = 1.0
+    return np.linalg.eigvals(companheira).astype(complex)
+
+def _raizes_aberth(coef: np.ndarray, limite: float, max_iter: int) -> np.ndarray:
+    """
+    Iteração de Aberth–Ehrlich: todas as aproximações são corrigidas juntas por
+    z_i <- z_i - N_i / (1 - N_i * sum_{j != i} 1 / (z_i - z_j)), N_i = P(z_i) / P'(z_i).
+    Cada raiz deixa de ser atualizada quando a correção fica no nível do epsilon de máquina, e a
+    iteração termina quando todas as restantes estão no nível do erro de arredondamento sem
+    diminuir a correção por _ABERTH_ESTAGNACAO iterações seguidas. coef[-1] != 0.
+    """
+    n = len(coef) - 1
+    raio = np.exp((np.log(abs(coef[-1])) - np.log(abs(coef[0]))) / n)
+    if limite > 0.0:
+        raio = min(raio, limite)
+    z = raio * np.exp(1j * (2.0 * np.pi * np.arange(n) / n + 0.4))
+
+    ativos = np.arange(n)
+    passoAnterior = np.full(n, np.inf)
+    estagnado = np.zeros(n, dtype=int)
+    for _ in range(max_iter):
+        if ativos.size == 0:
+            break
+        correcao, ruido = _newton_complexo(coef, z[ativos])
+
+        diferencas = z[ativos, None] - z[None, :]
+        diferencas[np.arange(ativos.size), ativos] = 1.0
+        inversos = 1.0 / diferencas
+        inversos[np.arange(ativos.size), ativos] = 0.0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            passo = correcao / (1.0 - correcao * inversos.sum(axis=1))
+        passo[~np.isfinite(passo)] = 0.0
+
+        novo = z[ativos] - passo
+        # Nenhuma raiz está fora do limite de Cauchy
+        if limite > 0.0:
+            modulo = np.abs(novo)
+            fora = modulo > limite
+            novo[fora] *= limite / modulo[fora]
+        z[ativos] = novo
+
+        # Uma raiz para quando a correção chega ao epsilon de máquina. As que ficam no nível do
+        # erro de arredondamento sem diminuir a correção só param todas juntas: congelar uma
+        # delas antes impediria as vizinhas (ainda em movimento) de se ajustarem
+        tamanho = np.abs(passo)
+        estagnado[ativos] = np.where(ruido & (tamanho > 0.5 * passoAnterior[ativos]), estagnado[ativos] + 1, 0)
+        passoAnterior[ativos] = tamanho
+        ativos = ativos[tamanho > 4.0 * Polinomio.BASE_TOLERANCE * np.abs(novo)]
+        if np.all(estagnado[ativos] >= _ABERTH_ESTAGNACAO):
+            break
+
+    return z
+
+def _erro_raizes(coef: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """
+    Raio de inclusão de cada aproximação z_i:
+    n * (|P(z_i)| + erro de Horner) / |c_n * prod_{j != i} (z_i - z_j)|, calculado em
+    logaritmos (e com o polinômio revertido para |z_i| > 1) para não estourar em graus altos.
+    """
+    n = len(coef) - 1
+    if n == 0:
+        return np.zeros(0)
+    gama = 2 * n * Polinomio.BASE_TOLERANCE
+
+    logResiduo = np.empty(z.shape)
+    dentro = np.abs(z) <= 1.0
+    fora = ~dentro
+    with np.errstate(divide='ignore'):
+        p, _, pAbs = _horner_complexo(coef, z[dentro])
+        logResiduo[dentro] = np.log(np.abs(p) + gama * pAbs)
+        q, _, qAbs = _horner_complexo(coef[::-1], 1.0 / z[fora])
+        logResiduo[fora] = n * np.log(np.abs(z[fora])) + np.log(np.abs(q) + gama * qAbs)
+
+        diferencas = np.abs(z[:, None] - z[None, :])
+        np.fill_diagonal(diferencas, 1.0)
+        logProduto = np.log(diferencas).sum(axis=1)
+
+    return np.exp(np.log(n) + logResiduo - np.log(abs(coef[0])) - logProduto)
+
+class PolinomioBatch:
+    """
+    Representa um conjunto de polinômios guardados em um único array 2-D
+    (n_polinomios x (maior grau + 1)), em ordem decrescente de grau e alinhados pelo
+    termo constante: polinômios de grau menor são completados com zeros à esquerda.
+
+    Todas as operações (avaliação, derivada e aritmética) são feitas sobre o array inteiro,
+    sem passar por um objeto Polinomio por linha.
+
+    Examples:
+        >>> lote = PolinomioBatch([Polinomio([1.0, 0.0, -1.0]), Polinomio([2.0, 1.0])])
+        >>> lote.evaluate(np.array([0.0, 1.0, 2.0]))
+        array([[-1.,  0.,  3.],
+               [ 1.,  3.,  5.]])
+    """
+
+    __slots__ = ('_coef', 'domain')
+
+    def __init__(self, polinomios: Sequence[Union['Polinomio', Sequence[float]]], domain: Optional[Interval] = None):
+        valores = [
+            p._values if isinstance(p, Polinomio) else np.asarray(p, dtype=float).reshape(-1)
+            for p in polinomios
+        ]
+        if not valores:
+            raise ValueError("PolinomioBatch precisa de pelo menos um polinômio.")
+
+        largura = max(len(v) for v in valores)
+        coef = np.zeros((len(valores), largura))
+        for i, v in enumerate(valores):
+            coef[i, largura - len(v):] = v
+
+        if domain is None and all(isinstance(p, Polinomio) for p in polinomios):
+            domain = polinomios[0].domain
+            for p in polinomios[1:]:
+                domain = safe_intersect(domain, p.domain)
+
+        self._coef = coef
+        self.domain = domain
+
+    @classmethod
+    def _from_array(cls, coef: np.ndarray, domain: Optional[Interval] = None) -> 'PolinomioBatch':
+        """Construtor interno a partir de uma matriz de coeficientes já alinhada."""
+        lote = cls.__new__(cls)
+        lote._coef = coef
+        lote.domain = domain
+        return lote
+
+    def __repr__(self):
+        return f"PolinomioBatch({len(self)} polinômios, grau máximo {self.max_degree})"
+
+    def __len__(self):
+        return self._coef.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Polinomio(self._coef[index], self.domain)
+        return PolinomioBatch._from_array(self._coef[index], self.domain)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def coeficientes(self) -> np.ndarray:
+        """Matriz (n_polinomios x (maior grau + 1)) de coeficientes, somente leitura."""
+        view = self._coef.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def max_degree(self) -> int:
+        return self._coef.shape[1] - 1
+
+    @property
+    def degree(self) -> np.ndarray:
+        """Grau de cada polinômio do lote (0 para o polinômio nulo)."""
+        naoNulo = self._coef != 0.0
+        primeiro = np.argmax(naoNulo, axis=1)
+        return np.where(naoNulo.any(axis=1), self.max_degree - primeiro, 0)
+
+    def evaluate(self, x) -> np.ndarray:
+        """
+        Avalia todos os polinômios em x com um único Horner vetorizado.
+
+        Args:
+            x (float | np.ndarray): Ponto (ou array de pontos) de avaliação.
+
+        Returns:
+            np.ndarray: Array (n_polinomios,) para x escalar ou (n_polinomios x n_pontos)
+                para um array 1-D de pontos.
+        """
+        x = np.asarray(x, dtype=float)
+        coef = self._coef
+        resultado = np.empty((coef.shape[0],) + x.shape)
+        resultado[...] = coef[:, 0].reshape((-1,) + (1,) * x.ndim)
+        for j in range(1, coef.shape[1]):
+            resultado *= x
+            resultado += coef[:, j].reshape((-1,) + (1,) * x.ndim)
+        return resultado
+
+    def __call__(self, x) -> np.ndarray:
+        if self.domain is not None and x not in self.domain:
+            raise Exception("The number is out of the domain")
+        return self.evaluate(x)
+
+    def derivar(self) -> 'PolinomioBatch':
+        """Retorna o lote com a derivada de cada polinômio."""
+        if self.max_degree == 0:
+            return PolinomioBatch._from_array(np.zeros((len(self), 1)), self.domain)
+        potencias = np.arange(self.max_degree, 0, -1, dtype=float)
+        return PolinomioBatch._from_array(self._coef[:, :-1] * potencias, self.domain)
+
+    def _alinhar(self, other: 'PolinomioBatch | Polinomio') -> Tuple[np.ndarray, np.ndarray, Optional[Interval]]:
+        """Completa com zeros à esquerda para que os dois operandos tenham a mesma largura."""
+        if isinstance(other, Polinomio):
+            outro = other._values.reshape(1, -1)
+        elif isinstance(other, PolinomioBatch):
+            if len(other) != len(self):
+                raise ValueError(f"Os lotes devem ter o mesmo tamanho ({len(self)} != {len(other)}).")
+            outro = other._coef
+        else:
+            raise TypeError("Operação definida apenas entre PolinomioBatch e PolinomioBatch/Polinomio.")
+
+        largura = max(self._coef.shape[1], outro.shape[1])
+        a = np.pad(self._coef, ((0, 0), (largura - self._coef.shape[1], 0)))
+        b = np.pad(outro, ((0, 0), (largura - outro.shape[1], 0)))
+        return a, b, safe_intersect(self.domain, other.domain)
+
+    def __add__(self, other: 'PolinomioBatch | Polinomio') -> 'PolinomioBatch':
+        a, b, domain = self._alinhar(other)
+        return PolinomioBatch._from_array(a + b, domain)
+
+    def __radd__(self, other: 'Polinomio') -> 'PolinomioBatch':
+        return self.__add__(other)
+
+    def __sub__(self, other: 'PolinomioBatch | Polinomio') -> 'PolinomioBatch':
+        a, b, domain = self._alinhar(other)
+        return PolinomioBatch._from_array(a - b, domain)
+
+    def __rsub__(self, other: 'Polinomio') -> 'PolinomioBatch':
+        return (-self).__add__(other)
+
+    def __neg__(self) -> 'PolinomioBatch':
+        return PolinomioBatch._from_array(-self._coef, self.domain)
+
+    def __mul__(self, other) -> 'PolinomioBatch':
+        """Multiplica por um escalar ou por um array com um escalar por polinômio."""
+        fator = np.asarray(other, dtype=float)
+        if fator.ndim == 1:
+            fator = fator.reshape(-1, 1)
+        return PolinomioBatch._from_array(self._coef * fator, self.domain)
+
+    def __rmul__(self, other) -> 'PolinomioBatch':
+        return self.__mul__(other)
+
+    def polinomios(self) -> List['Polinomio']:
+        """Converte o lote de volta em uma lista de Polinomio."""
+        return list(self)
+
 def lambdify(P: 'Polinomio') -> Callable[[float], float]:
     """
     Cria e retorna uma função lambda (Callable) que avalia o polinômio P(x).
     
     Isso permite que o objeto Polinomio seja usado em métodos que esperam 
-    uma função f(x), como Bisseção ou Secante.
+    uma função f(x), como Bisseção ou Secante. A função retornada é a
+    avaliação sem checagem de domínio (P.fast), sem camadas intermediárias.
     
     Args:
         P (Polinomio): O objeto Polinomio a ser convertido.
         
     Returns:
-        Callable[[float], float]: Uma função lambda que recebe x (float) 
+        Callable[[float], float]: Uma função que recebe x (float) 
                                   e retorna P(x) (float).
     """
-    
-    def func_wrapper(x: float) -> float:
-        """Função interna que avalia o polinômio P em x."""
-        return P.evaluate(x)
-        
-    return func_wrapper
+    return P.fast
 
 if __name__ == "__main__":
     import matplotlib.pyplot as plt
@@ -1,13 +1,18 @@
 # Alunos Responsáveis: Marcelo Alves, Vinícios Flesh
 
-from typing import Callable, List
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+from fractions import Fraction
+from functools import lru_cache
+import math
 # Tentar executar localmente a partir da pasta geral do repositório vai dar erro, mas é assim mesmo que o import deve estar para o deploy.
 # Se quiser testar localmente use o comando 'python -m CB2325NumericaG6.raizes' sem as aspas.
-from .polinomios import Polinomio
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
+from .core import fast_callable
+from .polinomios import CacheInfo, Polinomio, PolinomioBatch, PolinomioCongelado
 import numpy as np
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
 
 def secante(f: Callable, a: float, b: float, tol: float = 1e-6) -> float:
     """
@@ -27,6 +32,7 @@ def secante(f: Callable, a: float, b: float, tol: float = 1e-6) -> float:
         Aproximação da raiz da função encontrada.
     """
 
+    f = fast_callable(f)
     a, b = (a, b) if a < b else (b, a)
 
     interacao = 0
@@ -41,7 +47,7 @@ def secante(f: Callable, a: float, b: float, tol: float = 1e-6) -> float:
     return aproximacao
     
 
-def plot_secante(f: Callable, intervalo:tuple[float, float], a: float, b: float, tol: float=1e-6) -> Figure:
+def plot_secante(f: Callable, intervalo:tuple[float, float], a: float, b: float, tol: float=1e-6) -> 'Figure':
     def func_plot() -> None:
         """
         Função auxiliar para visualização gráfica da secante
@@ -70,6 +76,8 @@ def plot_secante(f: Callable, intervalo:tuple[float, float], a: float, b: float,
         Plotagem da representação do processo
     """
 
+    import matplotlib.pyplot as plt
+
     fig, aux = plt.subplots()
     aux.set_xlabel('x')
     aux.set_ylabel('y')
@@ -117,6 +125,7 @@ def bisseccao(f: Callable, a: float, b: float, tol: float=1e-6) -> float:
         Aproximação da raiz da função no intervalo [a, b]
     """
 
+    f = fast_callable(f)
     if f(a) * f(b) > 0:
         raise ValueError('f(a) tem o mesmo sinal que f(b), não há garantia da existencia de uma raiz')
     
@@ -134,7 +143,7 @@ def bisseccao(f: Callable, a: float, b: float, tol: float=1e-6) -> float:
     return aproximacao
 
 
-def plot_bisseccao(f: Callable, intervalo:tuple[float, float], a:float, b:float, tol: float = 1e-6) -> Figure:
+def plot_bisseccao(f: Callable, intervalo:tuple[float, float], a:float, b:float, tol: float = 1e-6) -> 'Figure':
     def func_plot():
         """Função auxiliar para o método da bissecção"""
         aux.scatter(a, f(a), s=10, color='#00D', zorder=2)
@@ -163,6 +172,8 @@ def plot_bisseccao(f: Callable, intervalo:tuple[float, float], a:float, b:float,
     if f(a) * f(b) > 0:
         raise ValueError('f(a) tem o mesmo sinal que f(b), não há garantia da existencia de uma raiz')
 
+    import matplotlib.pyplot as plt
+
     fig, aux = plt.subplots()
     aux.set_xlabel('x')
     aux.set_ylabel('y')
@@ -207,6 +218,7 @@ def newton_raphson(f: Callable, df: Callable, a:float, tol: float= 1e-6) -> floa
         Aproximação da raiz da função encontrada.
     """
     
+    f, df = fast_callable(f), fast_callable(df)
     interacao = 0
     aproximacao = a - f(a)/df(a)
     while abs(f(aproximacao)) > tol:
@@ -219,7 +231,7 @@ def newton_raphson(f: Callable, df: Callable, a:float, tol: float= 1e-6) -> floa
     return aproximacao
 
 
-def plot_newton_raphson(f: Callable, intervalo:tuple[float, float], df: Callable, a:float, tol: float = 1e-6) -> Figure:
+def plot_newton_raphson(f: Callable, intervalo:tuple[float, float], df: Callable, a:float, tol: float = 1e-6) -> 'Figure':
     def func_plot():
         """
         Função auxiliar para plotagem do método de newton-raphson
@@ -248,6 +260,8 @@ def plot_newton_raphson(f: Callable, intervalo:tuple[float, float], df: Callable
         plotagem do método de newton-raphson 
     """
 
+    import matplotlib.pyplot as plt
+
     fig, aux = plt.subplots()
     aux.set_xlabel('x')
     aux.set_ylabel('y')
@@ -275,60 +289,83 @@ def plot_newton_raphson(f: Callable, intervalo:tuple[float, float], df: Callable
     return fig
 
 
-def _sturmSequence(P: Polinomio) -> List[Polinomio]:
-    sequence = [P, P.derivar()]
-    remainder = sequence[1]
-    index = 1
-    while True:
-        _, remainder = sequence[index-1].dividir_por(sequence[index])
-        if remainder.isZero:
-            break
-
-        sequence.append(-remainder)
-        index += 1
+STURM_CACHE_TAMANHO = 128
 
-    return sequence
+@lru_cache(maxsize=STURM_CACHE_TAMANHO)
+def _sturmSequenceCongelada(P: PolinomioCongelado) -> PolinomioBatch:
+    return P.sequencia_sturm_lote()
 
 
-def _countSignVariations(sequence: List[Polinomio], x):
-    # TODO: Talvez substituir tolerância por algum calculo de erro no futuro quando .erros.py for implementado
-    tolerance = 1e-15
+def _sturmSequence(P: Polinomio) -> PolinomioBatch:
+    # A sequência é calculada pelo próprio polinômio, como uma matriz de coeficientes completada
+    # com zeros. O cache LRU é chaveado pelo PolinomioCongelado, então chamadas repetidas com
+    # polinômios de mesmos coeficientes (mutáveis ou não) reaproveitam a sequência; congelar
+    # copia os coeficientes, em O(n) contra O(n²) do cálculo da sequência.
+    return _sturmSequenceCongelada(P.congelar())
 
-    changes = 0
-    signs = []
-    for p in sequence:
-        value = p.evaluate(x)
-        if abs(value) < tolerance:
-            continue
 
-        if value > 0:
-            signs.append(True)
-        else:
-            signs.append(False)
-
-    if len(signs) < 2:
-        return 0
-    
-    last = signs[0]
-    for i in range(1, len(signs)):
-        if signs[i] != last:
-            last = signs[i]
-            changes += 1
-
-    return changes
-
-
-def sturm(P: Polinomio, a: float, b: float) -> int:
+def sturm_cache_info() -> CacheInfo:
+    """
+    Retorna CacheInfo(hits, misses, currsize) do cache LRU de sequências de Sturm usado por
+    sturm, sturm_particao, isolar_raizes e raizes_reais.
+    """
+    info = _sturmSequenceCongelada.cache_info()
+    return CacheInfo(info.hits, info.misses, info.currsize)
+
+
+def sturm_cache_clear() -> None:
+    """Esvazia o cache LRU de sequências de Sturm e zera os contadores."""
+    _sturmSequenceCongelada.cache_clear()
+
+
+def _countSignVariations(sequence: PolinomioBatch, x):
+    # Avalia todos os termos da sequência em todos os pontos de uma vez; retorna um int para x
+    # escalar e um array de variações para um array de pontos.
+    # Só zeros exatos são ignorados: uma tolerância absoluta descartaria todos os valores de
+    # polinômios de escala pequena (e.g. com muitas raízes em [0, 1]) e quebraria as contagens
+    signs = np.sign(sequence.evaluate(x))
+
+    # Numa raiz do último termo (o mdc de P e P', não constante se P tem raízes múltiplas)
+    # todos os termos se anulam e as variações somem (em ponto flutuante os últimos termos
+    # ficam só com ruído de arredondamento). Fora dessas raízes dois termos consecutivos
+    # nunca se anulam juntos, então é assim que elas são detectadas. Nesses pontos conta-se
+    # na sequência livre de quadrados (cada termo dividido pelo mdc), que tem as mesmas
+    # variações fora das raízes do mdc e o valor certo nelas
+    if len(sequence) > 1 and sequence.degree[-1] > 0:
+        noMdc = np.any((signs[1:] == 0.0) & (signs[:-1] == 0.0), axis=0)
+        if np.any(noMdc):
+            mdc = sequence[len(sequence) - 1]
+            livre = PolinomioBatch([termo.dividir_por(mdc)[0] for termo in sequence])
+            if signs.ndim == 1:
+                signs = np.sign(livre.evaluate(x))
+            else:
+                signs[:, noMdc] = np.sign(livre.evaluate(np.asarray(x, dtype=float)[noMdc]))
+
+    # Cada zero recebe o sinal do último termo não nulo acima dele na sequência; assim as
+    # variações são contadas entre termos consecutivos, sem laço em Python
+    linhas = np.arange(signs.shape[0]).reshape((-1,) + (1,) * (signs.ndim - 1))
+    ultimoNaoNulo = np.maximum.accumulate(np.where(signs != 0.0, linhas, 0), axis=0)
+    signs = np.take_along_axis(signs, ultimoNaoNulo, axis=0)
+
+    changes = np.count_nonzero(signs[1:] * signs[:-1] < 0.0, axis=0)
+    return int(changes) if np.ndim(changes) == 0 else changes
+
+
+def sturm(P: Polinomio, a, b):
     """
         Calcula o número de raízes reais de um polinomio no intervalo (a,b].
 
+        a e b também podem ser arrays (com broadcasting): as contagens de todos os intervalos
+        saem de uma única avaliação vetorizada da sequência de Sturm.
+
         Args:
             P (Polinomio): Polinomio a ser avaliado.
-            a (float): Extremo inferior do intervalo.
-            b (flaot): Extremo superior do intervalo.
+            a (float | np.ndarray): Extremo inferior do intervalo.
+            b (float | np.ndarray): Extremo superior do intervalo.
         
         Returns:
-            int: Número de raízes reais no intervalo (a,b]
+            int | np.ndarray: Número de raízes reais no intervalo (a,b] (um array se a ou b
+                for um array).
         
         Raises:
             ValueError: Limite inferior a é maior ou igual que limite superior b
@@ -339,7 +376,7 @@ def sturm(P: Polinomio, a: float, b: float) -> int:
             >>> print(raizes)
 
     """
-    if a >= b:
+    if np.any(np.asarray(a) >= np.asarray(b)):
         raise ValueError("O limite inferior 'a' deve ser menor que o limite superior 'b'.")
 
     sequence = _sturmSequence(P)
@@ -350,6 +387,375 @@ def sturm(P: Polinomio, a: float, b: float) -> int:
     return signsA - signsB
 
 
+def sturm_particao(P: Polinomio, pontos) -> np.ndarray:
+    """
+        Conta as raízes reais de um polinômio em cada subintervalo de uma partição.
+
+        As variações de sinal da sequência de Sturm são calculadas em todos os pontos com uma
+        única avaliação vetorizada (cada ponto interno é avaliado uma vez), e as contagens são
+        as diferenças entre pontos consecutivos.
+
+        Args:
+            P (Polinomio): Polinomio a ser avaliado.
+            pontos (Sequence[float] | np.ndarray): Pontos x0 < x1 < ... < xn da partição.
+
+        Returns:
+            np.ndarray: Array de n inteiros com o número de raízes em cada (x(i-1), xi].
+
+        Raises:
+            ValueError: Se houver menos de dois pontos ou se eles não forem estritamente crescentes.
+
+        Examples:
+            >>> sturm_particao(Polinomio([1.0, 0.0, -1.0]), [-2.0, 0.0, 2.0])
+            array([1, 1])
+    """
+    pontos = np.asarray(pontos, dtype=float)
+    if pontos.ndim != 1 or len(pontos) < 2:
+        raise ValueError("A partição deve ter pelo menos dois pontos.")
+    if np.any(np.diff(pontos) <= 0):
+        raise ValueError("Os pontos da partição devem ser estritamente crescentes.")
+
+    variacoes = _countSignVariations(_sturmSequence(P), pontos)
+    return variacoes[:-1] - variacoes[1:]
+
+
+def isolar_raizes(P: Polinomio, a: float, b: float, tol: Optional[float] = None, metodo: str = 'sturm') -> List[Tuple[float, float]]:
+    """
+        Isola as raízes reais (distintas) de um polinômio no intervalo (a,b].
+
+        Dois métodos, com o mesmo resultado:
+            - 'sturm': a sequência de Sturm é calculada uma única vez (e fica em cache se P for
+              um PolinomioCongelado); os subintervalos são bissectados pelas contagens de Sturm
+              até cada um conter exatamente uma raiz.
+            - 'descartes': bissecção de Vincent–Collins–Akritas. Cada subintervalo é levado em
+              (0, 1) e a regra de sinais de Descartes (sobre os coeficientes de
+              (x+1)^n Q(1/(x+1))) limita o número de raízes nele; as metades são obtidas por
+              escala e deslocamento de Taylor em aritmética inteira exata, sem divisões de
+              polinômios. Uma raiz múltipla não é separada pelo teste de Descartes: o seu
+              intervalo é reduzido até a precisão de máquina.
+
+        Se tol for dado, cada intervalo é então refinado até ter largura menor ou igual a tol
+        (ver _refinarIntervalo).
+
+        Raízes mais próximas que a precisão de máquina não podem ser separadas: nesse caso
+        o intervalo devolvido (de largura mínima) contém todas elas.
+
+        Args:
+            P (Polinomio): Polinomio a ser avaliado.
+            a (float): Extremo inferior do intervalo.
+            b (float): Extremo superior do intervalo.
+            tol (Optional[float]): Largura máxima dos intervalos. None não refina.
+            metodo (str): 'sturm' ou 'descartes'.
+
+        Returns:
+            List[Tuple[float, float]]: Intervalos (lo, hi] disjuntos, em ordem crescente,
+            cada um com uma raiz real de P.
+
+        Raises:
+            ValueError: Limite inferior a é maior ou igual que limite superior b, ou método desconhecido
+
+        Examples:
+            >>> P = Polinomio([1.0, 0.0, -2.0])
+            >>> isolar_raizes(P, -3, 3)
+            [(-3.0, 0.0), (0.0, 3.0)]
+    """
+    if a >= b:
+        raise ValueError("O limite inferior 'a' deve ser menor que o limite superior 'b'.")
+    if metodo not in ('sturm', 'descartes'):
+        raise ValueError(f"Método desconhecido: {metodo!r}. Use 'sturm' ou 'descartes'.")
+
+    a, b = float(a), float(b)
+
+    if metodo == 'descartes':
+        intervalos = _bisseccaoDescartes(P, a, b)
+        if tol is None:
+            return intervalos
+        coef = _coeficientesInteiros(P._values)
+        contar = lambda lo, hi: _sinalExato(coef, lo) * _sinalExato(coef, hi) < 0 or _sinalExato(coef, hi) == 0
+        return [_refinarIntervalo(P.fast, contar, lo, hi, tol, aberto=True) for lo, hi in intervalos]
+
+    sequence = _sturmSequence(P)
+    intervalos = _bisseccaoSturm(sequence, a, b, _countSignVariations(sequence, a), _countSignVariations(sequence, b))
+
+    if tol is None:
+        return intervalos
+
+    # A parte livre de quadrados P / mdc(P, P') (o mdc é o último termo da sequência) tem as
+    # mesmas raízes de P, todas simples, então troca de sinal em cada intervalo isolado
+    livre = sequence[0] if sequence[-1].degree == 0 else sequence[0].dividir_por(sequence[-1])[0]
+    contar = lambda lo, hi: _countSignVariations(sequence, lo) - _countSignVariations(sequence, hi)
+    return [_refinarIntervalo(livre.fast, contar, lo, hi, tol) for lo, hi in intervalos]
+
+
+def raizes_reais(P: Polinomio, a: Optional[float] = None, b: Optional[float] = None, tol: float = 1e-12, metodo: str = 'sturm') -> List[float]:
+    """
+        Calcula todas as raízes reais (distintas) de um polinômio no intervalo (a,b].
+
+        Usa isolar_raizes com refinamento até a largura tol e devolve o ponto médio de cada
+        intervalo. Sem a e b, usa os limites de P.get_limite_raizes(), que contêm todas as
+        raízes reais.
+
+        Args:
+            P (Polinomio): Polinomio a ser avaliado.
+            a (Optional[float]): Extremo inferior do intervalo.
+            b (Optional[float]): Extremo superior do intervalo.
+            tol (float): Precisão das raízes.
+            metodo (str): Método de isolamento, 'sturm' ou 'descartes' (ver isolar_raizes).
+
+        Returns:
+            List[float]: As raízes reais em ordem crescente.
+
+        Examples:
+            >>> raizes_reais(Polinomio([1.0, 0.0, -2.0]))
+            [-1.4142135623730951, 1.4142135623730951]
+    """
+    if a is None or b is None:
+        l, L = P.get_limite_raizes()
+        a = float(l) if a is None else a
+        b = float(L) if b is None else b
+        if a == b:
+            # Só acontece para P constante ou P = c * x^n, cuja única raiz possível é 0
+            a, b = -1.0, 1.0
+
+    return [(lo + hi) / 2 for lo, hi in isolar_raizes(P, a, b, tol, metodo)]
+
+
+def _larguraMinima(lo: float, hi: float) -> float:
+    # Abaixo disso o ponto médio não fica estritamente entre lo e hi
+    return 4.0 * np.finfo(float).eps * max(1.0, abs(lo), abs(hi))
+
+
+def _bisseccaoSturm(sequence: PolinomioBatch, a: float, b: float, variacoesA: int, variacoesB: int) -> List[Tuple[float, float]]:
+    """
+    Bissecta (a,b] pelas contagens de Sturm até cada subintervalo conter uma única raiz,
+    descartando os subintervalos sem raízes. variacoesA/B são as variações de sinal em a e b.
+    Os subintervalos são bissectados em níveis: os pontos médios de todos os subintervalos
+    ativos são avaliados juntos, em uma única chamada de _countSignVariations.
+    """
+    intervalos = []
+    ativos = [(a, b, variacoesA, variacoesB)]
+    while ativos:
+        divididos = []
+        for lo, hi, vLo, vHi in ativos:
+            numRaizes = vLo - vHi
+            if numRaizes <= 0:
+                continue
+            if numRaizes == 1 or hi - lo <= _larguraMinima(lo, hi):
+                intervalos.append((lo, hi))
+            else:
+                divididos.append((lo, hi, vLo, vHi))
+
+        if not divididos:
+            break
+        meios = np.array([(lo + hi) / 2 for lo, hi, _, _ in divididos])
+        vMeios = _countSignVariations(sequence, meios).tolist()
+        ativos = []
+        for (lo, hi, vLo, vHi), meio, vMeio in zip(divididos, meios.tolist(), vMeios):
+            ativos.append((lo, meio, vLo, vMeio))
+            ativos.append((meio, hi, vMeio, vHi))
+
+    intervalos.sort()
+    return intervalos
+
+
+def _refinarIntervalo(f: Callable, contar: Callable, lo: float, hi: float, tol: float, aberto: bool = False, max_iter: Optional[int] = None) -> Tuple[float, float]:
+    """
+    Reduz um intervalo isolante (lo,hi] até largura tol pelo método de Illinois (regula falsi
+    modificada), que mantém a raiz entre os extremos e converge de forma superlinear.
+    O passo de Illinois pode estagnar quando |f| é muito grande em um dos extremos: sempre
+    que um passo não reduz o intervalo pelo menos à metade, o passo seguinte é uma bissecção,
+    então a largura cai à metade a cada duas iterações no pior caso. O padrão de max_iter é
+    esse pior caso; se ainda assim ele for atingido, gera RuntimeError.
+    Se f não troca de sinal entre lo e hi (raiz exatamente em lo por arredondamento, ou raiz
+    de multiplicidade par, por exemplo), refina por bissecção usando contar(lo, hi), que
+    retorna um número positivo quando há raiz em (lo,hi] (contagem de Sturm ou de Descartes).
+    Com aberto=True o intervalo é (lo,hi), e um zero em hi não é a raiz procurada.
+    """
+    fLo, fHi = f(lo), f(hi)
+    if fHi == 0.0 and (not aberto or lo == hi):
+        return hi, hi
+
+    if fLo == 0.0 or fHi == 0.0 or (fLo > 0) == (fHi > 0):
+        while hi - lo > tol and hi - lo > _larguraMinima(lo, hi):
+            meio = (lo + hi) / 2
+            if f(meio) == 0.0:
+                return meio, meio
+            if contar(lo, meio) > 0:
+                hi = meio
+            else:
+                lo = meio
+        return lo, hi
+
+    if max_iter is None:
+        alvo = max(tol, _larguraMinima(lo, hi) / 4)
+        max_iter = 2 * int(np.ceil(np.log2(max((hi - lo) / alvo, 2.0)))) + 4
+
+    lado = 0
+    bissectar = False
+    for _ in range(max_iter):
+        largura = hi - lo
+        if largura <= tol or largura <= _larguraMinima(lo, hi):
+            break
+        c = hi - fHi * (hi - lo) / (fHi - fLo)
+        if bissectar or not lo < c < hi:
+            c = (lo + hi) / 2
+        fC = f(c)
+        if fC == 0.0:
+            return c, c
+        if (fC > 0) == (fHi > 0):
+            hi, fHi = c, fC
+            # Se o extremo lo ficou parado duas vezes seguidas, reduz o seu peso (Illinois)
+            if lado == 1:
+                fLo /= 2
+            lado = 1
+        else:
+            lo, fLo = c, fC
+            if lado == -1:
+                fHi /= 2
+            lado = -1
+        bissectar = hi - lo > largura / 2
+    else:
+        if hi - lo > tol and hi - lo > _larguraMinima(lo, hi):
+            raise RuntimeError('Método não convergiu')
+
+    return lo, hi
+
+
+
+def _bisseccaoDescartes(P: Polinomio, a: float, b: float) -> List[Tuple[float, float]]:
+    """
+    Isolamento de Vincent–Collins–Akritas em (a,b], em aritmética inteira exata: os
+    coeficientes de P (floats, i.e. racionais diádicos) viram inteiros com o mesmo
+    denominador, e escalas por 2 e deslocamentos de Taylor de inteiros não têm erro de
+    arredondamento (em float64 o deslocamento perde os sinais dos coeficientes já em grau ~50).
+
+    A reta é dividida em quatro partes, cada uma levada em (0, 1):
+        (0, 1): P(x), (1, inf): x^n P(1/x), (-1, 0): P(-x), (-inf, -1): x^n P(-1/x),
+    e os pontos -1, 0 e 1 são testados à parte. Nós cujo intervalo não encontra (a,b] são
+    descartados sem bissecção.
+
+    Sem a parte livre de quadrados, uma raiz múltipla nunca tem uma única variação de sinal:
+    o seu intervalo é bissectado até a precisão de máquina e devolvido assim.
+    """
+    coef = _coeficientesInteiros(P._values)
+    n = len(coef) - 1
+    if n == 0:
+        return []
+
+    l, L = P.get_limite_raizes()
+    cauchy = max(-float(l), float(L), 1.0)
+    negativo = coef.copy()
+    negativo[-2::-2] *= -1
+    potencias = np.array([2 ** i for i in range(n + 1)], dtype=object)
+
+    candidatos = [(float(x), float(x)) for x in (-1.0, 0.0, 1.0) if a < x <= b and _sinalExato(coef, x) == 0]
+    for parte, Q in enumerate((coef, coef[::-1], negativo, negativo[::-1])):
+        pilha = [(Q, 0, 0)]
+        while pilha:
+            Q, c, k = pilha.pop()
+            # Nó: raízes de Q em (c / 2^k, (c+1) / 2^k)
+            lo, hi = _intervaloParte(parte, c / 2.0 ** k, (c + 1) / 2.0 ** k, cauchy)
+            if hi <= a or lo >= b:
+                continue
+
+            variacoes = _variacoesDescartes(Q)
+            if variacoes == 0:
+                continue
+            # Com uma variação, P troca de sinal; só o extremo que for raiz (de outro nó) impede
+            # decidir pelo sinal, e então o intervalo é bissectado mais uma vez
+            if variacoes == 1 and _sinalExato(coef, lo) != 0 and _sinalExato(coef, hi) != 0:
+                candidato = _recortar(coef, lo, hi, a, b)
+                if candidato is not None:
+                    candidatos.append(candidato)
+                continue
+            if hi - lo <= _larguraMinima(lo, hi):
+                if a < (lo + hi) / 2 <= b:
+                    candidatos.append((max(lo, a), min(hi, b)))
+                continue
+
+            # 2^n Q(x/2) em (c / 2^k, (2c+1) / 2^(k+1)) e 2^n Q((x+1)/2) na outra metade
+            esquerda = Q * potencias
+            divisor = math.gcd(*esquerda)
+            if divisor > 1:
+                esquerda //= divisor
+            if sum(esquerda) == 0:
+                meio = _intervaloParte(parte, (2 * c + 1) / 2.0 ** (k + 1), (2 * c + 1) / 2.0 ** (k + 1), cauchy)
+                if a < meio[0] <= b:
+                    candidatos.append(meio)
+            pilha.append((_deslocarUm(esquerda), 2 * c + 1, k + 1))
+            pilha.append((esquerda, 2 * c, k + 1))
+
+    return sorted(candidatos)
+
+
+def _intervaloParte(parte: int, yLo: float, yHi: float, cauchy: float) -> Tuple[float, float]:
+    """Intervalo de x correspondente a y em (yLo, yHi) ⊂ (0, 1) na parte dada (ver _bisseccaoDescartes)."""
+    if parte == 0:
+        return yLo, yHi
+    if parte == 2:
+        return -yHi, -yLo
+    # x = ±1/y: y -> 0 corresponde a |x| -> inf, limitado pelo limite de Cauchy das raízes
+    inversoLo = 1.0 / yLo if yLo > 0 and 1.0 / yLo < cauchy else cauchy
+    if parte == 1:
+        return 1.0 / yHi, inversoLo
+    return -inversoLo, -1.0 / yHi
+
+
+def _recortar(coef: np.ndarray, lo: float, hi: float, a: float, b: float) -> Optional[Tuple[float, float]]:
+    """
+    Restringe a (a,b] um intervalo (lo, hi) com uma única raiz simples, decidindo pelo sinal
+    exato de P nos novos extremos. Retorna None se a raiz estiver fora de (a,b].
+    """
+    if lo < a:
+        if _sinalExato(coef, a) * _sinalExato(coef, hi) >= 0:
+            return None
+        lo = a
+    if hi > b:
+        sinalB = _sinalExato(coef, b)
+        if sinalB != 0 and _sinalExato(coef, lo) * sinalB > 0:
+            return None
+        hi = b
+    return lo, hi
+
+
+def _variacoesDescartes(Q: np.ndarray) -> int:
+    """
+    Número de variações de sinal dos coeficientes de (x+1)^n Q(1/(x+1)): pela regra de
+    Descartes, um limite superior (com a mesma paridade) para o número de raízes de Q em (0, 1).
+    """
+    transformado = _deslocarUm(Q[::-1])
+    sinais = transformado[transformado != 0] > 0
+    return int(np.count_nonzero(sinais[1:] != sinais[:-1]))
+
+
+def _deslocarUm(coef: np.ndarray) -> np.ndarray:
+    """
+    Coeficientes (ordem decrescente) de Q(x + 1), pelo esquema de Horner para o deslocamento
+    de Taylor: n passadas de soma acumulada sobre prefixos cada vez menores, O(n^2).
+    Preserva o dtype, então arrays de inteiros do Python (dtype=object) são deslocados sem erro.
+    """
+    c = np.array(coef)
+    n = len(c) - 1
+    for i in range(n):
+        np.cumsum(c[:n - i + 1], out=c[:n - i + 1])
+    return c
+
+
+def _coeficientesInteiros(values: np.ndarray) -> np.ndarray:
+    """Coeficientes inteiros (dtype=object) proporcionais aos floats dados, sem arredondamento."""
+    razoes = [c.as_integer_ratio() for c in values.tolist()]
+    denominador = max(d for _, d in razoes)
+    return np.array([num * (denominador // d) for num, d in razoes], dtype=object)
+
+
+def _sinalExato(coef: np.ndarray, x: float) -> int:
+    """Sinal exato (-1, 0 ou 1) de P(x), com os coeficientes inteiros de _coeficientesInteiros."""
+    x = Fraction(x)
+    valor = Fraction(0)
+    for c in coef:
+        valor = valor * x + c
+    return (valor > 0) - (valor < 0)
+
 if __name__ == '__main__':
     f = lambda x: x**2 - 2
     df = lambda x: 2*x
@@ -0,0 +1,55 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from CB2325NumericaG6.core import Interval, linspace
+
+
+def test_importar_pacote_nao_carrega_matplotlib():
+    # Roda num processo novo: neste processo o pytest/outros testes já podem ter importado o matplotlib
+    codigo = "import sys, CB2325NumericaG6; print('matplotlib' in sys.modules)"
+    saida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True)
+    assert saida.stdout.strip() == "False"
+
+
+def test_plot_importa_matplotlib_sob_demanda():
+    codigo = (
+        "import sys, matplotlib; matplotlib.use('Agg')\n"
+        "from CB2325NumericaG6 import Polinomio, Interval\n"
+        "fig, ax = Polinomio([1.0, 0.0, -1.0]).plot(Interval(-1, 1))\n"
+        "print(type(fig).__name__)"
+    )
+    saida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True)
+    assert saida.stdout.strip() == "Figure"
+
+
+def test_interval_contains():
+    I = Interval(2.0, -1.0)
+    assert I.min == -1.0 and I.max == 2.0
+    assert 0.5 in I
+    assert 2.5 not in I
+    assert Interval(0.0, 1.0) in I
+    assert [0.0, 1.5] in I
+
+
+def test_linspace():
+    assert linspace(0, 5, 6) == pytest.approx([0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+
+
+def test_interval_contains_e_mask_com_arrays():
+    I = Interval(0.0, 1.0)
+    x = np.array([-0.5, 0.0, 0.5, 1.0, 1.5])
+    assert I.mask(x).tolist() == [False, True, True, True, False]
+    assert np.array([0.0, 0.3, 1.0]) in I
+    assert x not in I
+    assert np.float64(0.5) in I
+    assert np.int64(2) not in I
+
+
+def test_interval_shift_e_scale():
+    I = Interval(1.0, 3.0)
+    assert (I.shift(-2.0).min, I.shift(-2.0).max) == (-1.0, 1.0)
+    assert (I.scale(2.0).min, I.scale(2.0).max) == (2.0, 6.0)
+    assert (I.scale(-1.0).min, I.scale(-1.0).max) == (-3.0, -1.0)
@@ -1,6 +1,7 @@
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+import numpy as np
 import pytest
 from CB2325NumericaG6.interpolacao import (
     hermite_interp,
@@ -98,3 +99,482 @@ def test_hermite_interp_invalid():
         hermite_interp([0,1], [1], [0])
     with pytest.raises(ValueError):
         hermite_interp([0], [1], [1])
+
+def test_interpoladores_avaliam_arrays():
+    x = [0.0, 1.0, 2.0, 4.0]
+    y = [1.0, 3.0, 2.0, 0.0]
+    v = np.array([0.0, 0.5, 1.0, 2.5, 4.0])
+    for f in (linear_interp(x, y), poly_interp(x, y), hermite_interp(x, y, [0.0, 1.0, -1.0, 0.0])):
+        Y = f(v)
+        assert isinstance(Y, np.ndarray)
+        assert np.allclose(Y, [f(t) for t in v], rtol=1e-12)
+
+def test_piecewise_array_extrapola_como_escalar():
+    f = linear_interp([0, 1, 2], [0, 2, 3])
+    v = np.array([-1.0, 3.0])
+    assert f.evaluate(v).tolist() == [f.evaluate(-1.0), f.evaluate(3.0)]
+
+def test_poly_interp_baricentrico_igual_a_lagrange():
+    x = [0.0, 1.0, 2.0, 4.0, 5.5]
+    y = [1.0, 3.0, 2.0, 0.0, -1.0]
+    lagrange = poly_interp(x, y)
+    baricentrico = poly_interp(x, y, metodo='baricentrico')
+    v = np.linspace(-1.0, 6.0, 57)
+    assert np.allclose(baricentrico(v), lagrange(v), rtol=1e-12, atol=1e-12)
+    assert baricentrico(v.reshape(3, 19)).shape == (3, 19)
+    # nos próprios nós, o valor é exato
+    assert [baricentrico(t) for t in x] == y
+    assert baricentrico.evaluate(np.array(x)).tolist() == y
+
+    with pytest.raises(ValueError):
+        poly_interp(x, y, metodo='newton')
+    with pytest.raises(ValueError):
+        poly_interp([0.0, 1.0, 1.0], y[:3], metodo='baricentrico')
+
+def test_poly_interp_baricentrico_estavel_em_chebyshev():
+    n = 400
+    x = np.cos(np.pi * (2 * np.arange(n) + 1) / (2 * n))
+    runge = lambda t: 1.0 / (1.0 + 25.0 * t**2)
+    f = poly_interp(x, runge(x), metodo='baricentrico')
+    v = np.linspace(-1.0, 1.0, 1001)
+    assert np.max(np.abs(f(v) - runge(v))) < 1e-12
+
+    # mesmos nós, outro sinal: só o produto pesos * Y é refeito
+    pesos = f.pesos
+    f.atualizar_valores(np.sin(3 * x))
+    assert f.pesos is pesos
+    assert np.max(np.abs(f(v) - np.sin(3 * v))) < 1e-12
+    with pytest.raises(ValueError):
+        f.atualizar_valores([1.0, 2.0])
+
+    g = poly_interp([0.0, 1.0, 2.0], [1.0, 3.0, 7.0])
+    g.atualizar_valores([0.0, 1.0, 4.0])
+    assert g(1.5) == pytest.approx(2.25)
+
+def test_newton_interp_igual_a_lagrange_e_append():
+    from CB2325NumericaG6.interpolacao import newton_interp
+    rng = np.random.default_rng(0)
+    x = np.linspace(-1.0, 1.0, 12)
+    y = rng.standard_normal(12)
+    v = np.linspace(-1.0, 1.0, 41)
+
+    p = newton_interp(x[:3], y[:3])
+    for xi, yi in zip(x[3:], y[3:]):
+        p.append(xi, yi)
+    completo = newton_interp(x, y)
+    assert np.allclose(p.coeficientes, completo.coeficientes, rtol=1e-10)
+    assert np.allclose(p(v), poly_interp(x, y)(v), rtol=1e-9, atol=1e-9)
+    assert p(float(x[5])) == pytest.approx(y[5], abs=1e-12)
+    assert p.X == list(x) and p.Y == list(y)
+
+    P = p.polinomio()
+    assert P.degree == 11 and P is p.polinomio()
+    assert np.allclose(P(v), p(v), rtol=1e-9, atol=1e-9)
+    p.append(1.5, 0.0)
+    assert p.polinomio() is not P and p(1.5) == pytest.approx(0.0, abs=1e-9)
+
+def test_newton_interp_nos_repetidos():
+    from CB2325NumericaG6.interpolacao import newton_interp
+    p = newton_interp([0.0, 1.0], [1.0, 2.0])
+    with pytest.raises(ValueError):
+        p.append(1.0, 5.0)
+    assert p.X == [0.0, 1.0] and p(2.0) == pytest.approx(3.0)
+    with pytest.raises(ValueError):
+        newton_interp([0.0, 0.0], [1.0, 2.0])
+    with pytest.raises(ValueError):
+        newton_interp([0.0], [1.0])
+
+def test_hermite_interp_exato_para_polinomios():
+    from CB2325NumericaG6.polinomios import Polinomio
+    rng = np.random.default_rng(0)
+    x = np.array([-1.0, -0.2, 0.5, 1.0])
+    v = np.linspace(-1.0, 1.0, 33)
+
+    # primeira derivada: grau 2n - 1
+    P = Polinomio(rng.standard_normal(8))
+    f = hermite_interp(x, P(x), P.derivar()(x))
+    assert np.allclose(f(v), P(v), rtol=1e-10, atol=1e-10)
+    assert np.allclose(f.polinomio()._values, P._values, rtol=1e-8, atol=1e-10)
+
+    # derivadas de ordem mais alta, em quantidades diferentes por nó (1 + 3 + 0 + 2 + 4 dados = 10)
+    P = Polinomio(rng.standard_normal(10))
+    d1, d2 = P.derivar(), P.derivar().derivar()
+    dy = [[d1(x[0]), d2(x[0])], [], [d1(x[2])], [d1(x[3]), d2(x[3]), d2.derivar()(x[3])]]
+    f = hermite_interp(x, P(x), dy)
+    assert f.polinomio().degree == 9
+    assert np.allclose(f(v), P(v), rtol=1e-9, atol=1e-9)
+    assert f(0.5) == pytest.approx(P(0.5), abs=1e-12)
+
+def test_hermite_interp_f_como_polinomio_e_saida_escalar():
+    from CB2325NumericaG6.core import Interval
+    from CB2325NumericaG6.polinomios import Polinomio
+    f = hermite_interp([0.0, 1.0, 2.0], [1.0, 2.0, 0.0], [0.0, 1.0, -1.0], Interval(0, 2))
+    # f continua utilizável como Polinomio
+    assert isinstance(f.f, Polinomio) and f.f is f.polinomio()
+    assert f.f.degree == 5
+    assert f.f.prime(1.0) == pytest.approx(1.0)
+    assert (f.f + Polinomio([1.0]))(2.0) == pytest.approx(1.0)
+    # escalares voltam como float, arrays como np.ndarray
+    assert type(f(0.5)) is float and type(f.evaluate(np.float64(1.5))) is float
+    assert f(2.0) == pytest.approx(0.0, abs=1e-12)
+    assert f(np.array([0.0, 1.0])) == pytest.approx([1.0, 2.0])
+    with pytest.raises(Exception):
+        f(3.0)
+
+def test_hermite_interp_nos_repetidos():
+    with pytest.raises(ValueError):
+        hermite_interp([0.0, 0.0], [1.0, 1.0], [0.0, 0.0])
+
+def test_resolver_tridiagonal_igual_a_solve():
+    from CB2325NumericaG6.interpolacao import _resolver_tridiagonal
+    rng = np.random.default_rng(0)
+    for n in (1, 2, 3, 4, 7, 64, 101):
+        a, c = rng.random(n), rng.random(n)
+        b, d = 3.0 + rng.random(n), rng.standard_normal(n)
+        A = np.diag(b) + np.diag(a[1:], -1) + np.diag(c[:-1], 1)
+        assert np.allclose(_resolver_tridiagonal(a, b, c, d), np.linalg.solve(A, d), rtol=1e-12, atol=1e-14)
+
+def test_spline_reproduz_cubicas():
+    from CB2325NumericaG6.interpolacao import spline_interp
+    rng = np.random.default_rng(1)
+    x = np.sort(rng.uniform(-2.0, 2.0, 11))
+    f = lambda t: t**3 - 2 * t**2 + 0.5
+    df = lambda t: 3 * t**2 - 4 * t
+    F = lambda t: t**4 / 4 - 2 * t**3 / 3 + 0.5 * t
+    v = np.linspace(x[0], x[-1], 101)
+
+    for s in (spline_interp(x, f(x), contorno='not-a-knot'),
+              spline_interp(x, f(x), contorno='clamped', dy=(df(x[0]), df(x[-1])))):
+        assert np.allclose(s(v), f(v), atol=1e-12)
+        assert np.allclose(s.prime(v), df(v), atol=1e-10)
+        assert s.integrar() == pytest.approx(F(x[-1]) - F(x[0]), abs=1e-12)
+        assert np.allclose(s.integrar(v[:-1], v[1:]), F(v[1:]) - F(v[:-1]), atol=1e-12)
+        assert isinstance(s(0.3), float)
+
+    # três e dois nós
+    assert spline_interp([0, 1, 3], [0, 1, 9], contorno='not-a-knot')(2.0) == pytest.approx(4.0)
+    assert spline_interp([0, 2], [1, 5])(0.5) == pytest.approx(2.0)
+
+def test_spline_natural_e_suave():
+    from CB2325NumericaG6.interpolacao import spline_interp
+    x = np.linspace(0.0, 2 * np.pi, 40) ** 1.2
+    s = spline_interp(x, np.sin(x))
+    assert np.allclose(s(x), np.sin(x), atol=1e-14)
+    # segunda derivada (2 c_i + 6 d_i s) contínua nos nós internos e nula nas pontas
+    finais = 2 * s._c + 6 * s._d * np.diff(x)
+    assert np.allclose(finais[:-1], 2 * s._c[1:], atol=1e-9)
+    assert s._c[0] == pytest.approx(0.0, abs=1e-12) and finais[-1] == pytest.approx(0.0, abs=1e-12)
+
+def test_spline_muitos_nos_e_erros():
+    from CB2325NumericaG6.interpolacao import spline_interp
+    x = np.linspace(0.0, 10.0, 200001)
+    s = spline_interp(x, np.sin(x), contorno='not-a-knot')
+    v = np.random.default_rng(2).uniform(0.0, 10.0, 1000)
+    assert np.allclose(s(v), np.sin(v), atol=1e-14)
+    assert s.integrar(0.0, 10.0) == pytest.approx(1.0 - np.cos(10.0), abs=1e-13)
+
+    with pytest.raises(ValueError):
+        spline_interp([0.0, 2.0, 1.0], [0.0, 1.0, 2.0])
+    with pytest.raises(ValueError):
+        spline_interp([0.0, 1.0], [0.0, 1.0], contorno='periodic')
+    with pytest.raises(ValueError):
+        spline_interp([0.0, 1.0], [0.0, 1.0], contorno='clamped')
+    with pytest.raises(ValueError):
+        spline_interp([0.0, 1.0, 2.0], [0.0, 1.0])
+
+def test_pchip_preserva_monotonia_e_extremos():
+    from CB2325NumericaG6.interpolacao import pchip_interp
+    rng = np.random.default_rng(3)
+    x = np.cumsum(rng.uniform(0.1, 1.0, 50))
+    y = np.cumsum(rng.uniform(0.0, 1.0, 50) * (rng.random(50) < 0.7))  # monótona, com patamares
+    p = pchip_interp(x, y)
+    v = np.linspace(x[0], x[-1], 5001)
+    assert np.all(np.diff(p(v)) >= -1e-12)
+    assert np.allclose(p(x), y, atol=1e-12)
+    assert np.all(p.prime(v) >= -1e-12)
+
+    # sem ultrapassar os dados em picos e vales
+    q = pchip_interp([0.0, 1.0, 2.0, 3.0, 4.0], [0.0, 1.0, 0.0, 1.0, 0.0])
+    w = np.linspace(0.0, 4.0, 401)
+    assert q(w).max() == pytest.approx(1.0) and q(w).min() == pytest.approx(0.0)
+    assert pchip_interp([0.0, 2.0], [1.0, 5.0])(0.5) == pytest.approx(2.0)
+
+def test_pchip_com_derivadas_dadas():
+    from CB2325NumericaG6.interpolacao import pchip_interp
+    x = np.array([0.0, 0.3, 1.1, 2.0])
+    f = lambda t: 2 * t**3 - t + 1
+    df = lambda t: 6 * t**2 - 1
+    p = pchip_interp(x, f(x), df(x))
+    v = np.linspace(0.0, 2.0, 41)
+    assert np.allclose(p(v), f(v), atol=1e-12)
+    assert np.allclose(p.prime(v), df(v), atol=1e-10)
+    assert p.integrar(0.0, 2.0) == pytest.approx(8.0 - 2.0 + 2.0)
+    with pytest.raises(ValueError):
+        pchip_interp(x, f(x), [1.0])
+
+def test_piecewise_vetorizado_igual_ao_escalar():
+    rng = np.random.default_rng(4)
+    x = np.cumsum(rng.uniform(0.1, 1.0, 30))
+    y = rng.standard_normal(30)
+    f = PiecewiseLinearFunction(x, y)
+    v = np.concatenate([rng.uniform(x[0] - 2.0, x[-1] + 2.0, 200), x])
+    assert np.allclose(f.evaluate(v), [f.evaluate(float(t)) for t in v], rtol=1e-14, atol=1e-14)
+    assert f.evaluate(x).tolist() == y.tolist()
+    assert f.evaluate(np.float64(x[3])) == y[3]
+
+    meios = (x[:-1] + x[1:]) / 2
+    assert np.allclose(f.prime(meios), np.diff(y) / np.diff(x))
+    assert f.prime(float(meios[4])) == pytest.approx((y[5] - y[4]) / (x[5] - x[4]))
+    with pytest.raises(ValueError):
+        f.prime(np.array([meios[0], x[2]]))
+    with pytest.raises(ValueError):
+        f.prime(np.array([x[-1] + 1.0]))
+
+def test_piecewise_malha_uniforme():
+    rng = np.random.default_rng(5)
+    x = np.linspace(-1.0, 2.0, 31)
+    y = rng.standard_normal(31)
+    f = PiecewiseLinearFunction(x, y)
+    assert f.uniforme
+    # referência pela busca binária, com a mesma malha
+    g = PiecewiseLinearFunction(x, y)
+    g.uniforme = False
+
+    v = np.concatenate([rng.uniform(-3.0, 4.0, 500), x, np.nextafter(x, -np.inf), np.nextafter(x, np.inf)])
+    assert np.array_equal(f._segmentos(v), g._segmentos(v))
+    assert [f._segmento(float(t)) for t in v] == g._segmentos(v).tolist()
+    assert np.array_equal(f.evaluate(v), g.evaluate(v))
+    assert f.evaluate(x).tolist() == y.tolist()
+    assert f.evaluate(float(x[7])) == y[7]
+    assert np.isnan(f.evaluate(np.array([np.nan]))[0]) and np.isnan(f.evaluate(np.nan))
+
+    meios = (x[:-1] + x[1:]) / 2
+    assert np.allclose(f.prime(meios), np.diff(y) / np.diff(x))
+    with pytest.raises(ValueError):
+        f.prime(x[3])
+
+def test_piecewise_deteccao_malha_uniforme():
+    x = np.linspace(0.0, 1.0, 101)
+    ruido = x + np.random.default_rng(6).uniform(-1e-12, 1e-12, 101)
+    assert PiecewiseLinearFunction(ruido, ruido).uniforme
+    assert PiecewiseLinearFunction([0.0, 2.0], [1.0, 3.0]).uniforme
+    assert not PiecewiseLinearFunction([0.0, 1.0, 3.0], [0.0, 1.0, 0.0]).uniforme
+    x[50] += 1e-6
+    f = PiecewiseLinearFunction(x, x)
+    assert not f.uniforme
+    assert f.evaluate(x).tolist() == x.tolist()
+
+def test_stream_interp_janela_igual_a_linear_interp():
+    from CB2325NumericaG6.interpolacao import stream_interp
+    rng = np.random.default_rng(7)
+    x = np.cumsum(rng.uniform(0.1, 1.0, 50))
+    y = rng.standard_normal(50)
+    p = stream_interp(8, x[:3], y[:3])
+    bufX = p._bufX
+    for k in range(3, 50):
+        p.append(x[k], y[k])
+        inicio = max(0, k + 1 - 8)
+        assert len(p) == k + 1 - inicio
+        assert p.X.tolist() == x[inicio:k + 1].tolist()
+        ref = linear_interp(x[inicio:k + 1], y[inicio:k + 1])
+        v = rng.uniform(x[inicio] - 1.0, x[k] + 1.0, 20)
+        assert np.allclose(p.evaluate(v), ref.evaluate(v), rtol=1e-13, atol=1e-13)
+        assert p(float(x[k])) == y[k]
+        assert (p.domain.min, p.domain.max) == (x[inicio], x[k])
+    # o buffer não é realocado
+    assert p._bufX is bufX and np.shares_memory(p.X, bufX)
+    meios = (p.X[:-1] + p.X[1:]) / 2
+    assert np.allclose(p.prime(meios), np.diff(p.Y) / np.diff(p.X))
+
+    # os pontos iniciais além da capacidade são descartados
+    q = stream_interp(4, x[:10], y[:10])
+    assert q.X.tolist() == x[6:10].tolist()
+
+def test_stream_interp_erros():
+    from CB2325NumericaG6.interpolacao import stream_interp
+    p = stream_interp(3)
+    with pytest.raises(ValueError):
+        p(0.0)
+    p.append(0.0, 1.0)
+    with pytest.raises(ValueError):
+        p.append(0.0, 2.0)
+    with pytest.raises(ValueError):
+        p.prime(0.5)
+    p.append(1.0, 3.0)
+    assert p(0.5) == 2.0
+    with pytest.raises(ValueError):
+        p.append(0.5, 0.0)
+    with pytest.raises(ValueError):
+        stream_interp(1)
+    with pytest.raises(ValueError):
+        stream_interp(3, [0.0, 2.0, 1.0], [0.0, 0.0, 0.0])
+    with pytest.raises(ValueError):
+        stream_interp(3, [0.0, 1.0], [0.0])
+
+def test_memmap_interp_igual_a_linear_interp(tmp_path):
+    from CB2325NumericaG6.interpolacao import memmap_interp
+    rng = np.random.default_rng(8)
+    x = np.cumsum(rng.uniform(0.1, 1.0, 1000))
+    y = rng.standard_normal(1000)
+    np.save(tmp_path / "x.npy", x)
+    y.tofile(tmp_path / "y.bin")
+    p = memmap_interp(str(tmp_path / "x.npy"), tmp_path / "y.bin")
+    assert isinstance(p.X, np.memmap) and isinstance(p.Y, np.memmap)
+    assert (p.domain.min, p.domain.max) == (x[0], x[-1])
+
+    ref = linear_interp(x, y)
+    v = np.concatenate([rng.uniform(x[0] - 5.0, x[-1] + 5.0, 500), x])
+    assert np.array_equal(p.evaluate(v), ref.evaluate(v))
+    assert p(float(x[10])) == y[10] and p(float(v[0])) == ref(float(v[0]))
+    meios = (x[:-1] + x[1:]) / 2
+    assert np.allclose(p.prime(meios), ref.prime(meios))
+
+    # float32 em binário cru e malha uniforme declarada
+    malha = np.linspace(0.0, 1.0, 1001).astype(np.float32)
+    malha.tofile(tmp_path / "malha.bin")
+    np.save(tmp_path / "dobro.npy", 2 * malha)
+    q = memmap_interp(tmp_path / "malha.bin", tmp_path / "dobro.npy", dtype=np.float32)
+    u = memmap_interp(tmp_path / "malha.bin", tmp_path / "dobro.npy", dtype=np.float32, uniforme=True)
+    w = rng.uniform(0.0, 1.0, 300)
+    assert np.allclose(q.evaluate(w), 2 * w, atol=1e-6)
+    assert np.allclose(u.evaluate(w), 2 * w, atol=1e-6)
+    assert q.evaluate(0.5) == pytest.approx(1.0)
+
+def test_memmap_interp_nos_inteiros_com_consultas_negativas(tmp_path):
+    from CB2325NumericaG6.interpolacao import memmap_interp
+    x = np.array([-4, -2, 0, 2, 4], dtype=np.int64)
+    y = np.array([0.0, 10.0, 0.0, 10.0, 0.0])
+    x.tofile(tmp_path / "t.bin")
+    ref = linear_interp(x.astype(float), y)
+    v = np.array([-3.5, -2.5, -2.0, -1.5, -0.5, 0.0, 0.5, 1.5, 3.9, -7.25, 9.5])
+    for uniforme in (False, True):
+        p = memmap_interp(tmp_path / "t.bin", y, dtype=np.int64, uniforme=uniforme)
+        assert p(-0.5) == pytest.approx(2.5)
+        assert np.allclose(p.evaluate(v), ref.evaluate(v))
+        assert [p.evaluate(float(t)) for t in v] == pytest.approx(ref.evaluate(v).tolist())
+        assert p.prime(-0.5) == pytest.approx(-5.0)
+
+def test_memmap_interp_nos_e_consultas_inteiros():
+    from CB2325NumericaG6.interpolacao import memmap_interp
+    x = np.arange(-5, 10)
+    y = np.sin(x.astype(float))
+    ref = linear_interp(x.astype(float), y)
+    consultas = np.array([-7, -5, 1, 2, 3, 9, 12])
+    for uniforme in (False, True):
+        p = memmap_interp(x, y, uniforme=uniforme)
+        assert np.allclose(p(np.array([1, 2, 3])), y[6:9])
+        assert np.allclose(p.evaluate(consultas), ref.evaluate(consultas.astype(float)))
+        assert p.evaluate(-7) == pytest.approx(ref.evaluate(-7.0))
+
+def test_memmap_interp_nao_copia_a_tabela():
+    import tracemalloc
+    from CB2325NumericaG6.interpolacao import memmap_interp
+    for dtype in (np.float64, np.float32, np.int64):
+        x = np.linspace(0.0, 1.0, 10**6).astype(dtype) if dtype != np.int64 else np.arange(10**6, dtype=dtype)
+        p = memmap_interp(x, x)
+        tracemalloc.start()
+        p.evaluate(np.array([0.1, 0.7]))
+        p.evaluate(0.3)
+        p.prime(0.55)
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert pico < 10**4
+
+    with pytest.raises(ValueError):
+        memmap_interp(np.zeros(3), np.zeros(2))
+    with pytest.raises(ValueError):
+        memmap_interp(np.zeros(1), np.zeros(1))
+
+def test_piecewise_raizes_vetorizadas():
+    rng = np.random.default_rng(9)
+    x = np.cumsum(rng.uniform(0.1, 1.0, 400))
+    y = rng.integers(-2, 3, 400).astype(float)
+    f = PiecewiseLinearFunction(x, y)
+
+    # referência: o laço original, segmento a segmento
+    esperado = []
+    for i in range(len(x) - 1):
+        if y[i] * y[i + 1] < 0:
+            esperado.append((x[i], x[i + 1]))
+        if y[i] == 0:
+            esperado.append((x[i], x[i]))
+    if y[-1] == 0:
+        esperado.append((x[-1], x[-1]))
+    assert f.encontrar_segmentos_raiz() == esperado
+
+    raizes = f.raizes()
+    assert len(raizes) == len(esperado)
+    assert np.all(np.diff(raizes) > 0)
+    assert np.allclose(f.evaluate(raizes), 0.0, atol=1e-12)
+    assert all(a <= r <= b for r, (a, b) in zip(raizes, esperado))
+
+    # nós nulos vizinhos (segmento identicamente nulo) aparecem uma vez cada
+    g = linear_interp([0, 1, 2, 3], [0, 0, 1, -1])
+    assert g.encontrar_segmentos_raiz() == [(0.0, 0.0), (1.0, 1.0), (2.0, 3.0)]
+    assert g.raizes().tolist() == [0.0, 1.0, 2.5]
+
+    # valores minúsculos: o produto y_i * y_(i+1) daria 0 por underflow
+    h = linear_interp([0, 1], [1e-200, -1e-200])
+    assert h.encontrar_segmentos_raiz() == [(0.0, 1.0)]
+    assert h.raizes().tolist() == [0.5]
+    assert linear_interp([0, 1], [1, 2]).raizes().size == 0
+
+def test_grid_interp_bilinear_igual_a_linear_interp_aninhado():
+    from CB2325NumericaG6.interpolacao import grid_interp
+    rng = np.random.default_rng(10)
+    x = np.cumsum(rng.uniform(0.1, 1.0, 15))
+    y = np.linspace(-1.0, 1.0, 11)
+    z = rng.standard_normal((15, 11))
+    f = grid_interp(x, y, z)
+    assert f.uniforme == (False, True)
+
+    qx = rng.uniform(x[0], x[-1], 50)
+    qy = rng.uniform(y[0], y[-1], 50)
+    # emulação com interpolações lineares aninhadas: primeiro em y, depois em x
+    esperado = [linear_interp(x, [linear_interp(y, linha).evaluate(b) for linha in z]).evaluate(a) for a, b in zip(qx, qy)]
+    assert np.allclose(f.evaluate(qx, qy), esperado, rtol=1e-13, atol=1e-13)
+    assert f(float(x[3]), float(y[7])) == z[3, 7]
+    assert f.evaluate(x[:, None], y[None, :]).tolist() == z.tolist()
+
+    # funções bilineares são reproduzidas, também fora da grade (extrapolação pela borda)
+    g = grid_interp(x, y, 2 * x[:, None] * y[None, :] - x[:, None] + 3)
+    px, py = rng.uniform(x[0] - 1, x[-1] + 1, 100), rng.uniform(-2, 2, 100)
+    assert np.allclose(g.evaluate(px, py), 2 * px * py - px + 3)
+    with pytest.raises(Exception):
+        g(float(x[-1]) + 1.0, 0.0)
+
+def test_grid_interp_bicubico():
+    from CB2325NumericaG6.interpolacao import grid_interp
+    rng = np.random.default_rng(11)
+    x = np.sort(rng.uniform(0.0, 3.0, 12))
+    y = np.linspace(-1.0, 2.0, 9)
+    F = lambda a, b: a * a + a * b - 2 * b * b + 3 * a - 1
+    f = grid_interp(x, y, F(x[:, None], y[None, :]), metodo='bicubico')
+    qx, qy = rng.uniform(x[0], x[-1], 400), rng.uniform(y[0], y[-1], 400)
+    # polinômios de grau até 2 são reproduzidos exatamente
+    assert np.allclose(f.evaluate(qx, qy), F(qx, qy), atol=1e-12)
+    assert f.evaluate(x[:, None], y[None, :]) == pytest.approx(F(x[:, None], y[None, :]))
+    assert f.evaluate(qx, 0.5).shape == (400,)
+
+    # função suave: o bicúbico é mais preciso que o bilinear
+    x = np.linspace(0.0, np.pi, 30)
+    z = np.sin(x)[:, None] * np.cos(x)[None, :]
+    qx, qy = rng.uniform(0.0, np.pi, (2, 1000))
+    exato = np.sin(qx) * np.cos(qy)
+    erroBilinear = np.max(np.abs(grid_interp(x, x, z).evaluate(qx, qy) - exato))
+    erroBicubico = np.max(np.abs(grid_interp(x, x, z, metodo='bicubico').evaluate(qx, qy) - exato))
+    assert erroBicubico < erroBilinear / 10
+
+def test_grid_interp_erros():
+    from CB2325NumericaG6.interpolacao import grid_interp
+    with pytest.raises(ValueError):
+        grid_interp([0, 1], [0, 1], np.zeros((3, 2)))
+    with pytest.raises(ValueError):
+        grid_interp([0], [0, 1], np.zeros((1, 2)))
+    with pytest.raises(ValueError):
+        grid_interp([1, 0], [0, 1], np.zeros((2, 2)))
+    with pytest.raises(ValueError):
+        grid_interp([0, 1], [0, 1], np.zeros((2, 2)), metodo='spline')
+    # dois nós por eixo também funcionam no bicúbico
+    f = grid_interp([0, 1], [0, 1], [[0, 1], [1, 2]], metodo='bicubico')
+    assert f(0.25, 0.5) == pytest.approx(0.75)
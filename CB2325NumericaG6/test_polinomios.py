@@ -1,4 +1,5 @@
 import math
+import numpy as np
 import pytest
 
 from CB2325NumericaG6.polinomios import Polinomio, lambdify
@@ -80,7 +81,7 @@ def test_derivar_e_prime_property():
     # prime usa derivar internamente
     x = 5.0
     assert P.prime(x) == pytest.approx(dP.evaluate(x), rel=1e-12)
-    assert dP._values == [6.0, 2.0]
+    assert dP._values.tolist() == [6.0, 2.0]
 
 
 # ----------------------
@@ -91,16 +92,16 @@ def test_divide_by_constante():
     D = Polinomio([2.0])             # 2
     Q, R = P.dividir_por(D)
     # (4x^2+6x+8)/2 = 2x^2+3x+4, resto 0
-    assert Q._values == [2.0, 3.0, 4.0]
-    assert R._values == [0.0]
+    assert Q._values.tolist() == [2.0, 3.0, 4.0]
+    assert R._values.tolist() == [0.0]
 
 
 def test_divide_by_mesmo_grau_da_docstring():
     p1 = Polinomio([4.0, 6.0, 8.0])
     p2 = Polinomio([2.0, 3.0, 4.0])
     Q, R = p1.dividir_por(p2)
-    assert Q._values == [2.0]
-    assert R._values == [0.0]
+    assert Q._values.tolist() == [2.0]
+    assert R._values.tolist() == [0.0]
 
 
 def test_divide_by_zero_gera_erro():
@@ -141,4 +142,373 @@ def test_operacoes_preservam_domain_por_intersecao():
     assert 1.0 in R.domain
     assert 2.0 in R.domain
     assert 0.99 not in R.domain
-    assert 2.01 not in R.domain
\ No newline at end of file
+    assert 2.01 not in R.domain
+
+# ----------------------
+# avaliação vetorizada
+# ----------------------
+def test_avaliacao_vetorizada_equivale_a_escalar():
+    P = Polinomio([3.0, 2.0, -1.0], Interval(-10.0, 10.0))
+    x = np.linspace(-10.0, 10.0, 101)
+    Y = P(x)
+    assert isinstance(Y, np.ndarray) and Y.shape == x.shape
+    assert np.allclose(Y, [P(v) for v in x], rtol=1e-12)
+    # polinômio constante também devolve um array do mesmo formato
+    assert Polinomio([2.0])(x).shape == x.shape
+
+
+def test_avaliacao_vetorizada_fora_do_dominio():
+    P = Polinomio([1.0, 0.0], Interval(0.0, 1.0))
+    with pytest.raises(Exception):
+        P(np.array([0.5, 1.5]))
+
+
+# ----------------------
+# avaliação rápida (sem checagem de domínio)
+# ----------------------
+def test_fast_ignora_dominio():
+    P = Polinomio([1.0, 0.0, -2.0], Interval(0.0, 2.0))
+    with pytest.raises(Exception):
+        P(3.0)
+    assert P.fast(3.0) == pytest.approx(7.0, rel=1e-12)
+    assert P.fast(1.5) == P(1.5)
+
+
+# ----------------------
+# armazenamento compacto
+# ----------------------
+def test_armazenamento_numpy_com_slots():
+    P = Polinomio([0.0, 0.0, 3.0, 2.0, -1.0])
+    assert not hasattr(P, "__dict__")
+    assert isinstance(P._values, np.ndarray)
+    assert P._values.dtype == np.float64 and P._values.flags["C_CONTIGUOUS"]
+    assert P._values.tolist() == [3.0, 2.0, -1.0]
+    assert repr(P) == "[3.0, 2.0, -1.0]"
+
+
+def test_operacoes_cancelam_lider_e_zeram():
+    P = Polinomio([1.0, 2.0, 3.0])
+    Q = Polinomio([1.0, 0.0, 1.0])
+    assert (P - Q)._values.tolist() == [2.0, 2.0]
+    assert (P - P).isZero
+    assert (0 * P).isZero
+    assert (-P)._values.tolist() == [-1.0, -2.0, -3.0]
+
+
+# ----------------------
+# produto de polinômios
+# ----------------------
+def test_produto_de_polinomios():
+    P = Polinomio([1.0, 1.0], Interval(0.0, 2.0))   # x + 1
+    Q = Polinomio([1.0, -1.0], Interval(1.0, 3.0))  # x - 1
+    R = P * Q
+    assert R._values.tolist() == [1.0, 0.0, -1.0]
+    assert R.domain.min == 1.0 and R.domain.max == 2.0
+    # escalar continua funcionando dos dois lados
+    assert (3 * P)._values.tolist() == [3.0, 3.0]
+    assert (P * 3)._values.tolist() == [3.0, 3.0]
+
+
+def test_produto_fft_equivale_a_convolucao_direta():
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal(Polinomio.FFT_CROSSOVER + 50)
+    b = rng.standard_normal(Polinomio.FFT_CROSSOVER + 10)
+    R = Polinomio(a) * Polinomio(b)
+    assert np.allclose(R._values, np.convolve(a, b), rtol=0, atol=1e-10)
+
+
+def test_divisao_reconstroi_dividendo_nos_dois_caminhos():
+    rng = np.random.default_rng(0)
+    B = Polinomio(np.poly(rng.uniform(-0.5, 0.5, 5)))  # bem condicionado: raízes dentro do disco unitário
+    for grau_quociente in (3, Polinomio.DIVISAO_RECIPROCO_CROSSOVER + 20):
+        A = Polinomio(rng.standard_normal(grau_quociente + 6))
+        Q, R = A.dividir_por(B)
+        assert Q.degree == grau_quociente
+        assert R.degree < B.degree
+        x = np.linspace(-1.0, 1.0, 7)
+        assert np.allclose((B * Q + R)(x), A(x), rtol=1e-9, atol=1e-9)
+
+
+def test_avaliacao_multiponto_equivale_a_horner():
+    rng = np.random.default_rng(1)
+    P = Polinomio(rng.standard_normal(Polinomio.MULTIPONTO_CROSSOVER + 200))
+    x = rng.uniform(-1.0, 1.0, (50, 40))
+    esperado = np.polyval(P._values, x)
+    assert np.allclose(P.avaliar_multiponto(x), esperado, rtol=1e-10, atol=1e-10)
+    assert np.allclose(P(x), esperado, rtol=1e-10, atol=1e-10)  # troca automática em evaluate
+    assert P.avaliar_multiponto(x).shape == x.shape
+    assert np.allclose(Polinomio([2.0, -1.0, 3.0]).avaliar_multiponto(np.array([0.0, 1.0, 2.0])), [3.0, 4.0, 9.0])
+
+
+def test_avaliacao_grau_alto_em_pontos_complexos():
+    import warnings
+    rng = np.random.default_rng(2)
+    P = Polinomio(rng.standard_normal(201))
+    z = np.full(Polinomio.MULTIPONTO_MIN_PONTOS, 0.5 + 0.5j)
+    z[1:] += rng.uniform(-0.1, 0.1, len(z) - 1)
+    with warnings.catch_warnings():
+        # a conversão para float descartaria a parte imaginária com ComplexWarning
+        warnings.simplefilter("error")
+        valores = P.evaluate(z)
+    assert np.iscomplexobj(valores)
+    assert np.allclose(valores, np.polyval(P._values, z), rtol=1e-10, atol=1e-10)
+
+
+# ----------------------
+# todas as raízes
+# ----------------------
+def test_raizes_casos_simples():
+    z, erros = Polinomio([1.0, 0.0, -1.0]).raizes()
+    assert np.allclose(z, [-1.0, 1.0]) and erros.shape == (2,)
+
+    z, _ = Polinomio([1.0, 0.0, 1.0]).raizes('aberth')
+    assert np.allclose(z, [-1j, 1j])
+
+    # raízes nulas são exatas
+    z, erros = Polinomio([1.0, 0.0, -2.0, 0.0, 0.0]).raizes()
+    assert np.count_nonzero(z == 0) == 2 and np.all(erros[z == 0] == 0.0)
+
+    z, erros = Polinomio([3.0]).raizes()
+    assert z.size == 0 and erros.size == 0
+
+    with pytest.raises(ValueError):
+        Polinomio([0.0]).raizes()
+    with pytest.raises(ValueError):
+        Polinomio([1.0, 1.0]).raizes('newton')
+
+
+@pytest.mark.parametrize("metodo", ["companheira", "aberth"])
+def test_raizes_com_estimativa_de_erro(metodo):
+    rng = np.random.default_rng(3)
+    exatas = rng.uniform(-1.0, 1.0, 30) + 1j * rng.uniform(-1.0, 1.0, 30)
+    exatas = np.concatenate([exatas, exatas.conj()])
+    P = Polinomio(np.poly(exatas).real)
+    z, erros = P.raizes(metodo)
+    assert z.shape == (60,)
+    distancias = np.abs(z[:, None] - exatas[None, :]).min(axis=1)
+    assert np.all(distancias <= erros)
+    assert erros.max() < 1e-6
+
+
+def test_raizes_aberth_concorda_com_companheira_em_grau_alto():
+    rng = np.random.default_rng(4)
+    P = Polinomio(rng.standard_normal(Polinomio.RAIZES_ABERTH_CROSSOVER + 50))
+    zAberth, _ = P.raizes()
+    zComp, _ = P.raizes('companheira')
+    l, L = P.get_limite_raizes()
+    assert np.abs(zAberth).max() <= max(-l, L)
+    assert np.abs(zAberth[:, None] - zComp[None, :]).min(axis=1).max() < 1e-8
+
+
+# ----------------------
+# polinômio congelado
+# ----------------------
+def test_hash_consistente_com_eq():
+    P = Polinomio([1.0, -0.0, 2.0]).congelar()
+    Q = Polinomio([1.0, 0.0, 2.0]).congelar()
+    assert P == Q and hash(P) == hash(Q)
+    assert {P: "p"}[Q] == "p"
+
+
+def test_polinomio_mutavel_nao_e_hashable():
+    P = Polinomio([1.0, 2.0])
+    with pytest.raises(TypeError, match="congelar"):
+        hash(P)
+    with pytest.raises(TypeError):
+        {P: 1}
+
+
+def test_setitem_invalida_derivada_em_cache():
+    P = Polinomio([1.0, 2.0, 3.0])
+    assert P.prime(1.0) == 4.0
+    P[0] = 2.0
+    assert P.prime(1.0) == 6.0
+
+
+def test_polinomio_congelado_e_imutavel():
+    P = Polinomio([1.0, 0.0, -2.0], Interval(-3, 3)).congelar()
+    with pytest.raises(TypeError):
+        P[0] = 5.0
+    with pytest.raises(AttributeError):
+        P.domain = None
+    with pytest.raises(ValueError):
+        P._values[0] = 5.0
+    assert P.congelar() is P
+
+
+def test_polinomio_congelado_memoiza_derivados():
+    from CB2325NumericaG6.polinomios import PolinomioCongelado
+    from CB2325NumericaG6.raizes import sturm, sturm_cache_clear
+    sturm_cache_clear()
+    P = Polinomio([1.0, 0.0, -3.0, 1.0]).congelar()
+    assert P.cache_info() == (0, 0, 0)
+
+    dP = P.derivar()
+    assert isinstance(dP, PolinomioCongelado) and dP is P.derivar()
+    assert P.get_limite_raizes() == Polinomio([1.0, 0.0, -3.0, 1.0]).get_limite_raizes()
+    assert P.get_limite_raizes() == P.get_limite_raizes()
+
+    assert sturm(P, -3, 3) == 3
+    sequencia = P.sequencia_sturm()
+    assert sturm(P, -3, 0) == 1
+    assert P.sequencia_sturm() == sequencia
+    # sturm usa a sequência como matriz (sequencia_sturm_lote), também guardada no cache
+    assert P.sequencia_sturm_lote() is P.sequencia_sturm_lote()
+    assert P.cache_info().hits >= 5 and P.cache_info().currsize == 4
+
+    z, erros = P.raizes()
+    assert P.raizes()[0] is z and not z.flags.writeable
+
+    P.cache_clear()
+    assert P.cache_info() == (0, 0, 0)
+
+
+def test_polinomio_congelado_prime_nao_conta_acertos():
+    P = Polinomio([1.0, 2.0, 3.0]).congelar()
+    assert P.prime(1.0) == 4.0
+    assert P.cache_info() == (0, 1, 1)
+    for _ in range(3):
+        P.prime(2.0)
+    assert P.cache_info() == (0, 1, 1)
+
+
+def test_cache_de_sturm_compartilhado_entre_polinomios_iguais():
+    from CB2325NumericaG6.raizes import sturm, isolar_raizes, sturm_cache_info, sturm_cache_clear
+    sturm_cache_clear()
+    assert sturm_cache_info() == (0, 0, 0)
+    P = Polinomio([1.0, 0.0, -3.0, 1.0])
+    assert sturm(P, -3, 3) == 3
+    assert sturm_cache_info() == (0, 1, 1)
+
+    # Uma cópia mutável e uma congelada com os mesmos coeficientes reaproveitam a sequência
+    assert len(isolar_raizes(Polinomio([1.0, 0.0, -3.0, 1.0]), -3, 3)) == 3
+    assert sturm(P.congelar(), -3, 0) == 1
+    assert sturm_cache_info() == (2, 1, 1)
+
+    # Alterar P muda a chave: a sequência antiga não é usada
+    P[3] = -1.0
+    assert sturm(P, -3, 3) == 3
+    assert sturm_cache_info() == (2, 2, 2)
+    sturm_cache_clear()
+    assert sturm_cache_info() == (0, 0, 0)
+
+
+def test_polinomio_congelado_copia_e_pickle():
+    import copy
+    import pickle
+    from CB2325NumericaG6.core import Interval
+    from CB2325NumericaG6.polinomios import PolinomioCongelado
+    P = Polinomio([2.0, -1.0, 3.0], Interval(-1, 2)).congelar()
+    P.derivar()
+    assert copy.copy(P) is P and copy.deepcopy(P) is P
+    assert copy.deepcopy({P: 1})[P] == 1
+
+    Q = pickle.loads(pickle.dumps(P))
+    assert isinstance(Q, PolinomioCongelado)
+    assert Q == P and hash(Q) == hash(P) and {P: "a"}[Q] == "a"
+    assert (Q.domain.min, Q.domain.max) == (-1, 2)
+    assert not Q._values.flags.writeable
+    assert Q.cache_info() == (0, 0, 0)
+    with pytest.raises(AttributeError):
+        Q.domain = None
+
+
+# ----------------------
+# lote de polinômios
+# ----------------------
+def test_polinomio_batch_avalia_todos_de_uma_vez():
+    from CB2325NumericaG6.polinomios import PolinomioBatch
+    polinomios = [Polinomio([1.0, 0.0, -1.0]), Polinomio([2.0, 1.0]), Polinomio([5.0])]
+    lote = PolinomioBatch(polinomios)
+    x = np.linspace(-2.0, 2.0, 9)
+
+    Y = lote.evaluate(x)
+    assert Y.shape == (3, 9)
+    for linha, P in zip(Y, polinomios):
+        assert np.allclose(linha, P(x), rtol=1e-12)
+    assert lote.evaluate(2.0).tolist() == [3.0, 5.0, 5.0]
+    assert lote.degree.tolist() == [2, 1, 0]
+    assert lote[1]._values.tolist() == [2.0, 1.0]
+
+
+def test_polinomio_batch_derivar_e_aritmetica():
+    from CB2325NumericaG6.polinomios import PolinomioBatch
+    polinomios = [Polinomio([3.0, 2.0, -1.0]), Polinomio([1.0, 4.0])]
+    lote = PolinomioBatch(polinomios)
+    x = np.array([-1.0, 0.5, 3.0])
+
+    dLote = lote.derivar()
+    for linha, P in zip(dLote.evaluate(x), polinomios):
+        assert np.allclose(linha, P.derivar()(x))
+
+    S = lote + Polinomio([1.0, 0.0, 0.0])
+    assert np.allclose(S.evaluate(x)[1], (polinomios[1] + Polinomio([1.0, 0.0, 0.0]))(x))
+    assert np.allclose((lote - lote).evaluate(x), 0.0)
+    assert np.allclose((lote * np.array([2.0, -1.0])).evaluate(x), lote.evaluate(x) * [[2.0], [-1.0]])
+    with pytest.raises(ValueError):
+        lote + PolinomioBatch([Polinomio([1.0])])
+
+
+def test_polinomio_mais_e_menos_batch():
+    from CB2325NumericaG6.polinomios import PolinomioBatch
+    polinomios = [Polinomio([3.0, 2.0, -1.0]), Polinomio([1.0, 4.0]), Polinomio([7.0])]
+    lote = PolinomioBatch(polinomios)
+    P = Polinomio([1.0, 2.0])
+    x = np.array([-1.5, 0.0, 0.5, 2.0])
+
+    soma = P + lote
+    diferenca = P - lote
+    assert isinstance(soma, PolinomioBatch) and isinstance(diferenca, PolinomioBatch)
+    for linhaSoma, linhaDiferenca, Q in zip(soma.evaluate(x), diferenca.evaluate(x), polinomios):
+        assert np.allclose(linhaSoma, (P + Q)(x))
+        assert np.allclose(linhaDiferenca, (P - Q)(x))
+    with pytest.raises(TypeError):
+        P + "1"
+
+
+# ----------------------
+# shift, scale e composição
+# ----------------------
+def test_shift_scale_compose_contra_avaliacao_direta():
+    rng = np.random.default_rng(0)
+    P = Polinomio(rng.standard_normal(41))
+    x = np.linspace(-0.9, 0.9, 25)
+
+    assert np.allclose(P.shift(0.05)(x), P(x + 0.05), rtol=1e-10, atol=1e-10)
+    assert np.allclose(P.scale(-0.5)(x), P(-0.5 * x), rtol=1e-10, atol=1e-10)
+    Q = Polinomio([0.5, 0.1, -0.2])
+    assert np.allclose(P.compose(Q)(x), P(Q(x)), rtol=1e-10, atol=1e-10)
+    assert P.compose(Q).degree == 80
+    assert P.scale(0.0)._values.tolist() == [P._values[-1]]
+    assert Polinomio([1.0, 2.0, 1.0]).shift(-1.0)._values.tolist() == [1.0, 0.0, 0.0]
+
+
+def test_compose_divisao_e_conquista_igual_a_horner(monkeypatch):
+    rng = np.random.default_rng(1)
+    P = Polinomio(rng.standard_normal(300))
+    Q = Polinomio([0.01, 1.0, 0.001])
+    horner = P.compose(Q)._values
+    monkeypatch.setattr(Polinomio, "COMPOSICAO_CROSSOVER", 0)
+    rapida = P.compose(Q)._values
+    assert np.allclose(rapida, horner, rtol=1e-10, atol=1e-12 * np.abs(horner).max())
+    assert np.allclose(P.shift(0.001)._values, P.compose(Polinomio([1.0, 0.001]))._values)
+
+
+def test_shift_scale_compose_mapeiam_dominio():
+    P = Polinomio([1.0, 0.0, 0.0], Interval(0.0, 2.0))
+    D = P.shift(1.0).domain
+    assert (D.min, D.max) == (-1.0, 1.0)
+    D = P.scale(-2.0).domain
+    assert (D.min, D.max) == (-1.0, 0.0)
+    # P(2x + 1) está definido onde 0 <= 2x + 1 <= 2
+    D = P.compose(Polinomio([2.0, 1.0], Interval(-10.0, 0.0))).domain
+    assert (D.min, D.max) == (-0.5, 0.0)
+    assert P.compose(Polinomio([1.0, 0.0, 0.0], Interval(-1.0, 1.0))).domain.max == 1.0
+    assert Polinomio([1.0, 0.0]).shift(1.0).domain is None
+
+    with pytest.raises(ValueError):
+        P.compose(Polinomio([1.0, 5.0], Interval(0.0, 1.0)))
+    with pytest.raises(ValueError):
+        P.compose(Polinomio([3.0]))
+    with pytest.raises(ValueError):
+        Polinomio([1.0, 0.0], Interval(1.0, 2.0)).scale(0.0)
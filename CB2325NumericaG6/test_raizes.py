@@ -1,5 +1,6 @@
 # CB2325NumericaG6/test_raizes.py
 import math
+import numpy as np
 import pytest
 import matplotlib
 matplotlib.use("Agg") 
@@ -14,8 +15,11 @@ from CB2325NumericaG6.raizes import (
     plot_bisseccao,
     plot_newton_raphson,
     sturm,
+    isolar_raizes,
+    raizes_reais,
 )
 from CB2325NumericaG6.polinomios import Polinomio
+from CB2325NumericaG6.core import Interval, fast_callable
 
 #funções base para testes 
 f_sq2 = lambda x: x**2 - 2.0
@@ -89,3 +93,129 @@ def test_sturm_intervalo_invalido():
         _ = sturm(P, 1.0, 1.0)
     with pytest.raises(ValueError):
         _ = sturm(P, 2.0, -2.0)
+
+def test_metodos_usam_avaliacao_rapida_de_polinomio():
+    P = Polinomio([1.0, 0.0, -2.0], Interval(1.0, 2.0))
+    # fast_callable troca P pela avaliação sem checagem de domínio
+    assert fast_callable(P)(3.0) == pytest.approx(7.0)
+    assert fast_callable(f_sq2) is f_sq2
+    assert secante(P, 1.9, 2.0, tol=1e-12) == pytest.approx(math.sqrt(2.0), rel=1e-10)
+    assert bisseccao(P, 1.0, 2.0, tol=1e-10) == pytest.approx(math.sqrt(2.0), rel=1e-8)
+    assert newton_raphson(P, P.prime, 1.5, tol=1e-12) == pytest.approx(math.sqrt(2.0), rel=1e-10)
+
+def test_sturm_grau_alto():
+    raizes = np.linspace(-0.9, 0.9, 12)
+    P = Polinomio(np.poly(raizes))
+    assert sturm(P, -1.0, 1.0) == 12
+    assert sturm(P, 0.0, 1.0) == 6
+
+def test_sturm_conta_raizes_multiplas_uma_vez():
+    P = Polinomio(np.poly([1.0, 1.0, 2.0, 3.0, 3.0, 3.0]))
+    assert sturm(P, 0.0, 4.0) == 3
+    assert sturm(Polinomio([3.0]), 0.0, 1.0) == 0
+
+def test_sturm_ponto_medio_sobre_raiz_multipla():
+    from CB2325NumericaG6.raizes import sturm_particao
+    # o ponto médio 0 + (4 - 0) / 4 = 1 cai exatamente na raiz dupla, onde todos os termos se anulam
+    P = Polinomio(np.poly([1, 1, 2, -1]).tolist())
+    assert raizes_reais(P) == pytest.approx([-1.0, 1.0, 2.0], abs=1e-10)
+    intervalos = isolar_raizes(P, -4, 4)
+    assert len(intervalos) == 3
+    for (lo, hi), raiz in zip(intervalos, [-1.0, 1.0, 2.0]):
+        assert lo < raiz <= hi
+    assert sturm(P, 1.0, 3.0) == 1 and sturm(P, 0.0, 1.0) == 1
+    assert sturm_particao(P, [-4.0, -1.0, 0.0, 1.0, 2.0, 4.0]).tolist() == [1, 0, 1, 1, 0]
+    assert isolar_raizes(P, 1.0, 4.0) == [(1.0, 4.0)]
+
+def test_isolar_raizes_intervalos_disjuntos():
+    exatas = np.arange(1, 21) / 20
+    P = Polinomio(np.poly(exatas))
+    intervalos = isolar_raizes(P, 0.0, 1.01)
+    assert len(intervalos) == 20
+    for (lo, hi), raiz in zip(intervalos, exatas):
+        assert lo < raiz <= hi
+        assert sturm(P, lo, hi) == 1
+    assert all(hi1 <= lo2 for (_, hi1), (lo2, _) in zip(intervalos, intervalos[1:]))
+
+    refinados = isolar_raizes(Polinomio([1.0, 0.0, -2.0]), -2.0, 2.0, tol=1e-12)
+    assert [hi - lo <= 1e-12 for lo, hi in refinados] == [True, True]
+    assert refinados[1][0] <= math.sqrt(2.0) <= refinados[1][1]
+
+    with pytest.raises(ValueError):
+        isolar_raizes(P, 1.0, 0.0)
+
+def test_raizes_reais_todas_as_raizes():
+    assert raizes_reais(Polinomio([1.0, 0.0, -2.0])) == pytest.approx([-math.sqrt(2.0), math.sqrt(2.0)], abs=1e-12)
+    assert raizes_reais(Polinomio([1.0, 0.0, 1.0])) == []
+    assert raizes_reais(Polinomio([2.0, 0.0, 0.0])) == [0.0]
+    # raízes múltiplas aparecem uma vez
+    assert raizes_reais(Polinomio(np.poly([1.0, 1.0, 2.0, 3.0, 3.0, 3.0]))) == pytest.approx([1.0, 2.0, 3.0], abs=1e-8)
+
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        A = rng.standard_normal((8, 8))
+        A = A + A.T
+        assert raizes_reais(Polinomio(np.poly(A))) == pytest.approx(np.linalg.eigvalsh(A), abs=1e-8)
+
+@pytest.mark.parametrize("metodo", ["sturm", "descartes"])
+def test_isolar_raizes_mesma_api_nos_dois_metodos(metodo):
+    P = Polinomio(np.poly([-5.0, -1.0, 0.0, 1.0, 3.0]))
+    assert raizes_reais(P, metodo=metodo) == pytest.approx([-5.0, -1.0, 0.0, 1.0, 3.0], abs=1e-10)
+    assert raizes_reais(P, 0.5, 4.0, metodo=metodo) == pytest.approx([1.0, 3.0], abs=1e-10)
+    for lo, hi in isolar_raizes(P, -10.0, 10.0, metodo=metodo):
+        assert -10.0 <= lo <= hi <= 10.0
+
+    exatas = np.arange(1, 21) / 20
+    assert raizes_reais(Polinomio(np.poly(exatas)), 0.0, 1.01, metodo=metodo) == pytest.approx(exatas, abs=1e-3)
+    assert raizes_reais(Polinomio([1.0, 0.0, 1.0]), metodo=metodo) == []
+
+def test_descartes_exato_em_grau_alto():
+    rng = np.random.default_rng(0)
+    P = Polinomio(rng.standard_normal(51))
+    z, erros = P.raizes()
+    esperadas = np.sort(z[np.abs(z.imag) <= erros].real)
+    assert raizes_reais(P, metodo="descartes") == pytest.approx(esperadas, abs=1e-8)
+
+def test_refinamento_nao_estagna_com_f_grande_num_extremo():
+    # regula falsi (Illinois) estagnava neste caso e devolvia um intervalo de largura 0.10
+    P = Polinomio(np.random.default_rng(0).standard_normal(41).tolist())
+    intervalos = isolar_raizes(P, *map(float, P.get_limite_raizes()), tol=1e-12)
+    assert all(hi - lo <= 1e-12 for lo, hi in intervalos)
+    assert intervalos[0][0] <= -1.2020602407938 <= intervalos[0][1]
+    assert raizes_reais(P) == pytest.approx(raizes_reais(P, metodo="descartes"), abs=1e-11)
+    z = np.roots(P._values)
+    assert raizes_reais(P) == pytest.approx(np.sort(z[np.abs(z.imag) < 1e-9].real), abs=1e-9)
+
+def test_refinamento_sem_convergir_gera_erro():
+    from CB2325NumericaG6.raizes import _refinarIntervalo
+    P = Polinomio([1.0, 0.0, -2.0])
+    contar = lambda lo, hi: 1
+    with pytest.raises(RuntimeError):
+        _refinarIntervalo(P.fast, contar, 0.0, 2.0, 1e-12, max_iter=5)
+
+def test_isolar_raizes_metodo_desconhecido():
+    with pytest.raises(ValueError):
+        isolar_raizes(Polinomio([1.0, 0.0, -1.0]), -2.0, 2.0, metodo="newton")
+
+def test_sturm_vetorizado_em_particao():
+    from CB2325NumericaG6.raizes import sturm_particao
+    exatas = np.array([-2.0, -0.5, 0.25, 1.0, 3.0])
+    P = Polinomio(np.poly(exatas))
+    pontos = np.linspace(-4.0, 4.0, 1601)
+
+    contagens = sturm_particao(P, pontos)
+    assert contagens.shape == (1600,) and contagens.sum() == 5
+    # raiz r no subintervalo i quando pontos[i] < r <= pontos[i+1]
+    esperadas = np.bincount(np.searchsorted(pontos, exatas) - 1, minlength=1600)
+    assert contagens.tolist() == esperadas.tolist()
+    # os extremos que são raízes ficam no intervalo (a,b] à esquerda
+    assert sturm_particao(P, [-3.0, -2.0, 1.0, 3.0]).tolist() == [1, 3, 1]
+
+    a = np.array([-3.0, 0.0, 2.0])
+    assert sturm(P, a, a + 1.5).tolist() == [1, 2, 1]
+    assert sturm(P, -3.0, 3.0) == 5 and isinstance(sturm(P, -3.0, 3.0), int)
+
+    with pytest.raises(ValueError):
+        sturm(P, a, a)
+    with pytest.raises(ValueError):
+        sturm_particao(P, [0.0, 1.0, 1.0])
@@ -0,0 +1,77 @@
+"""
+Benchmark da avaliação de funções reais (Polinomio e interpoladores).
+
+1. Sobrecarga por chamada escalar: __call__ (checagem de domínio) contra a
+   avaliação sem checagem (.fast), que é a usada internamente pelos métodos
+   de raízes e de integração.
+2. Avaliação ponto a ponto (um __call__ por valor) contra a avaliação
+   vetorizada, em que o array inteiro é passado de uma só vez.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_avaliacao.py [pontos]
+"""
+import os
+import sys
+import time
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import Interval, Polinomio, hermite_interp, linear_interp, poly_interp
+
+
+def cronometrar(func, repeticoes: int = 3) -> float:
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def ns_por_chamada(func, x: float = 0.3, numero: int = 200_000) -> float:
+    return min(timeit.repeat(lambda: func(x), number=numero, repeat=3)) / numero * 1e9
+
+
+def sobrecarga() -> None:
+    P = Polinomio([1.0, -2.0, 0.5, 3.0], Interval(0.0, 1.0))
+    livre = Polinomio([1.0, -2.0, 0.5, 3.0])
+    nos = np.linspace(0.0, 1.0, 4)
+    interp = poly_interp(nos, np.sin(nos), Interval(0.0, 1.0))
+
+    casos = {
+        "Polinomio com domínio": (P, P.fast),
+        "Polinomio sem domínio": (livre, livre.fast),
+        "PolinomialInterpolation": (interp, interp.fast),
+    }
+    print(f"{'chamada escalar (grau 3)':<26}{'__call__ (ns)':>16}{'rápida (ns)':>14}{'ganho':>10}")
+    for nome, (checada, rapida) in casos.items():
+        antes, depois = ns_por_chamada(checada), ns_por_chamada(rapida)
+        print(f"{nome:<26}{antes:>16.0f}{depois:>14.0f}{antes / depois:>9.1f}x")
+    print()
+
+
+def main(pontos: int = 10**6) -> None:
+    sobrecarga()
+
+    nos = np.linspace(0.0, 1.0, 8)
+    funcoes = {
+        "Polinomio (grau 5)": Polinomio([1.0, -2.0, 0.5, 3.0, -1.0, 2.0], Interval(0.0, 1.0)),
+        "PolinomialInterpolation": poly_interp(nos, np.sin(nos)),
+        "HermiteInterpolation": hermite_interp(nos, np.sin(nos), np.cos(nos)),
+        "PiecewiseLinearFunction": linear_interp(nos, np.sin(nos)),
+    }
+
+    x = np.linspace(0.0, 1.0, pontos)
+    amostra = x[: max(1, pontos // 100)]
+    print(f"{'função':<26}{'laço (s, estimado)':>20}{'vetorizado (s)':>16}{'ganho':>10}")
+    for nome, f in funcoes.items():
+        laco = cronometrar(lambda: [f(v) for v in amostra], 1) * (len(x) / len(amostra))
+        vetor = cronometrar(lambda: f(x))
+        print(f"{nome:<26}{laco:>20.4f}{vetor:>16.4f}{laco / vetor:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10**6)
@@ -0,0 +1,59 @@
+"""
+Benchmark do deslocamento de Taylor P(x + a) e da composição P(Q(x)).
+
+Compara o esquema de Horner sobre polinômios (O(n^2) para o deslocamento) com a divisão e
+conquista de _compor (O(n log^2 n) com os produtos por FFT), variando o grau, e indica a
+partir de qual tamanho a divisão e conquista vence (valor sugerido para
+Polinomio.COMPOSICAO_CROSSOVER). A diferença relativa entre os dois caminhos é medida nos
+coeficientes, em relação ao maior deles.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_composicao.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import Polinomio
+from CB2325NumericaG6.polinomios import _compor
+
+
+def cronometrar(func, repeticoes: int = 3):
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = func()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    original = Polinomio.COMPOSICAO_CROSSOVER
+
+    for nome, q in (("shift (Q = x + 0.001)", np.array([1.0, 0.001])), ("compose (grau Q = 2)", np.array([0.01, 1.0, 0.001]))):
+        print(nome)
+        print(f"{'grau':>8}{'Horner (ms)':>14}{'D&C (ms)':>12}{'dif. relativa':>16}")
+        crossover = None
+        for grau in (64, 256, 1024, 2048, 4096, 8192, 16384):
+            coef = rng.standard_normal(grau + 1)
+            Polinomio.COMPOSICAO_CROSSOVER = 10**9
+            tHorner, horner = cronometrar(lambda: _compor(coef, q))
+            Polinomio.COMPOSICAO_CROSSOVER = 0
+            tDC, dc = cronometrar(lambda: _compor(coef, q))
+            diferenca = np.max(np.abs(horner - dc)) / np.max(np.abs(horner))
+            if crossover is None and tDC < tHorner:
+                crossover = grau
+            print(f"{grau:>8}{tHorner * 1e3:>14.2f}{tDC * 1e3:>12.2f}{diferenca:>16.1e}")
+        print(f"divisão e conquista mais rápida a partir do grau ~{crossover}\n")
+
+    Polinomio.COMPOSICAO_CROSSOVER = original
+    print(f"(COMPOSICAO_CROSSOVER atual: {original})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark da divisão de polinômios e da contagem de raízes por Sturm.
+
+1. Divisão longa no lugar contra a divisão pelo inverso do divisor, variando
+   o número de coeficientes do quociente, para escolher
+   Polinomio.DIVISAO_RECIPROCO_CROSSOVER.
+2. sturm() em polinômios aleatórios de grau 50 a 500 (a sequência de Sturm é
+   uma cadeia de divisões com quocientes de grau 1).
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_divisao.py
+"""
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import Polinomio, sturm
+from CB2325NumericaG6.polinomios import _dividir
+
+
+def tempo(func, numero: int) -> float:
+    return min(timeit.repeat(func, number=numero, repeat=5)) / numero
+
+
+def divisao() -> None:
+    rng = np.random.default_rng(0)
+    original = Polinomio.DIVISAO_RECIPROCO_CROSSOVER
+    print("dividir_por: divisor de grau 32, variando o grau do quociente")
+    print(f"{'quociente':>10}{'longa (us)':>14}{'recíproco (us)':>17}")
+    for k in (8, 16, 32, 64, 128, 256, 512, 1024):
+        a, b = rng.standard_normal(k + 32), rng.standard_normal(33)
+        numero = max(3, 20_000 // k)
+        Polinomio.DIVISAO_RECIPROCO_CROSSOVER = 10**9
+        longa = tempo(lambda: _dividir(a, b), numero)
+        Polinomio.DIVISAO_RECIPROCO_CROSSOVER = 0
+        reciproco = tempo(lambda: _dividir(a, b), numero)
+        print(f"{k:>10}{longa * 1e6:>14.1f}{reciproco * 1e6:>17.1f}")
+    Polinomio.DIVISAO_RECIPROCO_CROSSOVER = original
+    print(f"(DIVISAO_RECIPROCO_CROSSOVER atual: {original})\n")
+
+
+def sturm_grau_alto() -> None:
+    rng = np.random.default_rng(1)
+    print("sturm(P, -2, 2) em polinômios aleatórios")
+    print(f"{'grau':>6}{'tempo (ms)':>12}{'raízes':>8}")
+    for grau in (50, 100, 200, 300, 500):
+        P = Polinomio(rng.standard_normal(grau + 1))
+        numero = 5
+        t = tempo(lambda: sturm(P, -2.0, 2.0), numero)
+        print(f"{grau:>6}{t * 1e3:>12.2f}{sturm(P, -2.0, 2.0):>8}")
+
+
+if __name__ == "__main__":
+    divisao()
+    sturm_grau_alto()
@@ -0,0 +1,68 @@
+"""
+Benchmark da interpolação 2-D em grades retangulares (grid_interp).
+
+Para grades de 50 x 50 a 2000 x 2000 nós, uniformes (np.linspace) e irregulares, mede a
+avaliação de 10^6 consultas aleatórias com 'bilinear' e 'bicubico' (busca vetorizada por
+eixo, ou conta direta em eixos uniformes). Para comparação, mede a emulação com chamadas
+aninhadas de linear_interp por consulta (uma interpolação em y por linha da grade e uma em x),
+em 200 consultas.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_grid.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import grid_interp, linear_interp
+
+CONSULTAS = 10**6
+
+
+def aninhado(x, y, z, qx, qy):
+    """Emulação anterior: linear_interp em y para cada linha, depois em x, por consulta."""
+    return [linear_interp(x, [linear_interp(y, linha).evaluate(b) for linha in z]).evaluate(a)
+            for a, b in zip(qx, qy)]
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    qx, qy = rng.uniform(0.0, 1.0, (2, CONSULTAS))
+    print(f"{'grade':>12}  {'malha':<10}{'bilinear (M/s)':>16}{'bicúbico (M/s)':>16}"
+          f"{'construção bic. (ms)':>22}{'aninhado (µs/consulta)':>24}")
+    for n in (50, 200, 2000):
+        for malha in ("uniforme", "irregular"):
+            if malha == "uniforme":
+                x = y = np.linspace(0.0, 1.0, n)
+            else:
+                x, y = (np.concatenate([[0.0], np.sort(rng.uniform(0.0, 1.0, n - 2)), [1.0]]) for _ in range(2))
+            z = np.sin(3 * x)[:, None] * np.cos(2 * y)[None, :]
+
+            bilinear = grid_interp(x, y, z)
+            inicio = time.perf_counter()
+            bicubico = grid_interp(x, y, z, metodo="bicubico")
+            tConstrucao = time.perf_counter() - inicio
+
+            taxas = []
+            for f in (bilinear, bicubico):
+                inicio = time.perf_counter()
+                f.evaluate(qx, qy)
+                taxas.append(CONSULTAS / (time.perf_counter() - inicio) / 1e6)
+
+            if n <= 200:
+                inicio = time.perf_counter()
+                referencia = aninhado(x, y, z, qx[:200], qy[:200])
+                tAninhado = (time.perf_counter() - inicio) / 200
+                assert np.allclose(referencia, bilinear.evaluate(qx[:200], qy[:200]))
+            else:
+                tAninhado = float("nan")
+            print(f"{f'{n} x {n}':>12}  {malha:<10}{taxas[0]:>16.1f}{taxas[1]:>16.1f}"
+                  f"{tConstrucao * 1e3:>22.1f}{tAninhado * 1e6:>24.0f}")
+
+
+if __name__ == "__main__":
+    main()
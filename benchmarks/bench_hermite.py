@@ -0,0 +1,74 @@
+"""
+Benchmark da construção do interpolador de Hermite.
+
+Compara, para n nós de Chebyshev em [-1, 1] com valores e primeiras derivadas de sin(3x):
+    - expansão na base: para cada nó, a base de Lagrange L_i, seu quadrado e os polinômios
+      H_i e K_i, somados em coeficientes (a construção anterior de HermiteInterpolation, O(n^3));
+    - diferenças divididas confluentes: hermite_interp(x, y, dy), tabela com os nós repetidos,
+      O(n^2), com os nós na ordem de Leja.
+
+Mostra também o erro máximo de cada um contra sin(3x) em 2001 pontos e o tempo de construção
+com derivadas até a segunda ordem (dy[i] = [y'(xi), y''(xi)]).
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_hermite.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import Polinomio, hermite_interp
+from CB2325NumericaG6.polinomios import _convolver
+
+
+def hermite_por_base(X, Y, DY) -> Polinomio:
+    """Construção anterior: soma de y_i H_i + y'_i K_i expandidos em coeficientes."""
+    n = len(X)
+    coef = np.zeros(2 * n)
+    for i in range(n):
+        Li = np.array([1.0])
+        denom = 1.0
+        for j in range(n):
+            if j != i:
+                Li = _convolver(Li, [-X[j], 1.0])
+                denom *= (X[i] - X[j])
+        Li = Li / denom
+        Li_prime = sum(1 / (X[i] - X[m]) for m in range(n) if m != i)
+        Li2 = _convolver(Li, Li)
+        Ki = _convolver(Li2, [-X[i], 1.0])
+        Hi = _convolver(Li2, [1.0 + 2 * Li_prime * X[i], -2 * Li_prime])
+        coef += Y[i] * Hi + DY[i] * Ki
+    return Polinomio(coef[::-1])
+
+
+def medir(funcao, *args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def main() -> None:
+    hermite_interp([0.0, 1.0], [0.0, 1.0], [0.0, 1.0])  # aquecimento
+    v = np.linspace(-1.0, 1.0, 2001)
+    print(f"{'n':>5}{'base (ms)':>12}{'dif. div. (ms)':>16}{'aceleração':>12}"
+          f"{'erro base':>12}{'erro dif. div.':>16}{'2ª ordem (ms)':>15}")
+    for n in (5, 10, 25, 50, 100, 200, 400):
+        x = np.cos(np.pi * (2 * np.arange(n) + 1) / (2 * n))
+        y, dy, d2y = np.sin(3 * x), 3 * np.cos(3 * x), -9 * np.sin(3 * x)
+
+        tBase, P = medir(hermite_por_base, x, y, dy) if n <= 200 else (float("nan"), None)
+        tDif, f = medir(hermite_interp, x, y, dy)
+        tOrdem2, _ = medir(hermite_interp, x, y, np.column_stack([dy, d2y]))
+
+        erroBase = np.max(np.abs(P(v) - np.sin(3 * v))) if P is not None else float("nan")
+        erroDif = np.max(np.abs(f(v) - np.sin(3 * v)))
+        print(f"{n:>5}{tBase * 1e3:>12.2f}{tDif * 1e3:>16.2f}{tBase / tDif:>11.1f}x"
+              f"{erroBase:>12.1e}{erroDif:>16.1e}{tOrdem2 * 1e3:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
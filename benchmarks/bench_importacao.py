@@ -0,0 +1,48 @@
+"""
+Benchmark do custo de 'import CB2325NumericaG6'.
+
+Mede o tempo de importação em processos novos (para não reaproveitar o cache
+de módulos do interpretador) e lista quais bibliotecas pesadas foram carregadas.
+O matplotlib só deve aparecer depois que alguma função de plotagem for chamada.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_importacao.py [repeticoes]
+"""
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+SCRIPT = """
+import sys, time
+inicio = time.perf_counter()
+import CB2325NumericaG6
+fim = time.perf_counter()
+pesados = sorted({m.split('.')[0] for m in sys.modules} & {'matplotlib', 'PIL', 'numpy'})
+print(fim - inicio, len(sys.modules), ','.join(pesados))
+"""
+
+
+def medir(repeticoes: int = 10) -> None:
+    tempos = []
+    for _ in range(repeticoes):
+        saida = subprocess.run(
+            [sys.executable, "-c", SCRIPT], cwd=RAIZ, capture_output=True, text=True, check=True
+        ).stdout.split()
+        tempos.append(float(saida[0]))
+        modulos, pesados = int(saida[1]), saida[2] if len(saida) > 2 else ""
+
+    tempos.sort()
+    print(f"import CB2325NumericaG6 ({repeticoes} processos)")
+    print(f"  mínimo:  {tempos[0] * 1e3:8.2f} ms")
+    print(f"  mediana: {tempos[len(tempos) // 2] * 1e3:8.2f} ms")
+    print(f"  módulos carregados: {modulos}")
+    print(f"  bibliotecas pesadas: {pesados or '-'}")
+
+    if "matplotlib" in pesados:
+        raise SystemExit("matplotlib foi importado junto com o pacote")
+
+
+if __name__ == "__main__":
+    medir(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
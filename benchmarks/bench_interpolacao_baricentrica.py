@@ -0,0 +1,56 @@
+"""
+Benchmark da interpolação polinomial: forma de Lagrange expandida vs fórmula baricêntrica.
+
+Para n nós de Chebyshev em [-1, 1] e a função de Runge 1 / (1 + 25 x^2), mede:
+    - construção: poly_interp(x, y) (coeficientes, O(n^3)) e
+      poly_interp(x, y, metodo='baricentrico') (pesos, O(n^2));
+    - avaliação em 10000 pontos;
+    - erro máximo contra a função (a expansão em coeficientes perde a precisão para n grande);
+    - atualizar_valores com um novo sinal nos mesmos nós (O(n) no modo baricêntrico).
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_interpolacao_baricentrica.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import poly_interp
+
+
+def runge(t):
+    return 1.0 / (1.0 + 25.0 * t**2)
+
+
+def medir(funcao, *args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def main() -> None:
+    v = np.linspace(-1.0, 1.0, 10000)
+    print(f"{'n':>6}{'constr. lagr. (ms)':>20}{'constr. bar. (ms)':>19}"
+          f"{'aval. lagr. (ms)':>18}{'aval. bar. (ms)':>17}{'erro lagr.':>12}{'erro bar.':>11}{'atualizar (ms)':>16}")
+    for n in (10, 25, 50, 100, 200, 400):
+        x = np.cos(np.pi * (2 * np.arange(n) + 1) / (2 * n))
+        y = runge(x)
+
+        tConstrL, lagrange = medir(poly_interp, x, y)
+        tConstrB, baricentrico = medir(poly_interp, x, y, None, 'baricentrico')
+        tAvalL, yL = medir(lagrange.evaluate, v)
+        tAvalB, yB = medir(baricentrico.evaluate, v)
+        tAtualizar, _ = medir(baricentrico.atualizar_valores, np.sin(3 * x))
+
+        erroL = np.max(np.abs(yL - runge(v)))
+        erroB = np.max(np.abs(yB - runge(v)))
+        print(f"{n:>6}{tConstrL * 1e3:>20.2f}{tConstrB * 1e3:>19.2f}{tAvalL * 1e3:>18.2f}"
+              f"{tAvalB * 1e3:>17.2f}{erroL:>12.1e}{erroB:>11.1e}{tAtualizar * 1e3:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark dos dois motores de isolamento de raízes reais: Sturm vs Descartes (VCA).
+
+Compara raizes_reais(P, metodo='sturm') e raizes_reais(P, metodo='descartes') em três
+famílias de polinômios:
+    - aleatórios: coeficientes normais, graus de 10 a 800 (poucas raízes reais, perto de ±1);
+    - tipo Wilkinson: raízes k/n, k = 1..n (muitas raízes reais, mal condicionadas);
+    - agrupadas: grupos de raízes a distância 1e-3 mais raízes espalhadas.
+
+Para cada caso mostra o tempo e o número de raízes encontradas por cada método, e o número
+de referência: raízes de Polinomio.raizes() com parte imaginária abaixo da estimativa de erro
+(para os aleatórios) ou o número de raízes construídas (para as outras famílias). Nas duas
+últimas famílias, arredondar os coeficientes para float64 pode transformar raízes reais
+próximas em pares complexos, então o polinômio guardado pode ter menos raízes reais que as
+construídas; a contagem de Descartes (em aritmética exata) é a do polinômio guardado.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_isolamento.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import Polinomio, raizes_reais
+
+
+def medir(P: Polinomio, metodo: str):
+    inicio = time.perf_counter()
+    raizes = raizes_reais(P, metodo=metodo)
+    return time.perf_counter() - inicio, len(raizes)
+
+
+def linha(nome: str, P: Polinomio, referencia: int) -> None:
+    tSturm, nSturm = medir(P, "sturm")
+    tDescartes, nDescartes = medir(P, "descartes")
+    print(f"{nome:<22}{P.degree:>6}{referencia:>6}{tSturm * 1e3:>13.1f}{nSturm:>8}{tDescartes * 1e3:>17.1f}{nDescartes:>8}")
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'família':<22}{'grau':>6}{'ref.':>6}{'sturm (ms)':>13}{'raízes':>8}{'descartes (ms)':>17}{'raízes':>8}")
+
+    for grau in (10, 50, 100, 200, 400, 800):
+        P = Polinomio(rng.standard_normal(grau + 1))
+        z, erros = P.raizes()
+        linha("aleatório", P, int(np.count_nonzero(np.abs(z.imag) <= erros)))
+
+    for grau in (10, 15, 20, 25):
+        linha("Wilkinson k/n", Polinomio(np.poly(np.arange(1, grau + 1) / grau)), grau)
+
+    for grupos in (2, 4, 8):
+        raizes = np.concatenate([c + 1e-3 * np.arange(3) for c in rng.uniform(-1, 1, grupos)])
+        raizes = np.concatenate([raizes, rng.uniform(-2, 2, 6)])
+        linha(f"agrupadas ({grupos} x 3)", Polinomio(np.poly(raizes)), len(raizes))
+
+
+if __name__ == "__main__":
+    main()
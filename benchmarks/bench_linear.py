@@ -0,0 +1,67 @@
+"""
+Benchmark da avaliação de PiecewiseLinearFunction.
+
+Para tabelas de 10^2 a 10^6 nós, mede quantas consultas por segundo a interpolação linear
+atende em 10^7 pontos (ordenados e aleatórios) e o tempo por chamada escalar, em duas malhas:
+    - não uniforme: busca binária vetorizada (np.searchsorted) sobre as inclinações
+      pré-calculadas;
+    - uniforme (np.linspace): índice do segmento calculado diretamente, em O(1).
+Também mede prime (derivada) vetorizada em pontos médios dos segmentos.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_linear.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import linear_interp
+
+CONSULTAS = 10**7
+
+
+def consultas_por_segundo(funcao, pontos) -> float:
+    inicio = time.perf_counter()
+    funcao(pontos)
+    return len(pontos) / (time.perf_counter() - inicio)
+
+
+def microssegundos_escalar(funcao, pontos) -> float:
+    inicio = time.perf_counter()
+    for v in pontos:
+        funcao(v)
+    return (time.perf_counter() - inicio) / len(pontos) * 1e6
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    ordenados = np.linspace(0.001, 0.999, CONSULTAS)
+    aleatorios = rng.uniform(0.001, 0.999, CONSULTAS)
+    escalares = aleatorios[:10000].tolist()
+
+    print(f"{'malha':<14}{'nós':>9}{'ordenadas (M/s)':>17}{'aleatórias (M/s)':>18}"
+          f"{'prime (M/s)':>13}{'escalar (µs)':>14}")
+    for malha in ("não uniforme", "uniforme"):
+        for n in (10**2, 10**4, 10**6):
+            if malha == "uniforme":
+                x = np.linspace(0.0, 1.0, n)
+            else:
+                x = np.concatenate([[0.0], np.cumsum(rng.uniform(0.5, 1.5, n - 1))])
+                x /= x[-1]
+            f = linear_interp(x, np.sin(x))
+            assert f.uniforme == (malha == "uniforme")
+            # pontos longe dos nós, onde a derivada está definida
+            meios = ((x[:-1] + x[1:]) / 2)[rng.integers(0, n - 1, CONSULTAS // 10)]
+
+            print(f"{malha:<14}{n:>9}{consultas_por_segundo(f.evaluate, ordenados) / 1e6:>17.1f}"
+                  f"{consultas_por_segundo(f.evaluate, aleatorios) / 1e6:>18.1f}"
+                  f"{consultas_por_segundo(f.prime, meios) / 1e6:>13.1f}"
+                  f"{microssegundos_escalar(f.evaluate, escalares):>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark da avaliação de muitos polinômios na mesma grade de pontos.
+
+Compara avaliar cada Polinomio separadamente (mesmo já vetorizado em x) com
+um único PolinomioBatch, que faz um Horner sobre a matriz de coeficientes.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_lote.py [polinomios] [pontos]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import Polinomio, PolinomioBatch
+
+
+def cronometrar(func, repeticoes: int = 3) -> float:
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main(quantidade: int = 5000, pontos: int = 200) -> None:
+    rng = np.random.default_rng(0)
+    # Graus variados, como os ajustes de ajuste_polinomial
+    polinomios = [Polinomio(rng.standard_normal(rng.integers(2, 8))) for _ in range(quantidade)]
+    lote = PolinomioBatch(polinomios)
+    x = np.linspace(-1.0, 1.0, pontos)
+
+    casos = {
+        "P(x) para cada Polinomio": lambda: np.array([P(x) for P in polinomios]),
+        "PolinomioBatch.evaluate(x)": lambda: lote.evaluate(x),
+        "derivar() de cada Polinomio": lambda: [P.derivar() for P in polinomios],
+        "PolinomioBatch.derivar()": lambda: lote.derivar(),
+        "P + Q para cada par": lambda: [P + P for P in polinomios],
+        "lote + lote": lambda: lote + lote,
+    }
+    print(f"{quantidade} polinômios (grau máximo {lote.max_degree}), {pontos} pontos")
+    for nome, func in casos.items():
+        print(f"  {nome:<30}{cronometrar(func) * 1e3:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:3]]
+    main(*argumentos)
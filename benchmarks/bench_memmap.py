@@ -0,0 +1,100 @@
+"""
+Benchmark da interpolação linear sobre tabelas em disco (memmap_interp).
+
+Grava tabelas x, y em float64 cru com 10^6 a 5 * 10^7 pontos (até 800 MB) em um diretório
+temporário e mede, para memmap_interp:
+    - o tempo de abertura (não lê a tabela);
+    - 10^5 consultas aleatórias em lotes de 10^3 (busca binária no X mapeado) e o tempo por
+      consulta escalar;
+    - o crescimento da memória residente do processo durante as consultas, separada em
+      anônima (RssAnon, memória própria do processo, que deve ficar constante) e páginas do
+      arquivo mapeadas (RssFile, cache do sistema que pode ser descartado a qualquer momento;
+      cresce só com as páginas visitadas pela busca, que com 10^5 consultas aleatórias já são
+      boa parte da tabela).
+Para comparação, carrega as mesmas tabelas com np.fromfile + linear_interp (até 10^7 pontos).
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_memmap.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import linear_interp, memmap_interp
+
+BLOCO = 10**6
+
+
+def rss_mb(campo: str = "RssAnon") -> float:
+    """Memória residente do processo em MB (lida de /proc; nan fora do Linux)."""
+    try:
+        with open("/proc/self/status") as status:
+            for linha in status:
+                if linha.startswith(campo + ":"):
+                    return int(linha.split()[1]) / 1024
+    except OSError:
+        pass
+    return float("nan")
+
+
+def gravar_tabela(diretorio: str, n: int):
+    """Grava x (crescente, não uniforme) e y = sin(x) em blocos, sem montar a tabela na memória."""
+    rng = np.random.default_rng(0)
+    caminhoX, caminhoY = os.path.join(diretorio, "x.bin"), os.path.join(diretorio, "y.bin")
+    ultimo = 0.0
+    with open(caminhoX, "wb") as arqX, open(caminhoY, "wb") as arqY:
+        for inicio in range(0, n, BLOCO):
+            x = ultimo + np.cumsum(rng.uniform(0.5, 1.5, min(BLOCO, n - inicio)))
+            ultimo = x[-1]
+            x.tofile(arqX)
+            np.sin(x / 1000).tofile(arqY)
+    return caminhoX, caminhoY, ultimo
+
+
+def main() -> None:
+    rng = np.random.default_rng(1)
+    print(f"{'pontos':>10}{'abertura (ms)':>15}{'10^5 consultas (ms)':>21}{'escalar (µs)':>14}"
+          f"{'ΔRssAnon (MB)':>15}{'ΔRssFile (MB)':>15}{'carregar (ms)':>15}{'RssAnon carregada (MB)':>24}")
+    for n in (10**6, 10**7, 5 * 10**7):
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminhoX, caminhoY, fim = gravar_tabela(diretorio, n)
+            lotes = rng.uniform(0.0, fim, (100, 1000))
+            escalares = rng.uniform(0.0, fim, 10**4).tolist()
+
+            rssInicial, arquivoInicial = rss_mb(), rss_mb("RssFile")
+            inicio = time.perf_counter()
+            p = memmap_interp(caminhoX, caminhoY)
+            tAbertura = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            for lote in lotes:
+                p.evaluate(lote)
+            tLotes = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            for v in escalares:
+                p.evaluate(v)
+            tEscalar = (time.perf_counter() - inicio) / len(escalares)
+            deltaRss, deltaArquivo = rss_mb() - rssInicial, rss_mb("RssFile") - arquivoInicial
+            del p
+
+            if n <= 10**7:
+                inicio = time.perf_counter()
+                f = linear_interp(np.fromfile(caminhoX), np.fromfile(caminhoY))
+                tCarga = time.perf_counter() - inicio
+                rssCarga = rss_mb() - rssInicial
+                del f
+            else:
+                tCarga = rssCarga = float("nan")
+
+        print(f"{n:>10}{tAbertura * 1e3:>15.2f}{tLotes * 1e3:>21.1f}{tEscalar * 1e6:>14.2f}"
+              f"{deltaRss:>15.1f}{deltaArquivo:>15.1f}{tCarga * 1e3:>15.1f}{rssCarga:>24.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark do produto de polinômios (Polinomio * Polinomio).
+
+Mede a convolução direta e a convolução por FFT para fatores de mesmo grau e
+indica o primeiro tamanho em que a FFT passa a ser mais rápida, que é o valor
+sugerido para Polinomio.FFT_CROSSOVER.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_multiplicacao.py
+"""
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import Polinomio
+from CB2325NumericaG6.polinomios import _convolver
+
+
+def tempo(func, numero: int) -> float:
+    return min(timeit.repeat(func, number=numero, repeat=5)) / numero
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    original = Polinomio.FFT_CROSSOVER
+    crossover = None
+
+    print(f"{'coeficientes':>12}{'direta (us)':>14}{'FFT (us)':>12}{'erro relativo':>16}")
+    for n in (8, 16, 32, 64, 96, 128, 192, 256, 384, 512, 1024, 2048, 4096):
+        a, b = rng.standard_normal(n), rng.standard_normal(n)
+        numero = max(5, 200_000 // (n * 4))
+
+        Polinomio.FFT_CROSSOVER = 10**9
+        direta = tempo(lambda: _convolver(a, b), numero)
+        referencia = _convolver(a, b)
+
+        Polinomio.FFT_CROSSOVER = 0
+        fft = tempo(lambda: _convolver(a, b), numero)
+        erro = np.max(np.abs(_convolver(a, b) - referencia)) / np.max(np.abs(referencia))
+
+        if crossover is None and fft < direta:
+            crossover = n
+        print(f"{n:>12}{direta * 1e6:>14.1f}{fft * 1e6:>12.1f}{erro:>16.1e}")
+
+    Polinomio.FFT_CROSSOVER = original
+    print(f"\nFFT mais rápida a partir de ~{crossover} coeficientes (FFT_CROSSOVER atual: {original})")
+
+    P = Polinomio(rng.standard_normal(2001).tolist())
+    Q = Polinomio(rng.standard_normal(2001).tolist())
+    print(f"Polinomio * Polinomio (grau 2000): {tempo(lambda: P * Q, 20) * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
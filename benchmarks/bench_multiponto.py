@@ -0,0 +1,58 @@
+"""
+Benchmark da avaliação de polinômios de grau alto em muitos pontos.
+
+Compara o Horner vetorizado (n passadas sobre o array de pontos) com
+Polinomio.avaliar_multiponto (produto de matrizes em blocos + Horner em x^B),
+variando o grau, e indica a partir de qual grau a avaliação em blocos vence,
+que é o valor sugerido para Polinomio.MULTIPONTO_CROSSOVER.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_multiponto.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import Polinomio
+
+
+def cronometrar(func, repeticoes: int = 3) -> float:
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    original = Polinomio.MULTIPONTO_CROSSOVER
+
+    for pontos in (1_000, 100_000):
+        x = rng.uniform(-1.0, 1.0, pontos)
+        crossover = None
+        print(f"{pontos} pontos em [-1, 1]")
+        print(f"{'grau':>8}{'Horner (ms)':>14}{'blocos (ms)':>14}{'dif. relativa':>16}")
+        for grau in (16, 32, 64, 128, 256, 512, 1024, 4096):
+            P = Polinomio(rng.standard_normal(grau + 1))
+            Polinomio.MULTIPONTO_CROSSOVER = 10**9
+            horner = cronometrar(lambda: P.evaluate(x))
+            referencia = P.evaluate(x)
+            blocos = cronometrar(lambda: P.avaliar_multiponto(x))
+            diferenca = np.max(np.abs(P.avaliar_multiponto(x) - referencia) / np.maximum(1.0, np.abs(referencia)))
+            if crossover is None and blocos < horner:
+                crossover = grau
+            print(f"{grau:>8}{horner * 1e3:>14.2f}{blocos * 1e3:>14.2f}{diferenca:>16.1e}")
+        print(f"blocos mais rápidos a partir do grau ~{crossover}\n")
+
+    Polinomio.MULTIPONTO_CROSSOVER = original
+    print(f"(MULTIPONTO_CROSSOVER atual: {original})")
+
+
+if __name__ == "__main__":
+    main()
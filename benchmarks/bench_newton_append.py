@@ -0,0 +1,74 @@
+"""
+Benchmark da interpolação com amostras que chegam uma a uma.
+
+Simula um fluxo de n amostras de um sensor: a cada chegada o interpolador é atualizado e
+avaliado em um ponto. Compara:
+    - reconstruir poly_interp (Lagrange expandido, O(n^3) por chegada);
+    - reconstruir poly_interp(metodo='baricentrico') (pesos, O(n^2) por chegada);
+    - NewtonInterpolation.append (nova diagonal da tabela de diferenças divididas, O(n)).
+
+Os nós são de Chebyshev em ordem de Leja (cada nó maximiza o produto das distâncias aos
+anteriores), para que a forma de Newton continue bem condicionada conforme cresce; a última
+coluna compara com o interpolador baricêntrico construído de uma vez.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_newton_append.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import newton_interp, poly_interp
+
+
+def amostras(n: int):
+    nos = np.cos(np.pi * (2 * np.arange(n) + 1) / (2 * n))
+    ordem = [int(np.argmax(np.abs(nos)))]
+    with np.errstate(divide="ignore"):
+        logDistancias = np.log(np.abs(nos - nos[ordem[0]]))
+        for _ in range(n - 1):
+            logDistancias[ordem] = -np.inf
+            ordem.append(int(np.argmax(logDistancias)))
+            logDistancias += np.log(np.abs(nos - nos[ordem[-1]]))
+    x = nos[ordem]
+    return x, np.sin(3 * x) + 0.1 * x**2
+
+
+def fluxo_reconstruindo(x, y, metodo: str) -> float:
+    inicio = time.perf_counter()
+    for k in range(2, len(x) + 1):
+        poly_interp(x[:k], y[:k], None, metodo)(0.3)
+    return time.perf_counter() - inicio
+
+
+def fluxo_append(x, y):
+    inicio = time.perf_counter()
+    p = newton_interp(x[:2], y[:2])
+    p(0.3)
+    for xi, yi in zip(x[2:], y[2:]):
+        p.append(xi, yi)
+        p(0.3)
+    return time.perf_counter() - inicio, p
+
+
+def main() -> None:
+    fluxo_append(*amostras(10))  # aquecimento
+    print(f"{'amostras':>9}{'lagrange (ms)':>15}{'baricêntrico (ms)':>19}{'append (ms)':>13}{'µs/append':>11}{'erro máx.':>11}")
+    for n in (25, 50, 100, 200, 400, 800):
+        x, y = amostras(n)
+        tLagrange = fluxo_reconstruindo(x, y, 'lagrange') if n <= 100 else float('nan')
+        tBaricentrico = fluxo_reconstruindo(x, y, 'baricentrico')
+        tAppend, p = fluxo_append(x, y)
+
+        v = np.linspace(-1.0, 1.0, 1001)
+        erro = np.max(np.abs(p(v) - poly_interp(x, y, None, 'baricentrico')(v)))
+        print(f"{n:>9}{tLagrange * 1e3:>15.1f}{tBaricentrico * 1e3:>19.1f}{tAppend * 1e3:>13.1f}"
+              f"{tAppend / (n - 2) * 1e6:>11.1f}{erro:>11.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark da interpolação cúbica de Hermite por partes (PCHIP) contra o Hermite global.
+
+Para n nós de uma curva monótona com ruído, mede a construção e a avaliação em 10^6 pontos de:
+    - hermite_interp(x, y, dy): um único polinômio de grau 2n - 1 (até n = 200);
+    - pchip_interp(x, y, dy): uma cúbica por intervalo com as derivadas dadas;
+    - pchip_interp(x, y): inclinações estimadas para preservar a monotonia.
+Também conta quantos pontos avaliados violam a monotonia dos dados.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_pchip.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import hermite_interp, pchip_interp
+
+
+def medir(funcao, *args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    pontos = np.sort(rng.uniform(0.0, 1.0, 10**6))
+    print(f"{'n':>9}  {'interpolador':<16}{'construção (ms)':>17}{'10^6 pontos (ms)':>18}{'violações':>11}")
+    for n in (50, 200, 10**4, 10**6):
+        x = np.sort(np.concatenate([[0.0, 1.0], rng.uniform(0.0, 1.0, n - 2)]))
+        y = np.tanh(20 * (x - 0.5)) + np.cumsum(rng.uniform(0.0, 1e-3, n))
+        dy = np.gradient(y, x)
+
+        casos = [("pchip (dy)", pchip_interp, (x, y, dy)), ("pchip (monót.)", pchip_interp, (x, y))]
+        if n <= 200:
+            casos.insert(0, ("hermite global", hermite_interp, (x, y, dy)))
+        for nome, construtor, args in casos:
+            tConstrucao, f = medir(construtor, *args)
+            tAvaliacao, valores = medir(f.evaluate, pontos)
+            violacoes = int(np.count_nonzero(np.diff(valores) < -1e-12))
+            print(f"{n:>9}  {nome:<16}{tConstrucao * 1e3:>17.1f}{tAvaliacao * 1e3:>18.1f}{violacoes:>11}")
+
+
+if __name__ == "__main__":
+    main()
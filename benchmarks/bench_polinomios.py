@@ -0,0 +1,66 @@
+"""
+Benchmark de memória e de operações da classe Polinomio.
+
+1. Memória por instância: aloca muitos polinômios pequenos (como os
+   gerados por ajuste_polinomial) e mede o total com tracemalloc.
+2. Vazão das operações aritméticas (+, -, negação, escalar *, derivar).
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_polinomios.py [instancias]
+"""
+import os
+import sys
+import timeit
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import Polinomio
+
+
+def memoria_por_instancia(instancias: int, grau: int) -> float:
+    # Linhas de um array já alocado: a memória medida inclui o armazenamento dos coeficientes
+    coeficientes = list(np.random.default_rng(0).standard_normal((instancias, grau + 1)))
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    polinomios = [Polinomio(c) for c in coeficientes]
+    depois = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del polinomios
+    return (depois - antes) / instancias
+
+
+def vazao(grau: int, numero: int = 20_000) -> dict:
+    rng = np.random.default_rng(1)
+    P = Polinomio(rng.standard_normal(grau + 1).tolist())
+    Q = Polinomio(rng.standard_normal(grau + 1).tolist())
+    operacoes = {
+        "P + Q": lambda: P + Q,
+        "P - Q": lambda: P - Q,
+        "-P": lambda: -P,
+        "2.5 * P": lambda: 2.5 * P,
+        "P.derivar()": lambda: P.derivar(),
+    }
+    return {
+        nome: numero / min(timeit.repeat(op, number=numero, repeat=3))
+        for nome, op in operacoes.items()
+    }
+
+
+def main(instancias: int = 100_000) -> None:
+    print(f"Memória por instância ({instancias} polinômios)")
+    for grau in (1, 3, 10):
+        print(f"  grau {grau:>2}: {memoria_por_instancia(instancias, grau):8.1f} bytes")
+    print()
+
+    for grau in (3, 50):
+        print(f"Vazão das operações (grau {grau}, operações/s)")
+        for nome, ops in vazao(grau).items():
+            print(f"  {nome:<12}{ops:>12,.0f}")
+        print()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
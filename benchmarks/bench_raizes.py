@@ -0,0 +1,62 @@
+"""
+Benchmark de Polinomio.raizes: autovalores da matriz companheira vs iteração de Aberth–Ehrlich.
+
+Para graus de 10 a 1000 (coeficientes normais aleatórios) mede o tempo de cada método, o
+maior erro estimado retornado e a maior distância entre as raízes dos dois métodos, e indica
+a partir de qual grau Aberth é mais rápido (valor sugerido para
+Polinomio.RAIZES_ABERTH_CROSSOVER). No fim compara a precisão dos dois no polinômio de
+Wilkinson com raízes k/20, k = 1..20.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_raizes.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import Polinomio
+
+
+def cronometrar(func, repeticoes: int = 3):
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = func()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def distancia(z1: np.ndarray, z2: np.ndarray) -> float:
+    """Maior distância de uma raiz de z1 à raiz mais próxima de z2."""
+    return float(np.abs(z1[:, None] - z2[None, :]).min(axis=1).max())
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    crossover = None
+
+    print(f"{'grau':>6}{'companheira (ms)':>18}{'aberth (ms)':>14}{'erro est. comp.':>17}{'erro est. aberth':>18}{'distância':>12}")
+    for grau in (10, 20, 50, 100, 200, 300, 500, 1000):
+        P = Polinomio(rng.standard_normal(grau + 1))
+        repeticoes = 3 if grau <= 500 else 1
+        tComp, (zComp, eComp) = cronometrar(lambda: P.raizes('companheira'), repeticoes)
+        tAberth, (zAberth, eAberth) = cronometrar(lambda: P.raizes('aberth'), repeticoes)
+        if crossover is None and tAberth < tComp:
+            crossover = grau
+        print(f"{grau:>6}{tComp * 1e3:>18.1f}{tAberth * 1e3:>14.1f}{eComp.max():>17.1e}{eAberth.max():>18.1e}{distancia(zAberth, zComp):>12.1e}")
+    print(f"Aberth mais rápido a partir do grau ~{crossover} (RAIZES_ABERTH_CROSSOVER atual: {Polinomio.RAIZES_ABERTH_CROSSOVER})\n")
+
+    exatas = np.arange(1, 21) / 20
+    W = Polinomio(np.poly(exatas))
+    print("Wilkinson com raízes k/20 (erro real máximo):")
+    for metodo in ("companheira", "aberth"):
+        z, _ = W.raizes(metodo)
+        print(f"  {metodo:<12}{distancia(exatas.astype(complex), z):.1e}")
+
+
+if __name__ == "__main__":
+    main()
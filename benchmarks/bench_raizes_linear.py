@@ -0,0 +1,64 @@
+"""
+Benchmark da detecção de raízes da interpolação linear por partes.
+
+Para sinais de 10^4 a 10^7 amostras (uma senoide com ruído, com muitos cruzamentos por zero e
+alguns zeros exatos) compara:
+    - o laço em Python segmento a segmento (a implementação anterior de
+      encontrar_segmentos_raiz; só até 10^6 amostras);
+    - encontrar_segmentos_raiz() vetorizado (uma varredura dos sinais);
+    - raizes(), que devolve as raízes exatas de todas as retas na mesma varredura.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_raizes_linear.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import linear_interp
+
+
+def segmentos_laco(X, Y):
+    """Implementação anterior, com um laço em Python."""
+    segments = []
+    for i in range(len(X) - 1):
+        if Y[i] * Y[i + 1] < 0:
+            segments.append((X[i], X[i + 1]))
+        if Y[i] == 0:
+            segments.append((X[i], X[i]))
+    if Y[-1] == 0:
+        segments.append((X[-1], X[-1]))
+    return segments
+
+
+def medir(funcao, *args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'amostras':>10}{'raízes':>10}{'laço (ms)':>12}{'vetorizado (ms)':>17}{'raizes() (ms)':>15}{'aceleração':>12}")
+    for n in (10**4, 10**5, 10**6, 10**7):
+        x = np.linspace(0.0, n / 100, n)
+        y = np.round(np.sin(x) + rng.normal(0.0, 0.05, n), 3)
+        f = linear_interp(x, y)
+
+        tVetorizado, segmentos = medir(f.encontrar_segmentos_raiz)
+        tRaizes, raizes = medir(f.raizes)
+        if n <= 10**6:
+            tLaco, referencia = medir(segmentos_laco, x.tolist(), y.tolist())
+            assert referencia == segmentos
+        else:
+            tLaco = float("nan")
+        print(f"{n:>10}{len(raizes):>10}{tLaco * 1e3:>12.1f}{tVetorizado * 1e3:>17.1f}"
+              f"{tRaizes * 1e3:>15.1f}{tLaco / tRaizes:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark de raizes_reais (isolamento por Sturm + refinamento de Illinois) em muitos
+polinômios característicos.
+
+Gera matrizes simétricas aleatórias (todos os autovalores reais), calcula todas as raízes
+reais do polinômio característico de cada uma e confere contra numpy.linalg.eigvalsh.
+Mostra o tempo total, o tempo por polinômio e quantos polinômios tiveram alguma raiz
+faltando ou errada, com e sem PolinomioCongelado (sequência de Sturm em cache entre duas
+chamadas sobre o mesmo polinômio).
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_raizes_reais.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import Polinomio, raizes_reais, sturm_cache_clear
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    quantidade = 1000
+
+    for ordem in (4, 8, 16):
+        matrizes = rng.standard_normal((quantidade, ordem, ordem))
+        matrizes = matrizes + matrizes.transpose(0, 2, 1)
+        autovalores = np.linalg.eigvalsh(matrizes)
+        polinomios = [Polinomio(np.poly(A)) for A in matrizes]
+
+        sturm_cache_clear()
+        inicio = time.perf_counter()
+        raizes = [raizes_reais(P) for P in polinomios]
+        tempo = time.perf_counter() - inicio
+
+        erradas = sum(
+            len(r) != ordem or not np.allclose(r, esperado, atol=1e-6)
+            for r, esperado in zip(raizes, autovalores)
+        )
+
+        congelados = [P.congelar() for P in polinomios]
+        for P in congelados:
+            raizes_reais(P)
+        inicio = time.perf_counter()
+        for P in congelados:
+            raizes_reais(P)
+        tempoCache = time.perf_counter() - inicio
+
+        print(f"ordem {ordem:>2}: {tempo:.2f} s ({tempo / quantidade * 1e3:.2f} ms/polinômio), "
+              f"{erradas} de {quantidade} com raízes erradas; "
+              f"com a sequência em cache: {tempoCache / quantidade * 1e3:.2f} ms/polinômio")
+
+
+if __name__ == "__main__":
+    main()
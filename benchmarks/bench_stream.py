@@ -0,0 +1,73 @@
+"""
+Benchmark da interpolação linear sobre uma janela deslizante (stream_interp).
+
+Simula uma série temporal que chega ponto a ponto. Para janelas de 10^3 a 10^6 pontos mede:
+    - append(x, y) em O(1) no buffer circular, já com a janela cheia (descartando o mais antigo);
+    - a alternativa de refazer linear_interp a cada amostra sobre a janela copiada, O(n) por
+      ponto (só até 10^5 pontos);
+    - append seguido de uma avaliação escalar no ponto mais recente (uso típico ao vivo);
+    - avaliação vetorizada de 10^6 pontos dentro da janela, que lê o buffer sem cópia.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_stream.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import linear_interp, stream_interp
+
+AMOSTRAS = 10**5
+
+
+def microssegundos_por_amostra(funcao, xs, ys) -> float:
+    inicio = time.perf_counter()
+    funcao(xs, ys)
+    return (time.perf_counter() - inicio) / len(xs) * 1e6
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'janela':>9}{'append (µs)':>13}{'reconstrução (µs)':>19}{'append + f(x) (µs)':>20}{'10^6 pontos (ms)':>18}")
+    for capacidade in (10**3, 10**4, 10**5, 10**6):
+        x = np.cumsum(rng.uniform(0.5, 1.5, capacidade + 2 * AMOSTRAS))
+        y = np.sin(x / 50)
+        p = stream_interp(capacidade, x[:capacidade], y[:capacidade])
+        novosX, novosY = x[capacidade:].tolist(), y[capacidade:].tolist()
+
+        def so_append(xs, ys):
+            for a, b in zip(xs, ys):
+                p.append(a, b)
+
+        def append_e_avalia(xs, ys):
+            for a, b in zip(xs, ys):
+                p.append(a, b)
+                p.evaluate(a - 0.25)
+
+        def reconstrucao(xs, ys):
+            X, Y = x[:capacidade], y[:capacidade]
+            for a, b in zip(xs, ys):
+                X, Y = np.append(X[1:], a), np.append(Y[1:], b)
+                linear_interp(X, Y)
+
+        tAppend = microssegundos_por_amostra(so_append, novosX[:AMOSTRAS], novosY[:AMOSTRAS])
+        tAvalia = microssegundos_por_amostra(append_e_avalia, novosX[AMOSTRAS:], novosY[AMOSTRAS:])
+        if capacidade <= 10**5:
+            amostras = max(100, AMOSTRAS // capacidade * 10)
+            tReconstrucao = microssegundos_por_amostra(reconstrucao, novosX[:amostras], novosY[:amostras])
+        else:
+            tReconstrucao = float("nan")
+
+        pontos = rng.uniform(p.X[0], p.X[-1], 10**6)
+        inicio = time.perf_counter()
+        p.evaluate(pontos)
+        tLote = time.perf_counter() - inicio
+        print(f"{capacidade:>9}{tAppend:>13.2f}{tReconstrucao:>19.1f}{tAvalia:>20.2f}{tLote * 1e3:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
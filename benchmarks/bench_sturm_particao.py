@@ -0,0 +1,61 @@
+"""
+Benchmark das contagens de Sturm em muitos pontos.
+
+Compara, para histogramas de raízes sobre partições de 10 a 10000 subintervalos:
+    - laço: uma chamada de sturm(P, a, b) por subintervalo, avaliando cada termo da sequência
+      em cada ponto com Polinomio.evaluate (o custo anterior, um laço em Python por ponto);
+    - vetorizado: sturm_particao(P, pontos), uma única avaliação da sequência de Sturm
+      (guardada como matriz de coeficientes) em todos os pontos.
+
+Também mede isolar_raizes, cuja bissecção agora avalia todos os pontos médios de um nível de
+uma só vez. O polinômio é congelado para que a sequência de Sturm seja calculada uma vez.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/bench_sturm_particao.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from CB2325NumericaG6 import Polinomio, isolar_raizes, sturm, sturm_particao
+
+
+def variacoes_por_ponto(sequencia, x: float) -> int:
+    """Contagem antiga: um Polinomio.evaluate por termo da sequência."""
+    sinais = [v > 0 for v in (p.evaluate(x) for p in sequencia) if v != 0.0]
+    return sum(s != t for s, t in zip(sinais, sinais[1:]))
+
+
+def main() -> None:
+    raizes = np.linspace(-0.95, 0.95, 30)
+    P = Polinomio(np.poly(raizes)).congelar()
+    sequencia = P.sequencia_sturm()
+
+    print(f"grau {P.degree}, {len(sequencia)} termos na sequência de Sturm")
+    print(f"{'subintervalos':>14}{'laço (ms)':>12}{'vetorizado (ms)':>17}{'aceleração':>12}")
+    for n in (10, 100, 1000, 10000):
+        pontos = np.linspace(-1.0, 1.0, n + 1)
+
+        inicio = time.perf_counter()
+        variacoes = [variacoes_por_ponto(sequencia, x) for x in pontos]
+        laco = np.array(variacoes[:-1]) - np.array(variacoes[1:])
+        tLaco = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        contagens = sturm_particao(P, pontos)
+        tVetorizado = time.perf_counter() - inicio
+
+        assert contagens.tolist() == laco.tolist() and contagens.sum() == sturm(P, -1.0, 1.0)
+        print(f"{n:>14}{tLaco * 1e3:>12.2f}{tVetorizado * 1e3:>17.2f}{tLaco / tVetorizado:>11.1f}x")
+
+    inicio = time.perf_counter()
+    intervalos = isolar_raizes(P, -1.0, 1.0)
+    print(f"\nisolar_raizes: {len(intervalos)} intervalos em {(time.perf_counter() - inicio) * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()